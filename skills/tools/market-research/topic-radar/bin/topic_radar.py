@@ -2,26 +2,57 @@
 from __future__ import annotations
 
 import argparse
+import base64
+import contextvars
+import copy
+import dataclasses
+import functools
+import gzip
 import hashlib
+import heapq
+import http.client
+import io
 import json
 import math
 import os
+import random
 import re
+import sqlite3
+import socket
+import ssl
+import struct
 import subprocess
 import sys
 import tempfile
+import threading
 import time
+import tracemalloc
 import urllib.error
 import urllib.parse
 import urllib.request
+import weakref
 import xml.etree.ElementTree as ET
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass, field
 from datetime import UTC, date, datetime, timedelta
 from email.utils import parsedate_to_datetime
 from html.parser import HTMLParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, TypeVar, cast
+
+try:  # Optional: cross-process locking of rate-limit state and cache fills; POSIX only.
+    import fcntl
+except ImportError:  # pragma: no cover - exercised only on platforms without fcntl.
+    fcntl = None  # type: ignore[assignment]
+
+try:  # Optional: advertise and store zstd when the zstandard package is installed.
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only without the optional dependency.
+    zstandard = None
 
 VERSION = "0.4.0"
 
@@ -106,6 +137,105 @@ SOURCE_WEIGHTS = {
     "news": 12.0,
 }
 USER_AGENT = "agent-kit-topic-radar/0.3 (+https://github.com/sympoies/agent-kit)"
+MAX_REDIRECTS = 5
+STREAM_CHUNK_BYTES = 64 * 1024
+ATOM_NS = "http://www.w3.org/2005/Atom"
+FEED_ENTRY_TAGS = ("item", f"{{{ATOM_NS}}}entry")
+MAX_IDLE_CONNECTIONS_PER_HOST = 4
+DEFAULT_HOST_CONCURRENCY = 4
+CACHE_POLICIES = ("strict", "stale-if-error", "stale-while-revalidate")
+DEFAULT_STALE_GRACE_MINUTES = 360
+DEFAULT_CACHE_MAX_MB = 256
+DEFAULT_CACHE_MAX_AGE_DAYS = 14
+CACHE_STATS_FILE = "stats.json"
+CACHE_LOCK_DIR = "locks"
+CACHE_LOCK_POLL_SECONDS = 0.05
+CACHE_LOCK_MAX_AGE_SECONDS = 3600
+CACHE_BACKENDS = ("file", "sqlite")
+NEAR_DUP_THRESHOLD = 0.7
+NEAR_DUP_MIN_TOKENS = 3
+NEAR_DUP_SUMMARY_WORDS = 24
+NEAR_DUP_BANDS = 8
+NEAR_DUP_ROWS = 2
+NEAR_DUP_MAX_BUCKET = 64
+MINHASH_PRIME = (1 << 61) - 1
+MINHASH_PARAMS = tuple(
+    (rng.randrange(1, MINHASH_PRIME), rng.randrange(MINHASH_PRIME))
+    for rng in [random.Random(0x7A11)]
+    for _ in range(NEAR_DUP_BANDS * NEAR_DUP_ROWS)
+)
+NEWS_PUBLISHER_SUFFIX = re.compile(r"\s+[-\u2013\u2014|]\s+[^-\u2013\u2014|]{1,60}$")
+TITLE_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its new of on or says the this to with".split()
+)
+CACHE_BODY_MAGIC = b"\x00trc1 "
+CACHE_COMPRESS_MIN_BYTES = 512
+ACCEPT_ENCODING = "zstd, gzip, deflate" if zstandard is not None else "gzip, deflate"
+SQLITE_CACHE_FILE = "cache.sqlite3"
+HISTORY_FILE = "history.sqlite3"
+HISTORY_WINDOWED_SOURCES = ("hn", "github", "arxiv", "official", "news")
+HISTORY_SNAPSHOT_SOURCES = ("polymarket", "hf")
+TIMING_LABELS = (("fetchMs", "fetch"), ("networkMs", "network"), ("parseMs", "parse"), ("scoreMs", "score"))
+DELTA_STATE_MAGIC = b"TRDS\x01"
+DELTA_HEADER = struct.Struct("<5sI")
+DELTA_RECORD = struct.Struct("<QfI")
+DELTA_SCORE_GAIN = 5.0
+DELTA_RETENTION_DAYS = 120
+DELTA_COMPACT_MIN_RECORDS = 1024
+CACHE_HIT_STATUSES = ("hit", "revalidated", "stale-served", "coalesced")
+CACHE_LOOKUP_STATUSES = ("hit", "miss", "stale")
+HOST_CONCURRENCY = {
+    "api.github.com": 2,
+    "export.arxiv.org": 1,
+    "api.gdeltproject.org": 1,
+}
+# Published anonymous quotas as (requests, per seconds): GitHub search allows 10 per minute,
+# HN Algolia 10,000 per hour, and GDELT asks for one request every five seconds.
+HOST_RATE_LIMITS = {
+    "api.github.com": (10, 60.0),
+    "hn.algolia.com": (10000, 3600.0),
+    "api.gdeltproject.org": (1, 5.0),
+}
+RATE_LIMIT_FILE = "ratelimit.json"
+RATE_LIMIT_RETRIES = 2
+RATE_LIMIT_BACKOFF_SECONDS = 2.0
+RATE_LIMIT_MAX_WAIT_SECONDS = 20.0
+RATE_LIMIT_JITTER = 0.2
+DEFAULT_SERVE_PORT = 8765
+SERVE_TICK_SECONDS = 15.0
+SERVE_IDLE_SECONDS = 6 * 3600
+SERVE_REFRESH_MINUTES = {
+    "polymarket": 10,
+    "hn": 10,
+    "github": 30,
+    "arxiv": 60,
+    "hf": 30,
+    "official": 30,
+    "news": 15,
+}
+SERVE_QUERY_FLAGS = {
+    "preset": "--preset",
+    "profile": "--profile",
+    "report": "--report",
+    "days": "--days",
+    "limit": "--limit",
+    "sources": "--sources",
+    "topic": "--topic",
+    "from": "--from",
+    "to": "--to",
+    "month": "--month",
+    "format": "--format",
+    "news_provider": "--news-provider",
+}
+NEWS_HEDGE_MS = 1500
+SERVE_QUERY_TOGGLES = {"brief": "--brief", "near_dup": "--near-dup", "raw": "--raw"}
+HOST_MIN_INTERVAL_SECONDS = {
+    "export.arxiv.org": 3.0,
+}
+ARXIV_PAGE_SIZE = 100
+ARXIV_MAX_PAGES_PER_DAY = 5
+ARXIV_SETTLED_DAYS = 2
+ARXIV_SETTLED_TTL_SECONDS = 7 * 86400
 POLYMARKET_MCP_SOURCE_DETAIL = "polymarket-mcp"
 
 OFFICIAL_FEEDS = [
@@ -280,7 +410,7 @@ class TextOnlyParser(HTMLParser):
         self.parts.append(data)
 
 
-@dataclass
+@dataclass(slots=True)
 class RadarItem:
     source: str
     title: str
@@ -295,9 +425,18 @@ class RadarItem:
     raw: dict[str, Any] = field(default_factory=dict)
     also_seen_in: list[str] = field(default_factory=list)
     cross_source_count: int = 1
+    published_ts: float | None = field(default=None, init=False, repr=False, compare=False)
+    scored_for: tuple[Any, ...] | None = field(default=None, init=False, repr=False, compare=False)
 
-    def to_json(self) -> dict[str, Any]:
-        return {
+    def __post_init__(self) -> None:
+        self.published_ts = published_epoch(self.published_at)
+
+    def set_published(self, value: str | None) -> None:
+        self.published_at = value
+        self.published_ts = published_epoch(value)
+
+    def to_json(self, *, include_raw: bool = True) -> dict[str, Any]:
+        payload: dict[str, Any] = {
             "source": self.source,
             "sourceLabel": SOURCE_LABELS.get(self.source, self.source),
             "sourceDetail": self.source_detail,
@@ -311,16 +450,31 @@ class RadarItem:
             "tags": self.tags,
             "alsoSeenIn": self.also_seen_in,
             "crossSourceCount": self.cross_source_count,
-            "raw": self.raw,
         }
+        if include_raw:
+            payload["raw"] = self.raw
+        return payload
+
+
+_frozen_now: datetime | None = None
 
 
 def now_utc() -> datetime:
-    return datetime.now(UTC)
+    return _frozen_now or datetime.now(UTC)
+
+
+def freeze_clock(moment: datetime | None) -> None:
+    """Pin `now_utc` for record/replay runs so windows, request URLs, and recency match exactly."""
+    global _frozen_now
+    _frozen_now = moment
 
 
 def iso_now() -> str:
-    return now_utc().replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    return iso_from_epoch(now_utc().timestamp())
+
+
+def iso_from_epoch(value: float) -> str:
+    return datetime.fromtimestamp(value, UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
 def parse_iso_datetime(value: str | None) -> datetime | None:
@@ -340,6 +494,13 @@ def parse_iso_datetime(value: str | None) -> datetime | None:
             return None
 
 
+@functools.lru_cache(maxsize=65536)
+def published_epoch(value: str | None) -> float | None:
+    """Memoized `parse_iso_datetime` as a UTC epoch; feeds repeat the same timestamp strings."""
+    parsed = parse_iso_datetime(value)
+    return parsed.timestamp() if parsed is not None else None
+
+
 def parse_compact_gdelt_datetime(value: str | None) -> str | None:
     if not value:
         return None
@@ -400,16 +561,24 @@ def item_in_window(
     slack_days: int = 0,
     include_unknown: bool = False,
 ) -> bool:
-    published = parse_iso_datetime(published_at)
-    if published is None:
+    return timestamp_in_window(published_epoch(published_at), args, slack_days=slack_days, include_unknown=include_unknown)
+
+
+def timestamp_in_window(
+    published_ts: float | None,
+    args: argparse.Namespace,
+    *,
+    slack_days: int = 0,
+    include_unknown: bool = False,
+) -> bool:
+    if published_ts is None:
         return include_unknown
-    start = args.window_start_dt - timedelta(days=slack_days)
-    end = args.window_end_dt + timedelta(days=slack_days)
-    return start <= published < end
+    slack = slack_days * 86400
+    return args.window_start_dt.timestamp() - slack <= published_ts < args.window_end_dt.timestamp() + slack
 
 
 def filter_items_to_window(items: list[RadarItem], args: argparse.Namespace) -> list[RadarItem]:
-    return [item for item in items if item_in_window(item.published_at, args)]
+    return [item for item in items if timestamp_in_window(item.published_ts, args)]
 
 
 def window_filter_slack_days(args: argparse.Namespace) -> int:
@@ -449,32 +618,97 @@ def topic_terms(topics: list[str]) -> list[str]:
 
 
 def interest_match_score(item: RadarItem, topics: list[str]) -> float:
-    haystack = " ".join([item.title, item.summary or "", " ".join(item.tags)]).lower()
-    if not haystack:
-        return 0.0
-    score = 0.0
-    for term in topic_terms(topics):
-        if topic_term_matches(haystack, term):
-            score += 1.0 if " " in term else 0.4
-    return min(score, 6.0)
+    return compile_matcher(tuple(topics)).interest_score(item)
 
 
-def topic_term_matches(haystack: str, term: str) -> bool:
+def topic_term_pattern(term: str) -> re.Pattern[str] | None:
+    """Word-boundary pattern for short terms; `None` means a plain substring match."""
     if " " in term:
-        return term in haystack
+        return None
     if term == "ai":
-        return re.search(r"(?<![a-z0-9])a\.?i\.?(?![a-z0-9])", haystack) is not None
+        return re.compile(r"(?<![a-z0-9])a\.?i\.?(?![a-z0-9])")
     if len(term) <= 3:
-        return re.search(rf"(?<![a-z0-9]){re.escape(term)}(?![a-z0-9])", haystack) is not None
-    return term in haystack
+        return re.compile(rf"(?<![a-z0-9]){re.escape(term)}(?![a-z0-9])")
+    return None
+
+
+class TopicMatcher:
+    """Topic terms and brief-cluster keywords compiled into one substring scanner.
+
+    A single lookahead over a trie-shaped alternation reports the longest term starting at each
+    offset; every shorter term that is a prefix of it matches there too, so one `finditer` pass
+    yields the full set of substring hits. Short terms keep their word-boundary regexes.
+    """
+
+    def __init__(self, topics: tuple[str, ...]) -> None:
+        self.terms = [(term, topic_term_pattern(term), 1.0 if " " in term else 0.4) for term in topic_terms(list(topics))]
+        substrings = {term for term, pattern, _ in self.terms if pattern is None}
+        substrings.update(keyword for _, keywords in BRIEF_CLUSTERS for keyword in keywords)
+        self._prefixes = {term: frozenset(other for other in substrings if term.startswith(other)) for term in substrings}
+        self._scanner = re.compile(f"(?=({trie_pattern(substrings)}))") if substrings else None
+
+    def substring_hits(self, haystack: str) -> set[str]:
+        hits: set[str] = set()
+        if self._scanner is None:
+            return hits
+        for match in self._scanner.finditer(haystack):
+            longest = match.group(1)
+            if longest not in hits:
+                hits.update(self._prefixes[longest])
+        return hits
+
+    def interest_score(self, item: RadarItem) -> float:
+        haystack = " ".join([item.title, item.summary or "", " ".join(item.tags)]).lower()
+        if not haystack:
+            return 0.0
+        hits = self.substring_hits(haystack)
+        score = 0.0
+        for term, pattern, weight in self.terms:
+            if (term in hits) if pattern is None else pattern.search(haystack) is not None:
+                score += weight
+        return min(score, 6.0)
+
+    def brief_cluster(self, item: RadarItem) -> str:
+        hits = self.substring_hits(item_search_text(item))
+        for cluster_name, keywords in BRIEF_CLUSTERS:
+            if any(keyword in hits for keyword in keywords):
+                return cluster_name
+        return OTHER_BRIEF_CLUSTER
+
+
+def trie_pattern(terms: Iterable[str]) -> str:
+    """Regex alternation sharing common prefixes; greedy optional tails make it prefer the longest term."""
+    trie: dict[str, Any] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: dict[str, Any]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+
+@functools.lru_cache(maxsize=32)
+def compile_matcher(topics: tuple[str, ...]) -> TopicMatcher:
+    return TopicMatcher(topics)
 
 
 def recency_score(published_at: str | None, days: int, reference_dt: datetime | None = None) -> float:
-    published = parse_iso_datetime(published_at)
-    if published is None:
+    return recency_from_timestamp(published_epoch(published_at), days, reference_dt)
+
+
+def recency_from_timestamp(published_ts: float | None, days: int, reference_dt: datetime | None = None) -> float:
+    if published_ts is None:
         return 0.0
-    reference = reference_dt or now_utc()
-    age_hours = max(0.0, (reference - published).total_seconds() / 3600.0)
+    reference = (reference_dt or now_utc()).timestamp()
+    age_hours = max(0.0, (reference - published_ts) / 3600.0)
     window_hours = max(float(days * 24), 1.0)
     return max(0.0, 8.0 * (1.0 - min(age_hours / window_hours, 1.0)))
 
@@ -488,7 +722,16 @@ def compute_score(
     base = SOURCE_WEIGHTS.get(item.source, 10.0)
     engagement = math.log1p(max(item.engagement, 0.0)) * 2.0
     interest = interest_match_score(item, topics) * 6.0
-    item.score = base + engagement + interest + recency_score(item.published_at, days, reference_dt)
+    item.score = base + engagement + interest + recency_from_timestamp(item.published_ts, days, reference_dt)
+    return item
+
+
+def score_once(item: RadarItem, topics: list[str], days: int, reference_dt: datetime | None = None) -> RadarItem:
+    """`compute_score` unless the item already carries a score for these topics and window."""
+    context = (tuple(topics), days, reference_dt)
+    if reference_dt is None or item.scored_for != context:
+        compute_score(item, topics, days, reference_dt)
+        item.scored_for = context
     return item
 
 
@@ -508,36 +751,1173 @@ def dedupe_and_rank(
     days: int,
     reference_dt: datetime | None = None,
 ) -> list[RadarItem]:
-    merged: dict[str, RadarItem] = {}
-    seen_sources: dict[str, set[str]] = {}
-    for item in items:
-        compute_score(item, topics, days, reference_dt)
-        key = canonical_key(item)
-        if key not in merged:
-            merged[key] = item
-            seen_sources[key] = {item.source}
+    return RadarRanking(items, topics, days, reference_dt).ranked()
+
+
+class RadarRanking:
+    """Score every item once and serve global and per-source rankings as views over one merge.
+
+    Items sharing a `canonical_key` are grouped once. The global view merges each group across
+    sources with a cross-source bonus; a section view merges only that source's members. Merged
+    entries are copies, so the fetched items are never mutated after scoring and repeated views
+    never re-append to `reason`.
+    """
+
+    def __init__(
+        self,
+        items: list[RadarItem],
+        topics: list[str],
+        days: int,
+        reference_dt: datetime | None = None,
+        *,
+        near_dup: bool = False,
+        timings: RunTimings | None = None,
+    ) -> None:
+        groups: dict[str, list[RadarItem]] = {}
+        score_seconds: dict[str, float] = {}
+        for item in items:
+            started = time.perf_counter()
+            score_once(item, topics, days, reference_dt)
+            score_seconds[item.source] = score_seconds.get(item.source, 0.0) + time.perf_counter() - started
+            groups.setdefault(canonical_key(item), []).append(item)
+        if timings is not None:
+            for source, seconds in score_seconds.items():
+                timings.add_phase(source, "score", seconds)
+        self._groups = groups
+        self.near_duplicate_merges = 0
+        if near_dup and len(groups) > 1:
+            keys = list(groups)
+            roots = cluster_near_duplicates([groups[key][0] for key in keys])
+            clustered: dict[int, list[RadarItem]] = {}
+            for key, root in zip(keys, roots):
+                clustered.setdefault(root, []).extend(groups[key])
+            self._groups = {keys[root]: members for root, members in clustered.items()}
+            self.near_duplicate_merges = len(groups) - len(clustered)
+        self._merged: list[RadarItem] | None = None
+        self._sections: dict[str, list[RadarItem]] = {}
+
+    def merged(self) -> list[RadarItem]:
+        if self._merged is None:
+            self._merged = [merge_group(members) for members in self._groups.values()]
+        return self._merged
+
+    def section_merged(self, source: str) -> list[RadarItem]:
+        if source not in self._sections:
+            self._sections[source] = [
+                merge_group(members)
+                for members in (
+                    [member for member in group if member.source == source] for group in self._groups.values()
+                )
+                if members
+            ]
+        return self._sections[source]
+
+    def ranked(self) -> list[RadarItem]:
+        return sorted(self.merged(), key=ranking_score, reverse=True)
+
+    def top(self, limit: int, where: Callable[[RadarItem], bool] | None = None) -> list[RadarItem]:
+        return heapq.nlargest(limit, filter(where, self.merged()) if where else self.merged(), key=ranking_score)
+
+    def section(self, source: str, limit: int, where: Callable[[RadarItem], bool] | None = None) -> list[RadarItem]:
+        merged = self.section_merged(source)
+        return heapq.nlargest(limit, filter(where, merged) if where else merged, key=ranking_score)
+
+
+def near_dup_words(text: str) -> list[str]:
+    return [
+        token
+        for token in re.findall(r"[a-z0-9]+(?:[.+#-][a-z0-9]+)*", text.lower())
+        if len(token) > 1 and token not in TITLE_STOPWORDS
+    ]
+
+
+def word_shingles(words: list[str]) -> frozenset[str]:
+    """Single words plus adjacent word pairs, so word order counts toward similarity."""
+    return frozenset([*words, *(f"{left} {right}" for left, right in zip(words, words[1:]))])
+
+
+def near_dup_shingles(item: RadarItem) -> tuple[frozenset[str], frozenset[str]]:
+    """Title shingles and summary shingles (first `NEAR_DUP_SUMMARY_WORDS` words, `s:`-prefixed)."""
+    title = item.title
+    if item.source == "news":
+        title = NEWS_PUBLISHER_SUFFIX.sub("", title)
+    summary_words = near_dup_words(item.summary or "")[:NEAR_DUP_SUMMARY_WORDS]
+    return word_shingles(near_dup_words(title)), frozenset(f"s:{shingle}" for shingle in word_shingles(summary_words))
+
+
+def minhash_signature(tokens: frozenset[str]) -> tuple[int, ...]:
+    hashes = [zlib.crc32(token.encode("utf-8")) for token in tokens]
+    return tuple(min((a * value + b) % MINHASH_PRIME for value in hashes) for a, b in MINHASH_PARAMS)
+
+
+def jaccard(left: frozenset[str], right: frozenset[str]) -> float:
+    intersection = len(left & right)
+    return intersection / (len(left) + len(right) - intersection)
+
+
+def cluster_near_duplicates(items: list[RadarItem], threshold: float = NEAR_DUP_THRESHOLD) -> list[int]:
+    """Union-find roots (index of the earliest member) for the same story reported by different sources.
+
+    MinHash signatures over title and summary shingles are split into LSH bands, with title-only
+    bands as well so an item without a summary still meets its summarized twins. Only items
+    sharing a band bucket are compared. A candidate pair is confirmed when the exact Jaccard
+    similarity of its titles, or of titles plus summaries, reaches `threshold`.
+    Clusters never join when they already share a source, so two distinct papers or repos from
+    one upstream stay separate. Oversized buckets, which only common-word titles produce, are
+    skipped to keep the pass sub-quadratic.
+    """
+    parent = list(range(len(items)))
+    sources = [{item.source} for item in items]
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    shingles = [near_dup_shingles(item) for item in items]
+    buckets: dict[tuple[str, int, tuple[int, ...]], list[int]] = {}
+    for index, (title, summary) in enumerate(shingles):
+        if len([shingle for shingle in title if " " not in shingle]) < NEAR_DUP_MIN_TOKENS:
+            continue
+        signatures = [("title", minhash_signature(title))]
+        if summary:
+            signatures.append(("full", minhash_signature(title | summary)))
+        for kind, signature in signatures:
+            for band in range(NEAR_DUP_BANDS):
+                rows = signature[band * NEAR_DUP_ROWS : (band + 1) * NEAR_DUP_ROWS]
+                buckets.setdefault((kind, band, rows), []).append(index)
+    checked: set[tuple[int, int]] = set()
+    for members in buckets.values():
+        if len(members) < 2 or len(members) > NEAR_DUP_MAX_BUCKET:
             continue
-        existing = merged[key]
-        seen_sources[key].add(item.source)
-        existing.score = max(existing.score, item.score)
-        existing.engagement += item.engagement
-        if item.source not in existing.also_seen_in and item.source != existing.source:
-            existing.also_seen_in.append(item.source)
-        if not existing.summary and item.summary:
-            existing.summary = item.summary
-        if not existing.published_at and item.published_at:
-            existing.published_at = item.published_at
-    for key, item in merged.items():
-        item.cross_source_count = len(seen_sources[key])
-        if item.cross_source_count > 1:
-            item.score += 10.0 * (item.cross_source_count - 1)
-            item.reason = f"{item.reason}; seen across {item.cross_source_count} sources"
-    return sorted(merged.values(), key=lambda x: x.score, reverse=True)
+        for position, left in enumerate(members):
+            for right in members[position + 1 :]:
+                if (left, right) in checked:
+                    continue
+                checked.add((left, right))
+                root_left, root_right = find(left), find(right)
+                if root_left == root_right or sources[root_left] & sources[root_right]:
+                    continue
+                (left_title, left_summary), (right_title, right_summary) = shingles[left], shingles[right]
+                similarity = jaccard(left_title, right_title)
+                if left_summary and right_summary:
+                    similarity = max(similarity, jaccard(left_title | left_summary, right_title | right_summary))
+                if similarity >= threshold:
+                    root, child = min(root_left, root_right), max(root_left, root_right)
+                    parent[child] = root
+                    sources[root] |= sources[child]
+    return [find(index) for index in range(len(items))]
+
+
+def ranking_score(item: RadarItem) -> float:
+    return item.score
+
+
+def merge_group(members: list[RadarItem]) -> RadarItem:
+    """Copy the first member and fold duplicates into it; a lone member is returned as-is."""
+    if len(members) == 1:
+        return members[0]
+    merged = copy.copy(members[0])
+    merged.also_seen_in = list(merged.also_seen_in)
+    sources = {merged.source}
+    for member in members[1:]:
+        sources.add(member.source)
+        merged.score = max(merged.score, member.score)
+        merged.engagement += member.engagement
+        if member.source not in merged.also_seen_in and member.source != merged.source:
+            merged.also_seen_in.append(member.source)
+        if not merged.summary and member.summary:
+            merged.summary = member.summary
+        if not merged.published_at and member.published_at:
+            merged.set_published(member.published_at)
+    merged.cross_source_count = len(sources)
+    if merged.cross_source_count > 1:
+        merged.score += 10.0 * (merged.cross_source_count - 1)
+        merged.reason = f"{merged.reason}; seen across {merged.cross_source_count} sources"
+    merged.scored_for = None
+    return merged
+
+
+@dataclass
+class HttpResponse:
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    wire_size: int = 0
+    timing: dict[str, Any] = field(default_factory=dict)
+
+
+class TimedHTTPConnection(http.client.HTTPConnection):
+    """`HTTPConnection` whose connect records DNS resolution and TCP connect time separately."""
+
+    phases: dict[str, float]
+    cancel_scope: CancelScope | None = None
+    source_address: tuple[str, int] | None  # set by HTTPConnection.__init__; missing from typeshed
+
+    def connect(self) -> None:
+        self.phases = {}
+        started = time.perf_counter()
+        addresses = socket.getaddrinfo(self.host, self.port, 0, socket.SOCK_STREAM)
+        resolved = time.perf_counter()
+        self.phases["dns"] = resolved - started
+        error: OSError | None = None
+        for *_, address in addresses:
+            try:
+                host, port = address[0], address[1]
+                self.sock = socket.create_connection((str(host), int(port)), self.timeout, self.source_address)
+                break
+            except OSError as exc:
+                error = exc
+        else:
+            raise error or OSError(f"no address for {self.host}")
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.phases["connect"] = time.perf_counter() - resolved
+
+
+class TimedHTTPSConnection(http.client.HTTPSConnection, TimedHTTPConnection):
+    """`HTTPSConnection` that also records the TLS handshake time after the timed TCP connect."""
+
+    def connect(self) -> None:
+        started = time.perf_counter()
+        super().connect()
+        elapsed = time.perf_counter() - started
+        self.phases["tls"] = max(0.0, elapsed - self.phases.get("dns", 0.0) - self.phases.get("connect", 0.0))
+
+
+class CancelScope:
+    """Connections in use by one task, so a losing hedged request can be torn down on its own."""
+
+    def __init__(self) -> None:
+        self.cancelled = False
+        self._lock = threading.Lock()
+        self._connections: set[http.client.HTTPConnection] = set()
+
+    def track(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if self.cancelled:
+                raise urllib.error.URLError("cancelled")
+            self._connections.add(conn)
+
+    def release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._connections.discard(conn)
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            connections = list(self._connections)
+        for conn in connections:
+            if conn.sock is not None:
+                try:
+                    conn.sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+
+CANCEL_SCOPE: contextvars.ContextVar[CancelScope | None] = contextvars.ContextVar("topic_radar_cancel", default=None)
+
+
+class HttpTransport:
+    """Keep-alive HTTP client with one idle-connection pool per scheme/host/port.
+
+    A single transport is shared by every fetcher in a run so repeated queries to the same
+    upstream reuse the TCP and TLS session instead of paying a new handshake per request.
+    Failures are raised as `urllib.error.HTTPError`/`URLError` to match `urlopen`.
+    """
+
+    def __init__(
+        self,
+        max_idle_per_host: int = MAX_IDLE_CONNECTIONS_PER_HOST,
+        host_overrides: dict[str, str] | None = None,
+    ) -> None:
+        self.max_idle_per_host = max_idle_per_host
+        self.host_overrides = host_overrides or {}
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self._ssl_context: ssl.SSLContext | None = None
+        self._connections: weakref.WeakSet[http.client.HTTPConnection] = weakref.WeakSet()
+        self.rate_limiter: RateLimiter | None = None
+        self.stats = {"connections": 0, "reused": 0, "requests": 0, "wireBytes": 0, "bodyBytes": 0}
+
+    def route(self, url: str) -> str:
+        """Rewrite `https://host/path` to `<override>/host/path` for hosts redirected to a replay server."""
+        parsed = urllib.parse.urlsplit(url)
+        base = self.host_overrides.get(parsed.netloc)
+        if base is None:
+            return url
+        query = f"?{parsed.query}" if parsed.query else ""
+        return f"{base.rstrip('/')}/{parsed.netloc}{parsed.path or '/'}{query}"
+
+    def request(self, url: str, headers: dict[str, str], timeout: float) -> HttpResponse:
+        current = self.route(url)
+        request_headers = {"Accept-Encoding": ACCEPT_ENCODING, **headers}
+        started = time.perf_counter()
+        for redirects in range(MAX_REDIRECTS + 1):
+            response = decode_http_response(self._request_once(current, request_headers, timeout))
+            with self._lock:
+                self.stats["wireBytes"] += response.wire_size
+                self.stats["bodyBytes"] += len(response.body)
+            response.timing.update(
+                start=started,
+                total=time.perf_counter() - started,
+                redirects=redirects,
+                wireBytes=response.wire_size,
+                bodyBytes=len(response.body),
+                status=response.status,
+            )
+            location = response.headers.get("location")
+            if response.status in (301, 302, 303, 307, 308) and location:
+                current = urllib.parse.urljoin(current, location)
+                continue
+            self.exchanged(url, headers, response)
+            return self._checked(response)
+        raise urllib.error.URLError(f"too_many_redirects:{url}")
+
+    def exchanged(self, url: str, headers: dict[str, str], response: HttpResponse) -> None:
+        """Hook called with every final response, before error statuses are raised."""
+
+    def run_helper(self, command: list[str], timeout: float) -> subprocess.CompletedProcess[str]:
+        """Run a delegated source helper; archive transports record or replay its output."""
+        return subprocess.run(command, text=True, capture_output=True, timeout=timeout)
+
+    @staticmethod
+    def _checked(response: HttpResponse) -> HttpResponse:
+        if response.status >= 400:
+            raise urllib.error.HTTPError(
+                response.url,
+                response.status,
+                http.client.responses.get(response.status, ""),
+                response.headers,  # type: ignore[arg-type]
+                io.BytesIO(response.body),
+            )
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            pools = list(self._idle.values())
+            self._idle.clear()
+        for pool in pools:
+            for conn in pool:
+                conn.close()
+
+    def abort(self) -> None:
+        """Shut down every open socket so requests blocked on them fail immediately (deadline cancel)."""
+        with self._lock:
+            connections = list(self._connections)
+        for conn in connections:
+            sock = conn.sock
+            if sock is None:
+                continue
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    @contextmanager
+    def stream(
+        self,
+        url: str,
+        headers: dict[str, str],
+        timeout: float,
+        *,
+        timing: dict[str, Any] | None = None,
+    ) -> Iterator[Iterator[bytes]]:
+        """Yield decoded body chunks as they arrive.
+
+        Leaving the block before the body is exhausted closes the connection instead of
+        returning it to the pool. Redirects and error statuses behave like `request`.
+        `timing` is filled with the connection phases and, once the block exits, totals.
+        """
+        current = self.route(url)
+        request_headers = {"Accept-Encoding": ACCEPT_ENCODING, **headers}
+        for _ in range(MAX_REDIRECTS + 1):
+            opened = self._open(current, request_headers, timeout)
+            if opened is None:
+                response = self.request(current, headers, timeout)
+                if timing is not None:
+                    timing.update(response.timing)
+                yield iter((response.body,))
+                return
+            key, conn, resp, hop_timing = opened
+            if timing is not None:
+                timing.update(hop_timing)
+            location = resp.getheader("location")
+            redirect = resp.status in (301, 302, 303, 307, 308) and location
+            encoding = resp.getheader("content-encoding", "").strip().lower()
+            decoder = stream_decoder(encoding)
+            if redirect or resp.status >= 400 or decoder is None:
+                response = self._finish(current, key, conn, resp, hop_timing)
+                if redirect:
+                    current = urllib.parse.urljoin(current, location or "")
+                    continue
+                yield iter((self._checked(decode_http_response(response)).body,))
+                return
+            complete = False
+
+            def chunks() -> Iterator[bytes]:
+                nonlocal complete
+                wire = decoded = 0
+                try:
+                    while chunk := resp.read(STREAM_CHUNK_BYTES):
+                        wire += len(chunk)
+                        data = decoder.decompress(chunk)
+                        decoded += len(data)
+                        if data:
+                            yield data
+                    tail = decoder.flush()
+                    decoded += len(tail)
+                    if tail:
+                        yield tail
+                    complete = True
+                except (zlib.error, ValueError) as exc:
+                    raise urllib.error.URLError(f"content_decoding_error:{encoding}:{exc}") from exc
+                finally:
+                    with self._lock:
+                        self.stats["wireBytes"] += wire
+                        self.stats["bodyBytes"] += decoded
+                    hop_timing.update(wireBytes=wire, bodyBytes=decoded, status=resp.status)
+
+            try:
+                yield chunks()
+            finally:
+                hop_timing["total"] = time.perf_counter() - hop_timing["start"]
+                hop_timing["complete"] = complete
+                if timing is not None:
+                    timing.update(hop_timing)
+                if complete and not resp.will_close:
+                    self._release(key, conn)
+                else:
+                    conn.close()
+            return
+        raise urllib.error.URLError(f"too_many_redirects:{url}")
+
+    def _request_once(self, url: str, headers: dict[str, str], timeout: float) -> HttpResponse:
+        opened = self._open(url, headers, timeout)
+        if opened is None:
+            started = time.perf_counter()
+            response = self._urlopen(url, headers, timeout)
+            response.timing = {"start": started, "total": time.perf_counter() - started, "proxied": True}
+            return response
+        return self._finish(url, *opened)
+
+    def _open(
+        self, url: str, headers: dict[str, str], timeout: float
+    ) -> tuple[tuple[str, str, int], http.client.HTTPConnection, http.client.HTTPResponse, dict[str, Any]] | None:
+        """Send the request on a pooled connection and return it with the unread response and its timing.
+
+        Returns `None` when the URL must go through `urllib` (proxy or non-HTTP scheme).
+        """
+        parsed = urllib.parse.urlsplit(url)
+        scheme = parsed.scheme.lower()
+        host = parsed.hostname or ""
+        if scheme not in ("http", "https") or not host or uses_proxy(scheme, host):
+            return None
+        port = parsed.port or (443 if scheme == "https" else 80)
+        target = parsed.path or "/"
+        if parsed.query:
+            target = f"{target}?{parsed.query}"
+        request_headers = {"Host": parsed.netloc, "Connection": "keep-alive", **headers}
+        key = (scheme, host, port)
+        with self._lock:
+            self.stats["requests"] += 1
+        timing: dict[str, Any] = {"start": time.perf_counter()}
+        for attempt in range(2):
+            conn, reused = self._acquire(key, timeout)
+            scope = CANCEL_SCOPE.get()
+            if scope is not None:
+                try:
+                    scope.track(conn)
+                except urllib.error.URLError:
+                    conn.close()
+                    raise
+                conn.cancel_scope = scope  # type: ignore[attr-defined]
+            try:
+                if conn.sock is None:
+                    conn.connect()
+                sent = time.perf_counter()
+                conn.request("GET", target, headers=request_headers)
+                resp = conn.getresponse()
+                if self.rate_limiter is not None:
+                    self.rate_limiter.observe(host, resp.status, {name.lower(): value for name, value in resp.getheaders()})
+                timing.update(getattr(conn, "phases", {}) if not reused else {}, reused=reused)
+                timing["ttfb"] = time.perf_counter() - sent
+                return key, conn, resp, timing
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except TimeoutError:
+                conn.close()
+                raise
+            except OSError as exc:
+                conn.close()
+                raise urllib.error.URLError(exc) from exc
+            except BaseException:
+                conn.close()
+                raise
+        raise urllib.error.URLError(f"connection_retry_exhausted:{url}")
+
+    def _finish(
+        self,
+        url: str,
+        key: tuple[str, str, int],
+        conn: http.client.HTTPConnection,
+        resp: http.client.HTTPResponse,
+        timing: dict[str, Any],
+    ) -> HttpResponse:
+        try:
+            body = resp.read()
+        except TimeoutError:
+            conn.close()
+            raise
+        except OSError as exc:
+            conn.close()
+            raise urllib.error.URLError(exc) from exc
+        except BaseException:
+            conn.close()
+            raise
+        response_headers = {name.lower(): value for name, value in resp.getheaders()}
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+        timing["total"] = time.perf_counter() - timing["start"]
+        return HttpResponse(url=url, status=resp.status, headers=response_headers, body=body, timing=timing)
+
+    def _acquire(self, key: tuple[str, str, int], timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            pool = self._idle.get(key)
+            conn = pool.pop() if pool else None
+            if conn is not None:
+                self.stats["reused"] += 1
+            else:
+                self.stats["connections"] += 1
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+        scheme, host, port = key
+        if scheme == "https":
+            conn = TimedHTTPSConnection(host, port, timeout=timeout, context=self._context())
+        else:
+            conn = TimedHTTPConnection(host, port, timeout=timeout)
+        with self._lock:
+            self._connections.add(conn)
+        return conn, False
+
+    def _release(self, key: tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        scope = getattr(conn, "cancel_scope", None)
+        if scope is not None:
+            scope.release(conn)
+            conn.cancel_scope = None  # type: ignore[attr-defined]
+        with self._lock:
+            pool = self._idle.setdefault(key, [])
+            if len(pool) < self.max_idle_per_host:
+                pool.append(conn)
+                return
+        conn.close()
+
+    def _context(self) -> ssl.SSLContext:
+        with self._lock:
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            return self._ssl_context
+
+    @staticmethod
+    def _urlopen(url: str, headers: dict[str, str], timeout: float) -> HttpResponse:
+        req = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
+                body = resp.read()
+                response_headers = {name.lower(): value for name, value in resp.headers.items()}
+                return HttpResponse(url=resp.geturl(), status=resp.status, headers=response_headers, body=body)
+        except urllib.error.HTTPError as exc:
+            response_headers = {name.lower(): value for name, value in (exc.headers or {}).items()}
+            try:
+                body = exc.read()
+            except Exception:  # noqa: BLE001 - error bodies are diagnostic only.
+                body = b""
+            return HttpResponse(url=url, status=exc.code, headers=response_headers, body=body)
+
+
+def decode_http_response(response: HttpResponse) -> HttpResponse:
+    """Undo `Content-Encoding` so callers and the cache always see the identity body."""
+    response.wire_size = len(response.body)
+    encoding = response.headers.get("content-encoding", "").strip().lower()
+    if not encoding or encoding == "identity" or not response.body:
+        return response
+    try:
+        response.body = decode_content(response.body, encoding)
+    except (OSError, EOFError, zlib.error, ValueError) as exc:
+        raise urllib.error.URLError(f"content_decoding_error:{encoding}:{exc}") from exc
+    response.headers.pop("content-encoding", None)
+    response.headers.pop("content-length", None)
+    return response
+
+
+def decode_content(body: bytes, encoding: str) -> bytes:
+    for coding in reversed([part.strip() for part in encoding.split(",") if part.strip()]):
+        if coding in ("gzip", "x-gzip"):
+            body = gzip.decompress(body)
+        elif coding == "deflate":
+            try:
+                body = zlib.decompress(body)
+            except zlib.error:
+                body = zlib.decompress(body, -zlib.MAX_WBITS)
+        elif coding == "zstd" and zstandard is not None:
+            body = zstandard.ZstdDecompressor().decompressobj().decompress(body)
+        elif coding != "identity":
+            raise ValueError(f"unsupported content-encoding {coding}")
+    return body
+
+
+class IdentityDecoder:
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+def stream_decoder(encoding: str) -> Any | None:
+    """Incremental decoder for a single `Content-Encoding`; `None` means decode the buffered body."""
+    if not encoding or encoding == "identity":
+        return IdentityDecoder()
+    if encoding in ("gzip", "x-gzip", "deflate"):
+        return zlib.decompressobj(zlib.MAX_WBITS | 32)
+    if encoding == "zstd" and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompressobj()
+    return None
+
+
+def encode_cache_body(body: bytes) -> bytes:
+    """Wrap a cached body as `\\x00trc1 <codec>\\n<payload>`; unmarked files are legacy raw bodies."""
+    if len(body) < CACHE_COMPRESS_MIN_BYTES:
+        return CACHE_BODY_MAGIC + b"identity\n" + body
+    if zstandard is not None:
+        return CACHE_BODY_MAGIC + b"zstd\n" + zstandard.ZstdCompressor(level=6).compress(body)
+    return CACHE_BODY_MAGIC + b"gzip\n" + gzip.compress(body, compresslevel=6, mtime=0)
+
+
+def decode_cache_body(data: bytes) -> bytes:
+    if not data.startswith(CACHE_BODY_MAGIC):
+        return data
+    codec, _, payload = data[len(CACHE_BODY_MAGIC) :].partition(b"\n")
+    return decode_content(payload, codec.decode("ascii"))
+
+
+RECORDING_ARCHIVE = "exchanges.ndjson.gz"
+RECORDING_MANIFEST = "manifest.json"
+RECORDING_FORMAT = 1
+UNRECORDED_HEADERS = frozenset({"connection", "content-length", "keep-alive", "set-cookie", "transfer-encoding"})
+
+
+def helper_key(command: list[str]) -> str:
+    """Archive key for a helper run; the script is named without its checkout path."""
+    return "helper:" + " ".join([Path(command[0]).name, *command[1:]])
+
+
+def read_recording_manifest(directory: Path) -> dict[str, Any]:
+    try:
+        manifest = json.loads((directory / RECORDING_MANIFEST).read_text(encoding="utf-8"))
+        recorded_at = parse_iso_datetime(manifest["recordedAt"])
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        raise UsageError(f"--replay needs a recording made with --record: {directory}: {exc}") from exc
+    if manifest.get("format") != RECORDING_FORMAT or recorded_at is None or not (directory / RECORDING_ARCHIVE).exists():
+        raise UsageError(f"unsupported or incomplete recording: {directory}")
+    manifest["recordedAtDt"] = recorded_at
+    return manifest
+
+
+class ArchiveTransport(HttpTransport):
+    """Base for record/replay transports: whole bodies only, so an archive serves any `--limit`."""
+
+    mode = ""
+
+    def __init__(self, directory: Path, **options: Any) -> None:
+        super().__init__(**options)
+        self.directory = directory
+        self.stats.update(exchanges=0, misses=0)
+
+    @contextmanager
+    def stream(
+        self,
+        url: str,
+        headers: dict[str, str],
+        timeout: float,
+        *,
+        timing: dict[str, Any] | None = None,
+    ) -> Iterator[Iterator[bytes]]:
+        response = self.request(url, headers, timeout)
+        if timing is not None:
+            timing.update(response.timing)
+        yield iter((response.body,))
+
+    def metadata(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "dir": str(self.directory),
+            "recordedAt": iso_from_epoch(now_utc().timestamp()),
+            "exchanges": self.stats["exchanges"],
+            "misses": self.stats["misses"],
+        }
+
+
+class RecordingTransport(ArchiveTransport):
+    """Live transport that appends every upstream exchange to a gzip NDJSON archive for `--replay`.
+
+    Each record holds the requested URL and headers, final status, response headers, the
+    decoded body, and wall timing; transport errors and helper runs are recorded too.
+    """
+
+    mode = "record"
+
+    def __init__(self, directory: Path, argv: list[str], **options: Any) -> None:
+        super().__init__(directory, **options)
+        directory.mkdir(parents=True, exist_ok=True)
+        self.argv = argv
+        self._archive = gzip.open(directory / RECORDING_ARCHIVE, "wt", encoding="utf-8", compresslevel=6)
+        self._archive_lock = threading.Lock()
+
+    def request(self, url: str, headers: dict[str, str], timeout: float) -> HttpResponse:
+        started = time.perf_counter()
+        try:
+            return super().request(url, headers, timeout)
+        except urllib.error.HTTPError:
+            raise
+        except TimeoutError:
+            self._append({"url": url, "error": "timeout", "totalMs": round((time.perf_counter() - started) * 1000, 3)})
+            raise
+        except (urllib.error.URLError, http.client.HTTPException, OSError) as exc:
+            reason = exc.reason if isinstance(exc, urllib.error.URLError) else f"{type(exc).__name__}:{exc}"
+            self._append({"url": url, "error": str(reason), "totalMs": round((time.perf_counter() - started) * 1000, 3)})
+            raise
+
+    def exchanged(self, url: str, headers: dict[str, str], response: HttpResponse) -> None:
+        record: dict[str, Any] = {
+            "url": url,
+            "requestHeaders": headers,
+            "status": response.status,
+            "headers": {name: value for name, value in response.headers.items() if name not in UNRECORDED_HEADERS},
+            "ttfbMs": round(float(response.timing.get("ttfb", 0.0)) * 1000, 3),
+            "totalMs": round(float(response.timing.get("total", 0.0)) * 1000, 3),
+        }
+        try:
+            record["body"] = response.body.decode("utf-8")
+        except UnicodeDecodeError:
+            record["bodyBase64"] = base64.b64encode(response.body).decode("ascii")
+        self._append(record)
+
+    def run_helper(self, command: list[str], timeout: float) -> subprocess.CompletedProcess[str]:
+        started = time.perf_counter()
+        proc = super().run_helper(command, timeout)
+        self._append(
+            {
+                "url": helper_key(command),
+                "status": proc.returncode,
+                "body": proc.stdout,
+                "stderr": proc.stderr,
+                "totalMs": round((time.perf_counter() - started) * 1000, 3),
+            }
+        )
+        return proc
+
+    def _append(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, separators=(",", ":"), ensure_ascii=False)
+        with self._archive_lock:
+            self._archive.write(line)
+            self._archive.write("\n")
+            self.stats["exchanges"] += 1
+
+    def close(self) -> None:
+        super().close()
+        with self._archive_lock:
+            if self._archive.closed:
+                return
+            self._archive.close()
+        manifest = {
+            "format": RECORDING_FORMAT,
+            "version": VERSION,
+            "recordedAt": iso_from_epoch(now_utc().timestamp()),
+            "argv": self.argv,
+            "exchanges": self.stats["exchanges"],
+        }
+        atomic_write_bytes(self.directory / RECORDING_MANIFEST, json.dumps(manifest, indent=2).encode("utf-8"))
+
+
+class ReplayTransport(ArchiveTransport):
+    """Serve a `--record` archive without touching the network.
+
+    Exchanges are matched by URL; repeated requests for one URL are answered in recorded
+    order and then keep returning the last one. `pace=True` sleeps for each recorded wall time.
+    """
+
+    mode = "replay"
+
+    def __init__(self, directory: Path, *, pace: bool = False, **options: Any) -> None:
+        super().__init__(directory, **options)
+        self.pace = pace
+        self._served: dict[str, int] = {}
+        self._exchanges: dict[str, list[dict[str, Any]]] = {}
+        with gzip.open(directory / RECORDING_ARCHIVE, "rt", encoding="utf-8") as archive:
+            for line in archive:
+                if line.strip():
+                    record = json.loads(line)
+                    self._exchanges.setdefault(record["url"], []).append(record)
+
+    def _next(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            records = self._exchanges.get(key)
+            if not records:
+                self.stats["misses"] += 1
+                return None
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+            self.stats["exchanges"] += 1
+            return records[min(index, len(records) - 1)]
+
+    def _wait(self, record: dict[str, Any], timeout: float) -> None:
+        if self.pace:
+            time.sleep(min(float(record.get("totalMs") or 0.0) / 1000, timeout))
+
+    def request(self, url: str, headers: dict[str, str], timeout: float) -> HttpResponse:
+        started = time.perf_counter()
+        record = self._next(url)
+        if record is None:
+            raise urllib.error.URLError(f"replay_miss:{url}")
+        self._wait(record, timeout)
+        if record.get("error") == "timeout":
+            raise TimeoutError(f"replayed timeout:{url}")
+        if "error" in record:
+            raise urllib.error.URLError(record["error"])
+        body = base64.b64decode(record["bodyBase64"]) if "bodyBase64" in record else record["body"].encode("utf-8")
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["wireBytes"] += len(body)
+            self.stats["bodyBytes"] += len(body)
+        response = HttpResponse(url=url, status=int(record["status"]), headers=dict(record["headers"]), body=body)
+        response.wire_size = len(body)
+        response.timing = {
+            "start": started,
+            "total": time.perf_counter() - started,
+            "status": response.status,
+            "wireBytes": len(body),
+            "bodyBytes": len(body),
+            "replayed": True,
+        }
+        return self._checked(response)
+
+    def run_helper(self, command: list[str], timeout: float) -> subprocess.CompletedProcess[str]:
+        record = self._next(helper_key(command))
+        if record is None:
+            return subprocess.CompletedProcess(command, 1, "", f"replay_miss:{helper_key(command)}")
+        self._wait(record, timeout)
+        return subprocess.CompletedProcess(command, int(record["status"]), record.get("body", ""), record.get("stderr", ""))
+
+
+def uses_proxy(scheme: str, host: str) -> bool:
+    proxies = urllib.request.getproxies()
+    return bool(proxies.get(scheme)) and not urllib.request.proxy_bypass(host)
+
+
+DEFAULT_TRANSPORT = HttpTransport()
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class RequestScheduler:
+    """Bound in-flight upstream requests by a global `--jobs` budget and per-host caps.
+
+    Slots are only held around network I/O, so source-level threads and per-topic fan-out
+    can nest without deadlocking; `map` returns results in input order. Hosts with a minimum
+    interval (arXiv asks for 3 seconds) also have request starts spaced out.
+    """
+
+    def __init__(
+        self,
+        jobs: int,
+        host_limits: dict[str, int] | None = None,
+        host_intervals: dict[str, float] | None = None,
+    ) -> None:
+        self.jobs = max(jobs, 1)
+        self.host_limits = HOST_CONCURRENCY if host_limits is None else host_limits
+        self.host_intervals = HOST_MIN_INTERVAL_SECONDS if host_intervals is None else host_intervals
+        self._global = threading.BoundedSemaphore(self.jobs)
+        self._hosts: dict[str, threading.BoundedSemaphore] = {}
+        self._next_start: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        host = url_host(url)
+        with self._host_semaphore(host):
+            # Pace before taking a global slot so a paced host does not idle the `--jobs` budget.
+            self._pace(host)
+            with self._global:
+                yield
+
+    def _pace(self, host: str) -> None:
+        interval = self.host_intervals.get(host)
+        if not interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + interval
+        if start > now:
+            time.sleep(start - now)
+
+    def map(self, func: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        pending = list(items)
+        if self.jobs <= 1 or len(pending) <= 1:
+            return [func(item) for item in pending]
+        with ThreadPoolExecutor(max_workers=min(self.jobs, len(pending))) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, func, item) for item in pending]
+            return [future.result() for future in futures]
+
+    def _host_semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._hosts.get(host)
+            if semaphore is None:
+                limit = min(self.host_limits.get(host, DEFAULT_HOST_CONCURRENCY), self.jobs)
+                semaphore = threading.BoundedSemaphore(max(limit, 1))
+                self._hosts[host] = semaphore
+            return semaphore
+
+
+def url_host(url: str) -> str:
+    return (urllib.parse.urlsplit(url).hostname or "").lower()
+
+
+DEADLINE_SLACK_SECONDS = 0.05
+DEADLINE_GRACE_SECONDS = 0.5
+
+
+class DeadlineExceeded(TimeoutError):
+    def __init__(self) -> None:
+        super().__init__("deadline_exceeded")
+
+
+class RunDeadline:
+    """Wall-clock budget for one gather; request timeouts are capped to what is left of it."""
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+        self.abandoned = False
+
+    def abandon(self) -> None:
+        """Mark work still running at the hard stop as abandoned; it must not write shared state."""
+        self.abandoned = True
+
+    def check_live(self) -> None:
+        """Raise `DeadlineExceeded` in abandoned work before it writes to caches or history."""
+        if self.abandoned:
+            raise DeadlineExceeded()
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= DEADLINE_SLACK_SECONDS
+
+    def cap(self, timeout: float, share: float = 1.0) -> float:
+        """`timeout` limited to `share` of the remaining budget; raises once the budget is spent."""
+        remaining = self.remaining()
+        if remaining <= DEADLINE_SLACK_SECONDS:
+            raise DeadlineExceeded()
+        return min(timeout, remaining * share)
+
+    def converted(self, exc: BaseException) -> BaseException:
+        """Report timeouts and aborted sockets caused by the budget as `DeadlineExceeded`."""
+        if isinstance(exc, (DeadlineExceeded, urllib.error.HTTPError)) or not self.expired:
+            return exc
+        return DeadlineExceeded()
+
+
+class RateLimited(urllib.error.URLError):
+    """Raised instead of sending a request whose host quota would not free up in time."""
+
+    def __init__(self, host: str, retry_after: float) -> None:
+        super().__init__(f"rate_limited:{host}")
+        self.host = host
+        self.retry_after = retry_after
+
+
+def is_throttled(status: int, headers: Any) -> bool:
+    if status == 429:
+        return True
+    exhausted = str(headers.get("x-ratelimit-remaining", "")).strip() == "0"
+    return status in (403, 503) and (exhausted or headers.get("retry-after") is not None)
+
+
+def parse_retry_after(value: str | None, now: float) -> float | None:
+    """`Retry-After` as an absolute epoch; accepts delta seconds or an HTTP date."""
+    if not value:
+        return None
+    text = value.strip()
+    if text.isdigit():
+        return now + int(text)
+    moment = parse_iso_datetime(text)
+    return moment.timestamp() if moment is not None else None
+
+
+class RateLimiter:
+    """Per-host request quota shared by every radar process through `ratelimit.json` in the cache dir.
+
+    Hosts in `HOST_RATE_LIMITS` draw from a token bucket sized to the published anonymous quota.
+    `X-RateLimit-Remaining`/`-Reset` clamp the bucket, and throttled responses (429, or 403/503
+    with an exhausted quota or `Retry-After`) block the host until the advertised time or an
+    exponential backoff. Callers wait for quota before taking a scheduler slot, so requests to
+    a throttled host sleep without holding up other hosts. The state file is read and rewritten
+    under an exclusive `fcntl` lock; without `fcntl` the state stays in process.
+    """
+
+    def __init__(self, path: Path | None, buckets: dict[str, tuple[int, float]] | None = None) -> None:
+        self.path = path if fcntl is not None else None
+        self.buckets = HOST_RATE_LIMITS if buckets is None else buckets
+        self._lock = threading.Lock()
+        self._memory: dict[str, dict[str, Any]] = {}
+        self._throttled_hosts: set[str] = set()
+        self.report: dict[str, dict[str, Any]] = {}
+        if self.path is not None and self.path.exists():
+            # Hosts other processes saw throttled still gate requests here, bucket or not.
+            now = time.time()
+            with self._state() as state:
+                self._throttled_hosts.update(
+                    host for host, entry in state.items() if float(entry.get("blockedUntil") or 0) > now
+                )
+
+    @contextmanager
+    def _state(self) -> Iterator[dict[str, dict[str, Any]]]:
+        with self._lock:
+            if self.path is None:
+                yield self._memory
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a+", encoding="utf-8") as handle:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                handle.seek(0)
+                try:
+                    state = json.loads(handle.read() or "{}")
+                except json.JSONDecodeError:
+                    state = {}
+                if not isinstance(state, dict):
+                    state = {}
+                yield state
+                handle.seek(0)
+                handle.truncate()
+                handle.write(json.dumps(state, sort_keys=True))
+
+    def _count(self, host: str, name: str, amount: float = 1) -> None:
+        with self._lock:
+            entry = self.report.setdefault(host, {})
+            entry[name] = round(entry.get(name, 0) + amount, 3)
+
+    def _take(self, host: str, entry: dict[str, Any], now: float) -> float:
+        """Consume one token and return 0, or return how long until one is available."""
+        blocked = float(entry.get("blockedUntil") or 0) - now
+        if blocked > 0:
+            return blocked
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            return 0.0
+        capacity, period = bucket
+        rate = capacity / period
+        elapsed = max(0.0, now - float(entry.get("updatedAt") or now))
+        tokens = min(float(capacity), float(entry.get("tokens", capacity)) + elapsed * rate)
+        entry["updatedAt"] = now
+        if tokens >= 1:
+            entry["tokens"] = tokens - 1
+            return 0.0
+        entry["tokens"] = tokens
+        return (1 - tokens) / rate
+
+    def acquire(self, host: str, deadline: RunDeadline | None = None) -> None:
+        """Block until `host` has quota; raise `RateLimited` if that is past the wait cap or deadline."""
+        if host not in self.buckets and host not in self._throttled_hosts:
+            return
+        waited = 0.0
+        while True:
+            with self._state() as state:
+                wait = self._take(host, state.setdefault(host, {}), time.time())
+            if wait <= 0:
+                return
+            budget = RATE_LIMIT_MAX_WAIT_SECONDS - waited
+            if deadline is not None:
+                budget = min(budget, deadline.remaining() - DEADLINE_SLACK_SECONDS)
+            if wait > budget:
+                self._count(host, "rejected")
+                raise RateLimited(host, wait)
+            # Jitter so processes sharing the state file do not all retry on the same tick.
+            pause = min(wait * random.uniform(1.0, 1.0 + RATE_LIMIT_JITTER), budget)
+            self._count(host, "waits")
+            self._count(host, "waitedMs", pause * 1000)
+            time.sleep(pause)
+            waited += pause
+
+    def observe(self, host: str, status: int, headers: dict[str, str]) -> None:
+        remaining_header = headers.get("x-ratelimit-remaining")
+        throttled = is_throttled(status, headers)
+        if remaining_header is None and not throttled:
+            return
+        now = time.time()
+        remaining = int(as_float(remaining_header)) if remaining_header is not None else None
+        reset = as_float(headers.get("x-ratelimit-reset")) or None
+        if reset is not None and reset < 1e9:
+            reset += now  # Some APIs send seconds until reset instead of an epoch.
+        retry_at = parse_retry_after(headers.get("retry-after"), now)
+        with self._state() as state:
+            entry = state.setdefault(host, {})
+            if remaining is not None:
+                entry["remaining"] = remaining
+                entry["tokens"] = min(float(entry.get("tokens", remaining)), float(remaining))
+                entry.setdefault("updatedAt", now)
+            if reset is not None:
+                entry["reset"] = reset
+            blocked_until = float(entry.get("blockedUntil") or 0)
+            if remaining == 0 and reset is not None:
+                blocked_until = max(blocked_until, reset)
+            if throttled:
+                strikes = int(entry.get("strikes") or 0) + 1
+                entry["strikes"] = strikes
+                backoff = now + RATE_LIMIT_BACKOFF_SECONDS * 2 ** (strikes - 1)
+                blocked_until = max(blocked_until, retry_at or (reset if remaining == 0 and reset else None) or backoff)
+            elif status < 400:
+                entry.pop("strikes", None)
+            if blocked_until > now:
+                entry["blockedUntil"] = blocked_until
+        with self._lock:
+            if throttled:
+                self._throttled_hosts.add(host)
+            if remaining is not None:
+                self.report.setdefault(host, {})["remaining"] = remaining
+        if throttled:
+            self._count(host, "throttled")
+
+    def note_retry(self, host: str) -> None:
+        self._count(host, "retries")
+
+    def metadata(self) -> dict[str, Any]:
+        with self._lock:
+            return {host: dict(entry) for host, entry in sorted(self.report.items())}
+
+
+def budget_timeout(args: argparse.Namespace, share: float = 1.0) -> float:
+    """Per-request timeout for the next step of a sequential chain: `share` of the remaining run budget."""
+    deadline = args.run_deadline
+    return args.timeout if deadline is None else deadline.cap(args.timeout, share)
 
 
 def http_get(
     url: str,
-    timeout: int,
+    timeout: float,
     headers: dict[str, str] | None = None,
     *,
     cache_ttl_seconds: int = 0,
@@ -545,51 +1925,656 @@ def http_get(
     cache_events: list[dict[str, Any]] | None = None,
     refresh: bool = False,
     cache_context: str | None = None,
+    transport: HttpTransport | None = None,
+    scheduler: RequestScheduler | None = None,
+    cache_policy: str = "strict",
+    stale_grace_seconds: int = 0,
+    background: BackgroundRefresher | None = None,
+    cache_store: CacheStore | None = None,
+    cache_source: str | None = None,
+    timing: dict[str, Any] | None = None,
+    deadline: RunDeadline | None = None,
 ) -> bytes:
     request_headers = {"User-Agent": USER_AGENT}
     if headers:
         request_headers.update(headers)
-    cache_path: Path | None = None
-    if cache_ttl_seconds > 0 and cache_dir is not None:
-        cache_path = cache_dir / f"{cache_key(url, request_headers, cache_context)}.body"
-        if cache_path.exists() and not refresh:
-            age_seconds = max(0.0, time.time() - cache_path.stat().st_mtime)
+    store = cache_store if cache_store is not None else FileCacheStore(cache_dir) if cache_dir is not None else None
+    key: str | None = None
+    cached: CachedBody | None = None
+    validators: dict[str, str] = {}
+
+    def fetch(
+        events: list[dict[str, Any]] | None,
+        fetch_timing: dict[str, Any] | None = timing,
+        fetch_deadline: RunDeadline | None = deadline,
+    ) -> bytes:
+        body, coalesced = coalesced_fetch(
+            key or cache_key(url, request_headers, cache_context),
+            lambda: fetch_and_store(
+                url,
+                request_headers,
+                timeout,
+                store=store if key is not None else None,
+                key=key,
+                cached=cached,
+                validators=validators,
+                cache_events=events,
+                transport=transport,
+                scheduler=scheduler,
+                source=cache_source,
+                timing=fetch_timing,
+                deadline=fetch_deadline,
+            ),
+            timeout=fetch_deadline.cap(timeout) if fetch_deadline is not None else timeout,
+            store=store if key is not None else None,
+            lock_dir=cache_dir / CACHE_LOCK_DIR if key is not None and cache_dir is not None else None,
+            ttl_seconds=cache_ttl_seconds,
+        )
+        if coalesced:
+            record_cache_event(events, "coalesced", url)
+            if fetch_timing is not None:
+                fetch_timing.update(cache="coalesced", bodyBytes=len(body))
+        return body
+
+    if cache_ttl_seconds > 0 and store is not None:
+        key = cache_key(url, request_headers, cache_context)
+        cached = None if refresh else store.load(key)
+        if cached is not None:
+            age_seconds = max(0.0, time.time() - cached.fetched_at)
             if age_seconds <= cache_ttl_seconds:
                 record_cache_event(cache_events, "hit", url, age_seconds)
-                return cache_path.read_bytes()
+                store.touch(key)
+                if timing is not None:
+                    timing.update(cache="hit", bodyBytes=len(cached.body))
+                return cached.body
             record_cache_event(cache_events, "stale", url, age_seconds)
+            validators = store.validators(key)
+            if cache_policy != "strict" and age_seconds <= cache_ttl_seconds + stale_grace_seconds:
+                stale_body = cached.body
+                if cache_policy == "stale-while-revalidate" and background is not None:
+                    store.touch(key)
+                    background.submit(key, lambda: fetch(None, None, None))
+                    record_cache_event(cache_events, "stale-served", url, age_seconds, reason="revalidating")
+                    if timing is not None:
+                        timing.update(cache="stale-served", bodyBytes=len(stale_body))
+                    return stale_body
+                try:
+                    return fetch(cache_events)
+                except STALE_FALLBACK_ERRORS as exc:
+                    if isinstance(exc, urllib.error.HTTPError) and exc.code < 500 and exc.code != 429:
+                        raise
+                    record_cache_event(cache_events, "stale-served", url, age_seconds, reason=stale_error_reason(exc))
+                    store.touch(key)
+                    if timing is not None:
+                        timing["cache"] = "stale-served"
+                    return stale_body
         else:
             record_cache_event(cache_events, "miss", url)
-    req = urllib.request.Request(url, headers=request_headers)
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        body = resp.read()
-    if cache_path is not None:
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        with tempfile.NamedTemporaryFile("wb", dir=str(cache_path.parent), delete=False) as tmp:
-            tmp.write(body)
-            tmp_path = Path(tmp.name)
-        tmp_path.replace(cache_path)
+    return fetch(cache_events)
+
+
+STALE_FALLBACK_ERRORS = (urllib.error.URLError, http.client.HTTPException, OSError)
+
+
+def stale_error_reason(exc: BaseException) -> str:
+    if isinstance(exc, urllib.error.HTTPError):
+        return f"http_error:{exc.code}"
+    if isinstance(exc, urllib.error.URLError):
+        return f"url_error:{exc.reason}"
+    return f"{type(exc).__name__}:{exc}"
+
+
+class RunTimings:
+    """Per-source and per-request timings for one run, optionally kept as a Chrome trace.
+
+    Phases (`fetch`, `parse`, `score`) accumulate per source; each upstream request or cache
+    lookup is one record with its connection phases, bytes, and cache status. With `trace`
+    enabled every span is also kept as a complete (`"ph": "X"`) trace event, which Chrome's
+    trace viewer, Perfetto, and speedscope all load.
+    """
+
+    def __init__(self, *, trace: bool = False) -> None:
+        self.origin = time.perf_counter()
+        self.trace = trace
+        self.phases: dict[str, dict[str, float]] = {}
+        self.requests: list[dict[str, Any]] = []
+        self.events: list[dict[str, Any]] = []
+        self._threads: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, *, source: str | None = None, phase: str | None = None) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, started, time.perf_counter(), source=source, phase=phase)
+
+    def add(
+        self,
+        name: str,
+        started: float,
+        ended: float,
+        *,
+        source: str | None = None,
+        phase: str | None = None,
+        category: str = "radar",
+        detail: dict[str, Any] | None = None,
+    ) -> None:
+        if phase is not None:
+            self.add_phase(source, phase, ended - started)
+        with self._lock:
+            if self.trace:
+                self._event(name, category, started, ended, {"source": source, **(detail or {})} if source else detail)
+
+    def add_phase(self, source: str | None, phase: str, seconds: float) -> None:
+        with self._lock:
+            bucket = self.phases.setdefault(source or "run", {})
+            bucket[phase] = bucket.get(phase, 0.0) + seconds
+
+    def record_request(self, source: str | None, url: str, cache: str, timing: dict[str, Any]) -> None:
+        parsed = urllib.parse.urlsplit(url)
+        started = float(timing.get("start", time.perf_counter()))
+        total = float(timing.get("total", 0.0))
+        record: dict[str, Any] = {
+            "source": source,
+            "host": parsed.netloc,
+            "path": parsed.path[:120],
+            "cache": cache,
+            "startMs": round((started - self.origin) * 1000, 1),
+            "totalMs": round(total * 1000, 1),
+        }
+        for phase in ("dns", "connect", "tls", "ttfb"):
+            if phase in timing:
+                record[f"{phase}Ms"] = round(timing[phase] * 1000, 1)
+        for name in ("status", "wireBytes", "bodyBytes", "reused", "redirects", "proxied", "complete"):
+            if name in timing:
+                record[name] = timing[name]
+        with self._lock:
+            self.requests.append(record)
+            if not self.trace:
+                return
+            label = f"{cache} {parsed.netloc}{parsed.path[:60]}"
+            self._event(label, "http", started, started + total, record)
+            cursor = started
+            for phase in ("dns", "connect", "tls", "ttfb"):
+                if timing.get(phase):
+                    self._event(phase, "http", cursor, cursor + timing[phase], None)
+                    cursor += timing[phase]
+
+    def _event(self, name: str, category: str, started: float, ended: float, detail: dict[str, Any] | None) -> None:
+        thread = threading.current_thread()
+        self._threads.setdefault(thread.ident or 0, thread.name)
+        event: dict[str, Any] = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((started - self.origin) * 1_000_000, 1),
+            "dur": round(max(0.0, ended - started) * 1_000_000, 1),
+            "pid": os.getpid(),
+            "tid": thread.ident or 0,
+        }
+        if detail:
+            event["args"] = detail
+        self.events.append(event)
+
+    def metadata(self) -> dict[str, Any]:
+        with self._lock:
+            requests = sorted(self.requests, key=lambda record: record["totalMs"], reverse=True)
+            phases = {source: dict(bucket) for source, bucket in self.phases.items()}
+        sources: dict[str, dict[str, Any]] = {}
+        for source, bucket in phases.items():
+            if source == "run":
+                continue
+            sources[source] = {f"{phase}Ms": round(seconds * 1000, 1) for phase, seconds in sorted(bucket.items())}
+        for record in requests:
+            entry = sources.setdefault(record["source"] or "unknown", {})
+            entry["requests"] = entry.get("requests", 0) + 1
+            entry["networkMs"] = round(entry.get("networkMs", 0.0) + record["totalMs"], 1)
+            for name in ("wireBytes", "bodyBytes"):
+                entry[name] = entry.get(name, 0) + int(record.get(name) or 0)
+            cache = entry.setdefault("cache", {})
+            cache[record["cache"]] = cache.get(record["cache"], 0) + 1
+        return {
+            "totalMs": round((time.perf_counter() - self.origin) * 1000, 1),
+            "phases": {phase: round(seconds * 1000, 1) for phase, seconds in sorted(phases.get("run", {}).items())},
+            "sources": dict(sorted(sources.items())),
+            "requests": requests,
+        }
+
+    def write_trace(self, path: Path) -> None:
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self._threads)
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+            for tid, name in threads.items()
+        ]
+        payload = {"traceEvents": metadata + events, "displayTimeUnit": "ms", "otherData": {"version": VERSION}}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+TIMING_SCOPE: contextvars.ContextVar[tuple[RunTimings, str] | None] = contextvars.ContextVar(
+    "topic_radar_timing_scope", default=None
+)
+
+
+@contextmanager
+def timing_scope(timings: RunTimings, source: str) -> Iterator[None]:
+    """Attribute requests and parse time in this context (and scheduler tasks it spawns) to `source`."""
+    token = TIMING_SCOPE.set((timings, source))
+    try:
+        with timings.span(f"fetch {source}", source=source, phase="fetch"):
+            yield
+    finally:
+        TIMING_SCOPE.reset(token)
+
+
+def scope_source() -> str | None:
+    scope = TIMING_SCOPE.get()
+    return scope[1] if scope is not None else None
+
+
+@contextmanager
+def timed_parse(name: str) -> Iterator[None]:
+    scope = TIMING_SCOPE.get()
+    if scope is None:
+        yield
+        return
+    timings, source = scope
+    with timings.span(f"parse {name}", source=source, phase="parse"):
+        yield
+
+
+class BackgroundRefresher:
+    """Run stale-while-revalidate refreshes off the request path, one per cache entry."""
+
+    def __init__(self, max_workers: int = 2) -> None:
+        self._executor: ThreadPoolExecutor | None = None
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._pending: dict[str, Any] = {}
+
+    def submit(self, key: str, task: Callable[[], Any]) -> None:
+        with self._lock:
+            if key in self._pending:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="radar-refresh")
+            future = self._executor.submit(task)
+            self._pending[key] = future
+        future.add_done_callback(lambda _: self._forget(key))
+
+    def drain(self) -> None:
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            self._pending.pop(key, None)
+
+
+class SingleFlight:
+    """Share one in-flight fetch per cache key between the threads of a process.
+
+    The first caller for a key runs the fetch; callers arriving while it is in flight wait on
+    its future and get the same body (or the same error) instead of sending a duplicate request.
+    With `retain`, successful results stay shared for the object's lifetime (one `batch` run),
+    so later callers reuse them as well; failures are dropped so a later caller can retry.
+    """
+
+    def __init__(self, *, retain: bool = False) -> None:
+        self.retain = retain
+        self.shared = 0
+        self._lock = threading.Lock()
+        self._calls: dict[str, Future[Any]] = {}
+
+    def run(self, key: str, task: Callable[[], T]) -> tuple[T, bool]:
+        """Return `(result, shared)`; `shared` is true when another caller's fetch was reused."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result(), True
+        try:
+            result = task()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            if not self.retain or future.exception() is not None:
+                with self._lock:
+                    self._calls.pop(key, None)
+
+
+IN_FLIGHT = SingleFlight()
+
+
+@contextmanager
+def cache_fill_lock(path: Path, timeout: float) -> Iterator[bool]:
+    """Hold an exclusive lock on `path` while filling one cache entry; yield whether we had to wait.
+
+    A process that finds the lock taken polls until the holder finishes (or `timeout` passes)
+    and then yields `True`, so it can re-read the entry the holder just wrote. Without `fcntl`,
+    or when the lock file cannot be opened, nothing is locked and `False` is yielded.
+    """
+    if fcntl is None:
+        yield False
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(path, "a+b")
+    except OSError:
+        yield False
+        return
+    with handle:
+        waited = False
+        give_up = time.monotonic() + max(0.0, timeout)
+        while True:
+            try:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                # Mark the lock as in use so cache maintenance does not prune it.
+                with suppress(OSError):
+                    os.utime(path)
+                break
+            except BlockingIOError:
+                waited = True
+                if time.monotonic() >= give_up:
+                    break
+                time.sleep(CACHE_LOCK_POLL_SECONDS)
+        yield waited
+
+
+def coalesced_fetch(
+    key: str,
+    fetch: Callable[[], bytes],
+    *,
+    timeout: float,
+    store: CacheStore | None = None,
+    lock_dir: Path | None = None,
+    ttl_seconds: int = 0,
+) -> tuple[bytes, bool]:
+    """Fetch through `IN_FLIGHT`, and through a per-key lock file when a cache dir is shared.
+
+    Returns `(body, coalesced)`. A follower in another process waits up to `timeout` for the
+    leader's lock, then serves the entry the leader stored if it is fresh; otherwise it fetches
+    itself. In-process followers need no timeout: the leader's fetch is already bounded.
+    """
+
+    def across_processes() -> tuple[bytes, bool]:
+        if store is None or lock_dir is None:
+            return fetch(), False
+        with cache_fill_lock(lock_dir / f"{key}.lock", timeout) as waited:
+            if waited:
+                cached = store.load(key)
+                if cached is not None and time.time() - cached.fetched_at <= ttl_seconds:
+                    store.touch(key)
+                    return cached.body, True
+            return fetch(), False
+
+    (body, stored_elsewhere), shared = IN_FLIGHT.run(key, across_processes)
+    return body, shared or stored_elsewhere
+
+
+def prune_cache_locks(cache_dir: Path, max_age_seconds: float = CACHE_LOCK_MAX_AGE_SECONDS) -> None:
+    """Remove lock files untouched for `max_age_seconds`, skipping any another process holds."""
+    if fcntl is None:
+        return
+    cutoff = time.time() - max_age_seconds
+    for path in (cache_dir / CACHE_LOCK_DIR).glob("*.lock"):
+        try:
+            if path.stat().st_mtime >= cutoff:
+                continue
+            with open(path, "a+b") as handle:
+                try:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    continue
+                path.unlink()
+        except OSError:
+            continue
+
+
+def fetch_and_store(
+    url: str,
+    request_headers: dict[str, str],
+    timeout: float,
+    *,
+    store: CacheStore | None,
+    key: str | None,
+    cached: CachedBody | None,
+    validators: dict[str, str],
+    cache_events: list[dict[str, Any]] | None,
+    transport: HttpTransport | None,
+    scheduler: RequestScheduler | None,
+    source: str | None = None,
+    timing: dict[str, Any] | None = None,
+    deadline: RunDeadline | None = None,
+) -> bytes:
+    send_headers = {**request_headers, **conditional_headers(validators)}
+    transport = transport or DEFAULT_TRANSPORT
+    limiter = transport.rate_limiter
+    host = url_host(transport.route(url))
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        try:
+            if limiter is not None:
+                # Quota waits happen before taking a slot so a throttled host does not block others.
+                limiter.acquire(host, deadline)
+            if scheduler is None:
+                response = transport.request(url, send_headers, deadline.cap(timeout) if deadline else timeout)
+            else:
+                with scheduler.slot(url):
+                    # Capped after the slot wait so queued requests only get what is left of the budget.
+                    response = transport.request(url, send_headers, deadline.cap(timeout) if deadline else timeout)
+            break
+        except urllib.error.HTTPError as exc:
+            if limiter is None or attempt == RATE_LIMIT_RETRIES or not is_throttled(exc.code, exc.headers or {}):
+                raise
+            limiter.note_retry(host)
+        except (OSError, http.client.HTTPException) as exc:
+            if deadline is None:
+                raise
+            converted = deadline.converted(exc)
+            if converted is exc:
+                raise
+            raise converted from exc
+    if timing is not None:
+        timing.update(response.timing, cache="off" if store is None or key is None else "miss")
+    if deadline is not None and store is not None:
+        deadline.check_live()
+    if store is not None and key is not None and cached is not None and response.status == 304 and validators:
+        store.mark_revalidated(key, url, cache_validators(response.headers, fallback=validators))
+        record_cache_event(cache_events, "revalidated", url)
+        if timing is not None:
+            timing["cache"] = "revalidated"
+        return cached.body
+    body = response.body
+    if store is not None and key is not None:
+        store.store(key, url, body, response.headers, source=source)
         record_cache_event(cache_events, "write", url)
     return body
 
 
-def get_json(url: str, timeout: int, errors: list[dict[str, Any]], source: str, args: argparse.Namespace) -> Any | None:
-    body = ""
-    try:
-        body = http_get(
+def cache_validators(response_headers: dict[str, str], *, fallback: dict[str, str] | None = None) -> dict[str, str]:
+    previous = fallback or {}
+    validators = {
+        "etag": response_headers.get("etag") or previous.get("etag"),
+        "lastModified": response_headers.get("last-modified") or previous.get("lastModified"),
+    }
+    return {name: value for name, value in validators.items() if value}
+
+
+def conditional_headers(validators: dict[str, str]) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("lastModified"):
+        headers["If-Modified-Since"] = validators["lastModified"]
+    return headers
+
+
+def atomic_write_bytes(path: Path, data: bytes, *, mode: int | None = None) -> None:
+    """Write via a temp file and rename. Temp files are 0600; `mode` (less the umask) widens that."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("wb", dir=str(path.parent), delete=False) as tmp:
+        tmp.write(data)
+        tmp_path = Path(tmp.name)
+    if mode is not None:
+        tmp_path.chmod(mode & ~current_umask())
+    tmp_path.replace(path)
+
+
+def current_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def fetch_body(
+    url: str,
+    args: argparse.Namespace,
+    timeout: float | None = None,
+    *,
+    source: str | None = None,
+    window_scoped: bool = True,
+    cache_ttl_seconds: int | None = None,
+) -> bytes:
+    """Fetch through the run's cache and transport.
+
+    `window_scoped=False` drops the window from the cache key for URLs that already pin their
+    own date range, so overlapping windows share entries; `cache_ttl_seconds` overrides the TTL.
+    Under a `batch` run's `response_memo`, each URL is fetched once for all reports.
+    """
+    source = source or scope_source()
+    timing: dict[str, Any] = {"start": time.perf_counter()}
+
+    def get() -> bytes:
+        return http_get(
             url,
-            timeout,
-            cache_ttl_seconds=args.cache_ttl_seconds,
+            args.timeout if timeout is None else timeout,
+            cache_ttl_seconds=args.cache_ttl_seconds if cache_ttl_seconds is None else cache_ttl_seconds,
             cache_dir=args.cache_dir,
             cache_events=args.cache_events,
             refresh=args.refresh,
-            cache_context=args.cache_context,
-        ).decode("utf-8")
-        return json.loads(body)
+            cache_context=args.cache_context if window_scoped else None,
+            transport=args.transport,
+            scheduler=args.scheduler,
+            cache_policy=args.cache_policy,
+            stale_grace_seconds=args.cache_stale_grace_seconds,
+            background=args.background,
+            cache_store=args.cache_store,
+            cache_source=source,
+            timing=timing,
+            deadline=args.run_deadline,
+        )
+
+    try:
+        if args.response_memo is None:
+            return get()
+        body, shared = args.response_memo.run(url, get)
+        if shared:
+            record_cache_event(args.cache_events, "coalesced", url)
+            timing.update(cache="coalesced", bodyBytes=len(body))
+        return body
+    finally:
+        if args.timings is not None:
+            timing.setdefault("total", time.perf_counter() - timing["start"])
+            args.timings.record_request(source, url, str(timing.get("cache", "error")), timing)
+
+
+@contextmanager
+def open_body_stream(
+    url: str,
+    args: argparse.Namespace,
+    *,
+    source: str | None = None,
+    timeout: float | None = None,
+    **cache_options: Any,
+) -> Iterator[Iterator[bytes]]:
+    """Stream a response body in chunks for incremental parsing.
+
+    With the cache enabled (or a batch response memo) the full body is fetched through
+    `fetch_body` so it can be stored; otherwise chunks come straight off the socket and an
+    early exit stops the download.
+    """
+    timeout = args.timeout if timeout is None else timeout
+    if args.cache_ttl_seconds > 0 or args.transport is None or args.response_memo is not None:
+        body = fetch_body(url, args, timeout, source=source, **cache_options)
+        yield (body[offset : offset + STREAM_CHUNK_BYTES] for offset in range(0, len(body), STREAM_CHUNK_BYTES))
+        return
+    timing: dict[str, Any] = {"start": time.perf_counter()}
+    deadline = args.run_deadline
+    try:
+        if args.transport.rate_limiter is not None:
+            args.transport.rate_limiter.acquire(url_host(args.transport.route(url)), deadline)
+        with args.scheduler.slot(url), args.transport.stream(
+            url, {"User-Agent": USER_AGENT}, deadline.cap(timeout) if deadline else timeout, timing=timing
+        ) as chunks:
+            yield chunks
+    except (OSError, http.client.HTTPException) as exc:
+        if deadline is None:
+            raise
+        converted = deadline.converted(exc)
+        if converted is exc:
+            raise
+        raise converted from exc
+    finally:
+        if args.timings is not None:
+            timing.setdefault("total", time.perf_counter() - timing["start"])
+            args.timings.record_request(source or scope_source(), url, "stream", timing)
+
+
+def iter_xml_elements(chunks: Iterable[bytes], tags: tuple[str, ...]) -> Iterator[ET.Element]:
+    """Yield each completed element whose tag is in `tags`, clearing it once the caller moves on.
+
+    Only time spent inside the parser counts as parse time, not the consumer's work per element.
+    """
+    parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(events=("end",))
+    # Only "end" events are requested, so every event is an (event, element) pair.
+    for chunk in chunks:
+        with timed_parse("xml"):
+            parser.feed(chunk)
+            elements = [cast("tuple[str, ET.Element]", event)[1] for event in parser.read_events()]
+        for element in elements:
+            if element.tag in tags:
+                yield element
+                element.clear()
+    with timed_parse("xml"):
+        parser.close()
+        elements = [cast("tuple[str, ET.Element]", event)[1] for event in parser.read_events()]
+    for element in elements:
+        if element.tag in tags:
+            yield element
+            element.clear()
+
+
+def get_json(url: str, timeout: float, errors: list[dict[str, Any]], source: str, args: argparse.Namespace) -> Any | None:
+    body = ""
+    try:
+        body = fetch_body(url, args, timeout, source=source).decode("utf-8")
+        with timed_parse("json"):
+            return json.loads(body)
     except urllib.error.HTTPError as exc:
         errors.append(http_error_record(source, exc, url))
+    except RateLimited as exc:
+        errors.append(
+            {"source": source, "error": "rate_limited", "url": url, "retryAfterSeconds": round(exc.retry_after, 1)}
+        )
     except urllib.error.URLError as exc:
         errors.append({"source": source, "error": f"url_error:{exc.reason}", "url": url})
+    except DeadlineExceeded:
+        errors.append({"source": source, "error": "deadline_exceeded", "url": url})
     except json.JSONDecodeError as exc:
         errors.append({"source": source, "error": f"json_decode_error:{exc}", "url": url, "bodySnippet": safe_snippet(body)})
     except (TimeoutError, UnicodeDecodeError) as exc:
@@ -597,6 +2582,18 @@ def get_json(url: str, timeout: int, errors: list[dict[str, Any]], source: str,
     return None
 
 
+def get_json_many(urls: list[str], errors: list[dict[str, Any]], source: str, args: argparse.Namespace) -> list[Any | None]:
+    def fetch_one(url: str) -> tuple[Any | None, list[dict[str, Any]]]:
+        url_errors: list[dict[str, Any]] = []
+        return get_json(url, args.timeout, url_errors, source, args), url_errors
+
+    payloads: list[Any | None] = []
+    for payload, url_errors in args.scheduler.map(fetch_one, urls):
+        payloads.append(payload)
+        errors.extend(url_errors)
+    return payloads
+
+
 def limited_topics(topics: list[str], max_topics: int = 4) -> list[str]:
     return topics[:max_topics] if topics else DEFAULT_TOPICS[:max_topics]
 
@@ -622,17 +2619,889 @@ def cache_key(url: str, headers: dict[str, str] | None, context: str | None = No
     return hashlib.sha256(cache_input).hexdigest()
 
 
-def record_cache_event(events: list[dict[str, Any]] | None, status: str, url: str, age_seconds: float | None = None) -> None:
-    if events is None:
-        return
-    parsed = urllib.parse.urlsplit(url)
-    event: dict[str, Any] = {
-        "status": status,
-        "host": parsed.netloc,
-        "path": parsed.path[:120],
+@dataclass
+class CachedBody:
+    body: bytes
+    fetched_at: float
+
+
+@dataclass
+class CacheEntryInfo:
+    key: str
+    host: str
+    size: int
+    fetched_at: float
+    accessed_at: float
+    url: str = ""
+    source: str | None = None
+
+
+class FileCacheStore:
+    """One `<key>.body` file per response plus a `<key>.meta.json` sidecar.
+
+    Body mtime is the fetch time used for TTL age; atime is advanced on reads for LRU eviction.
+    """
+
+    backend = "file"
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+        self.location = cache_dir
+
+    def load(self, key: str) -> CachedBody | None:
+        body_path = self._body_path(key)
+        try:
+            fetched_at = body_path.stat().st_mtime
+            return CachedBody(body=decode_cache_body(body_path.read_bytes()), fetched_at=fetched_at)
+        except (OSError, EOFError, zlib.error, ValueError):
+            return None
+
+    def validators(self, key: str) -> dict[str, str]:
+        meta = self._read_meta(key)
+        return {name: str(meta[name]) for name in ("etag", "lastModified") if meta.get(name)}
+
+    def store(self, key: str, url: str, body: bytes, response_headers: dict[str, str], *, source: str | None = None) -> None:
+        atomic_write_bytes(self._body_path(key), encode_cache_body(body))
+        self._write_meta(key, {"url": url, "source": source, **cache_validators(response_headers)})
+
+    def mark_revalidated(self, key: str, url: str, validators: dict[str, str]) -> None:
+        meta = self._read_meta(key)
+        try:
+            os.utime(self._body_path(key))
+        except OSError:
+            return
+        self._write_meta(key, {"url": url, "source": meta.get("source"), **validators})
+
+    def touch(self, key: str) -> None:
+        """Advance atime only, so LRU eviction sees the access while mtime keeps the TTL age."""
+        body_path = self._body_path(key)
+        try:
+            os.utime(body_path, (time.time(), body_path.stat().st_mtime))
+        except OSError:
+            pass
+
+    def entries(self, *, host: str | None = None, detailed: bool = False) -> list[CacheEntryInfo]:
+        entries: list[CacheEntryInfo] = []
+        if not self.cache_dir.is_dir():
+            return entries
+        for body_path in self.cache_dir.glob("*.body"):
+            key = body_path.stem
+            meta_path = self._meta_path(key)
+            try:
+                stat = body_path.stat()
+            except OSError:
+                continue
+            size = stat.st_size
+            meta: dict[str, Any] = {}
+            try:
+                size += meta_path.stat().st_size
+                if detailed or host:
+                    meta = self._read_meta(key)
+            except OSError:
+                pass
+            url = str(meta.get("url") or "")
+            entry_host = url_host(url) or "unknown"
+            if host and entry_host != host:
+                continue
+            entries.append(
+                CacheEntryInfo(
+                    key=key,
+                    host=entry_host,
+                    size=size,
+                    fetched_at=stat.st_mtime,
+                    accessed_at=max(stat.st_atime, stat.st_mtime),
+                    url=url,
+                    source=meta.get("source"),
+                )
+            )
+        return entries
+
+    def delete(self, keys: list[str]) -> None:
+        for key in keys:
+            self._body_path(key).unlink(missing_ok=True)
+            self._meta_path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        self.delete([entry.key for entry in self.entries()])
+        (self.cache_dir / CACHE_STATS_FILE).unlink(missing_ok=True)
+
+    def read_stats(self) -> dict[str, Any]:
+        try:
+            stats = json.loads((self.cache_dir / CACHE_STATS_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {"events": {}, "runs": 0}
+        return stats if isinstance(stats, dict) else {"events": {}, "runs": 0}
+
+    def update_stats(self, events: list[dict[str, Any]]) -> None:
+        stats = self.read_stats()
+        counts: dict[str, int] = dict(stats.get("events") or {})
+        for status, count in count_cache_events(events).items():
+            counts[status] = int(counts.get(status, 0)) + count
+        stats = {"events": counts, "runs": int(stats.get("runs") or 0) + 1, "updatedAt": iso_now()}
+        atomic_write_bytes(self.cache_dir / CACHE_STATS_FILE, json.dumps(stats, sort_keys=True).encode("utf-8"))
+
+    def close(self) -> None:
+        return
+
+    def _body_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.body"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.meta.json"
+
+    def _read_meta(self, key: str) -> dict[str, Any]:
+        try:
+            meta = json.loads(self._meta_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return meta if isinstance(meta, dict) else {}
+
+    def _write_meta(self, key: str, meta: dict[str, Any]) -> None:
+        payload = {**meta, "fetchedAt": iso_now()}
+        atomic_write_bytes(self._meta_path(key), json.dumps(payload, sort_keys=True).encode("utf-8"))
+
+
+class SqliteStoreBase:
+    """Thread-local connections to one WAL-mode SQLite file.
+
+    Each thread gets its own connection; WAL plus a busy timeout lets concurrent topic-radar
+    processes read while one writes.
+    """
+
+    SCHEMA: tuple[str, ...] = ()
+
+    def __init__(self, location: Path) -> None:
+        self.location = location
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+
+    def close(self) -> None:
+        with self._lock:
+            connections = list(self._connections)
+            self._connections.clear()
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        self.location.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.location), timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA busy_timeout = 30000")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        with conn:
+            for statement in self.SCHEMA:
+                conn.execute(statement)
+        self.migrate(conn)
+        self._local.conn = conn
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    def migrate(self, conn: sqlite3.Connection) -> None:
+        """Bring a file created by an older release up to `SCHEMA`; runs on every new connection."""
+
+    def _query_one(self, sql: str, params: tuple[Any, ...]) -> tuple[Any, ...] | None:
+        if not self.location.exists():
+            return None
+        return self._connection().execute(sql, params).fetchone()
+
+    def _execute(self, sql: str, params: tuple[Any, ...]) -> None:
+        conn = self._connection()
+        with conn:
+            conn.execute(sql, params)
+
+
+class SqliteCacheStore(SqliteStoreBase):
+    """Single-file WAL-mode SQLite cache indexed by key, host, and access time."""
+
+    backend = "sqlite"
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS entries (
+            key TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            host TEXT NOT NULL,
+            source TEXT,
+            body BLOB NOT NULL,
+            headers TEXT NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at REAL NOT NULL,
+            accessed_at REAL NOT NULL,
+            size INTEGER NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS entries_host ON entries(host)",
+        "CREATE INDEX IF NOT EXISTS entries_accessed ON entries(accessed_at)",
+        "CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+    )
+
+    def __init__(self, cache_dir: Path) -> None:
+        super().__init__(cache_dir / SQLITE_CACHE_FILE)
+        self.cache_dir = cache_dir
+
+    def load(self, key: str) -> CachedBody | None:
+        row = self._query_one("SELECT body, fetched_at FROM entries WHERE key = ?", (key,))
+        if not row:
+            return None
+        try:
+            return CachedBody(body=decode_cache_body(bytes(row[0])), fetched_at=float(row[1]))
+        except (OSError, EOFError, zlib.error, ValueError):
+            return None
+
+    def validators(self, key: str) -> dict[str, str]:
+        row = self._query_one("SELECT etag, last_modified FROM entries WHERE key = ?", (key,))
+        if not row:
+            return {}
+        return {name: value for name, value in (("etag", row[0]), ("lastModified", row[1])) if value}
+
+    def store(self, key: str, url: str, body: bytes, response_headers: dict[str, str], *, source: str | None = None) -> None:
+        now = time.time()
+        validators = cache_validators(response_headers)
+        stored = encode_cache_body(body)
+        self._execute(
+            """
+            INSERT OR REPLACE INTO entries
+                (key, url, host, source, body, headers, etag, last_modified, fetched_at, accessed_at, size)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                key,
+                url,
+                url_host(url) or "unknown",
+                source,
+                sqlite3.Binary(stored),
+                json.dumps(response_headers, sort_keys=True),
+                validators.get("etag"),
+                validators.get("lastModified"),
+                now,
+                now,
+                len(stored),
+            ),
+        )
+
+    def mark_revalidated(self, key: str, url: str, validators: dict[str, str]) -> None:
+        now = time.time()
+        self._execute(
+            "UPDATE entries SET fetched_at = ?, accessed_at = ?, etag = ?, last_modified = ? WHERE key = ?",
+            (now, now, validators.get("etag"), validators.get("lastModified"), key),
+        )
+
+    def touch(self, key: str) -> None:
+        try:
+            self._execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        except sqlite3.OperationalError:
+            pass
+
+    def entries(self, *, host: str | None = None, detailed: bool = False) -> list[CacheEntryInfo]:
+        if not self.location.exists():
+            return []
+        sql = "SELECT key, host, size, fetched_at, accessed_at, url, source FROM entries"
+        params: tuple[Any, ...] = ()
+        if host:
+            sql += " WHERE host = ?"
+            params = (host,)
+        return [
+            CacheEntryInfo(
+                key=row[0],
+                host=row[1],
+                size=int(row[2]),
+                fetched_at=float(row[3]),
+                accessed_at=float(row[4]),
+                url=row[5],
+                source=row[6],
+            )
+            for row in self._connection().execute(sql, params).fetchall()
+        ]
+
+    def delete(self, keys: list[str]) -> None:
+        if not keys or not self.location.exists():
+            return
+        conn = self._connection()
+        with conn:
+            conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in keys])
+
+    def clear(self) -> None:
+        if not self.location.exists():
+            return
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM entries")
+            conn.execute("DELETE FROM counters")
+        conn.execute("VACUUM")
+
+    def read_stats(self) -> dict[str, Any]:
+        if not self.location.exists():
+            return {"events": {}, "runs": 0}
+        rows = self._connection().execute("SELECT name, value FROM counters").fetchall()
+        counters = {str(name): int(value) for name, value in rows}
+        events = {name.removeprefix("event:"): value for name, value in counters.items() if name.startswith("event:")}
+        return {"events": events, "runs": counters.get("runs", 0)}
+
+    def update_stats(self, events: list[dict[str, Any]]) -> None:
+        increments = [(f"event:{status}", count) for status, count in count_cache_events(events).items()]
+        increments.append(("runs", 1))
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                "INSERT INTO counters (name, value) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                increments,
+            )
+
+
+CacheStore = FileCacheStore | SqliteCacheStore
+
+
+def open_cache_store(backend: str, cache_dir: Path) -> CacheStore:
+    if backend == "sqlite":
+        return SqliteCacheStore(cache_dir)
+    return FileCacheStore(cache_dir)
+
+
+def default_cache_backend() -> str:
+    backend = os.environ.get("TOPIC_RADAR_CACHE_BACKEND", "").strip().lower()
+    return backend if backend in CACHE_BACKENDS else "file"
+
+
+def count_cache_events(events: list[dict[str, Any]]) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for event in events:
+        status = str(event.get("status") or "unknown")
+        counts[status] = counts.get(status, 0) + 1
+    return counts
+
+
+def prune_cache(
+    store: CacheStore,
+    *,
+    max_bytes: int,
+    max_age_seconds: int,
+    now: float | None = None,
+    host: str | None = None,
+) -> dict[str, int]:
+    """Drop entries older than the age bound, then least-recently-used entries until under budget.
+
+    With `host`, every entry for that host is evicted regardless of the bounds.
+    """
+    current = time.time() if now is None else now
+    if host:
+        doomed = store.entries(host=host)
+        store.delete([entry.key for entry in doomed])
+        remaining = sum(entry.size for entry in store.entries())
+        return {"removed": len(doomed), "freedBytes": sum(entry.size for entry in doomed), "remainingBytes": remaining}
+    kept: list[CacheEntryInfo] = []
+    doomed = []
+    for entry in store.entries():
+        if max_age_seconds > 0 and current - entry.fetched_at > max_age_seconds:
+            doomed.append(entry)
+        else:
+            kept.append(entry)
+    total = sum(entry.size for entry in kept)
+    if max_bytes > 0 and total > max_bytes:
+        for entry in sorted(kept, key=lambda item: item.accessed_at):
+            if total <= max_bytes:
+                break
+            doomed.append(entry)
+            total -= entry.size
+    store.delete([entry.key for entry in doomed])
+    return {"removed": len(doomed), "freedBytes": sum(entry.size for entry in doomed), "remainingBytes": total}
+
+
+def clear_cache(store: CacheStore) -> dict[str, int]:
+    entries = store.entries()
+    store.clear()
+    return {"removed": len(entries), "freedBytes": sum(entry.size for entry in entries), "remainingBytes": 0}
+
+
+def cache_hit_rate(counts: dict[str, int]) -> float | None:
+    lookups = sum(int(counts.get(status, 0)) for status in CACHE_LOOKUP_STATUSES)
+    if not lookups:
+        return None
+    served = sum(int(counts.get(status, 0)) for status in CACHE_HIT_STATUSES)
+    return round(served / lookups, 4)
+
+
+def cache_stats(store: CacheStore, *, host: str | None = None) -> dict[str, Any]:
+    entries = store.entries(host=host, detailed=True)
+    hosts: dict[str, dict[str, int]] = {}
+    for entry in entries:
+        bucket = hosts.setdefault(entry.host, {"entries": 0, "bytes": 0})
+        bucket["entries"] += 1
+        bucket["bytes"] += entry.size
+    lifetime = store.read_stats()
+    counts = {str(key): int(value) for key, value in (lifetime.get("events") or {}).items()}
+    now = time.time()
+    stats: dict[str, Any] = {
+        "backend": store.backend,
+        "location": str(store.location),
+        "entries": len(entries),
+        "bytes": sum(entry.size for entry in entries),
+        "oldestAgeSeconds": round(now - min(entry.fetched_at for entry in entries), 1) if entries else None,
+        "hosts": dict(sorted(hosts.items(), key=lambda item: (-item[1]["bytes"], item[0]))),
+        "runs": int(lifetime.get("runs") or 0),
+        "events": dict(sorted(counts.items())),
+        "hitRate": cache_hit_rate(counts),
+    }
+    if host:
+        stats["hostEntries"] = [
+            {
+                "key": entry.key,
+                "url": entry.url,
+                "source": entry.source,
+                "bytes": entry.size,
+                "ageSeconds": round(now - entry.fetched_at, 1),
+            }
+            for entry in sorted(entries, key=lambda item: item.fetched_at, reverse=True)
+        ]
+    return stats
+
+
+def maintain_cache(args: argparse.Namespace) -> None:
+    if not args.cache_ttl_seconds or args.sample:
+        return
+    try:
+        args.cache_store.update_stats(args.cache_events)
+        prune_cache(
+            args.cache_store,
+            max_bytes=args.cache_max_mb * 1024 * 1024,
+            max_age_seconds=args.cache_max_age_days * 86400,
+        )
+        prune_cache_locks(args.cache_dir)
+    except (OSError, sqlite3.Error):
+        pass
+
+
+class ItemHistoryStore(SqliteStoreBase):
+    """Local SQLite record of every item seen, with engagement snapshots and fetched-day coverage.
+
+    `coverage` marks which UTC days of a source were fetched in full for a topic scope, so
+    longer windows only fetch the missing slices. Snapshot-only sources (Polymarket, Hugging Face)
+    get history from their per-day `snapshots` rows.
+    """
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS items (
+            source TEXT NOT NULL,
+            key TEXT NOT NULL,
+            title TEXT NOT NULL,
+            url TEXT NOT NULL,
+            published_at TEXT,
+            summary TEXT,
+            source_detail TEXT,
+            reason TEXT NOT NULL,
+            tags TEXT NOT NULL,
+            raw TEXT NOT NULL,
+            first_seen REAL NOT NULL,
+            last_seen REAL NOT NULL,
+            published_ts REAL,
+            PRIMARY KEY (source, key)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS snapshots (
+            source TEXT NOT NULL,
+            key TEXT NOT NULL,
+            scope TEXT NOT NULL,
+            day TEXT NOT NULL,
+            engagement REAL NOT NULL,
+            reason TEXT NOT NULL,
+            observed_at REAL NOT NULL,
+            PRIMARY KEY (source, key, scope, day)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS coverage (
+            source TEXT NOT NULL,
+            scope TEXT NOT NULL,
+            day TEXT NOT NULL,
+            item_limit INTEGER NOT NULL,
+            fetched_at REAL NOT NULL,
+            PRIMARY KEY (source, scope, day)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS snapshots_scope_day ON snapshots(source, scope, day)",
+    )
+
+    def migrate(self, conn: sqlite3.Connection) -> None:
+        """Add and backfill `published_ts` (UTC epoch) on files that predate it, then index it.
+
+        The window filter compares epochs in SQL; `published_at` strings come in feed formats
+        that do not sort chronologically.
+        """
+        if "published_ts" not in {row[1] for row in conn.execute("PRAGMA table_info(items)")}:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                if "published_ts" not in {row[1] for row in conn.execute("PRAGMA table_info(items)")}:
+                    conn.execute("ALTER TABLE items ADD COLUMN published_ts REAL")
+                    rows = conn.execute("SELECT rowid, published_at FROM items WHERE published_at IS NOT NULL").fetchall()
+                    conn.executemany(
+                        "UPDATE items SET published_ts = ? WHERE rowid = ?",
+                        [(published_epoch(published_at), rowid) for rowid, published_at in rows],
+                    )
+        with conn:
+            conn.execute("DROP INDEX IF EXISTS items_published")
+            conn.execute("CREATE INDEX IF NOT EXISTS items_published_ts ON items(source, published_ts)")
+
+    def record(self, source: str, scope: str, items: list[RadarItem], *, observed_at: float | None = None) -> None:
+        if not items:
+            return
+        now = time.time() if observed_at is None else observed_at
+        day = datetime.fromtimestamp(now, UTC).date().isoformat()
+        item_rows = []
+        snapshot_rows = []
+        for item in items:
+            key = canonical_key(item)
+            item_rows.append(
+                (
+                    source,
+                    key,
+                    item.title,
+                    item.url,
+                    item.published_at,
+                    item.summary,
+                    item.source_detail,
+                    item.reason,
+                    json.dumps(item.tags),
+                    json.dumps(item.raw, sort_keys=True, default=str),
+                    now,
+                    now,
+                    item.published_ts,
+                )
+            )
+            snapshot_rows.append((source, key, scope, day, item.engagement, item.reason, now))
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                """
+                INSERT INTO items
+                    (source, key, title, url, published_at, summary, source_detail, reason, tags, raw, first_seen, last_seen,
+                     published_ts)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(source, key) DO UPDATE SET
+                    title = excluded.title,
+                    url = excluded.url,
+                    published_at = COALESCE(excluded.published_at, items.published_at),
+                    published_ts = COALESCE(excluded.published_ts, items.published_ts),
+                    summary = COALESCE(excluded.summary, items.summary),
+                    source_detail = excluded.source_detail,
+                    reason = excluded.reason,
+                    tags = excluded.tags,
+                    raw = excluded.raw,
+                    first_seen = MIN(items.first_seen, excluded.first_seen),
+                    last_seen = MAX(items.last_seen, excluded.last_seen)
+                """,
+                item_rows,
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO snapshots (source, key, scope, day, engagement, reason, observed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                snapshot_rows,
+            )
+
+    def mark_covered(self, source: str, scope: str, days: list[date], limit: int) -> None:
+        if not days:
+            return
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO coverage (source, scope, day, item_limit, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                [(source, scope, day.isoformat(), limit, now) for day in days],
+            )
+
+    def covered_days(self, source: str, scope: str, days: list[date], limit: int) -> set[date]:
+        if not days or not self.location.exists():
+            return set()
+        rows = self._connection().execute(
+            "SELECT day FROM coverage WHERE source = ? AND scope = ? AND day BETWEEN ? AND ? AND item_limit >= ?",
+            (source, scope, days[0].isoformat(), days[-1].isoformat(), limit),
+        ).fetchall()
+        return {date.fromisoformat(row[0]) for row in rows}
+
+    def load(self, source: str, scope: str, *, start: datetime, end: datetime, by_observed: bool = False) -> list[RadarItem]:
+        """Return items seen under `scope`, carrying the latest engagement snapshot inside the window.
+
+        Windowed sources select by publication time; snapshot sources (`by_observed`) select by the
+        days their snapshots were taken.
+        """
+        if not self.location.exists():
+            return []
+        if by_observed:
+            where = "s.day BETWEEN ? AND ?"
+            params: tuple[Any, ...] = (source, scope, start.date().isoformat(), (end - timedelta(seconds=1)).date().isoformat())
+        else:
+            where = "i.published_ts >= ? AND i.published_ts < ?"
+            params = (source, scope, start.timestamp(), end.timestamp())
+        rows = self._connection().execute(
+            f"""
+            SELECT i.title, i.url, i.published_at, i.summary, i.source_detail, i.tags, i.raw,
+                   s.engagement, s.reason, MAX(s.observed_at)
+            FROM snapshots s JOIN items i ON i.source = s.source AND i.key = s.key
+            WHERE s.source = ? AND s.scope = ? AND {where}
+            GROUP BY s.key
+            ORDER BY i.first_seen, s.key
+            """,
+            params,
+        ).fetchall()
+        items: list[RadarItem] = []
+        for title, url, published_at, summary, source_detail, tags, raw, engagement, reason, _ in rows:
+            items.append(
+                RadarItem(
+                    source=source,
+                    source_detail=source_detail,
+                    title=title,
+                    url=url,
+                    published_at=published_at,
+                    summary=summary,
+                    engagement=float(engagement),
+                    reason=reason,
+                    tags=json.loads(tags),
+                    raw=json.loads(raw),
+                )
+            )
+        return items
+
+
+def default_state_dir() -> Path:
+    xdg_state_home = os.environ.get("XDG_STATE_HOME")
+    root = Path(xdg_state_home) if xdg_state_home else Path.home() / ".local" / "state"
+    return root / "agent-kit" / "topic-radar"
+
+
+def default_history_enabled() -> bool:
+    return os.environ.get("TOPIC_RADAR_HISTORY", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class DeltaState:
+    """Items already delivered for one profile: 64-bit key hash, last emitted score, and UTC day.
+
+    The file is a header, a sorted base of fixed-size records, and an append-only tail. Loading
+    is one read and a `struct.iter_unpack` pass into a dict, so each delta check is a single
+    lookup. Runs append only their emitted records; once the tail outgrows a quarter of the base
+    the file is compacted: sorted, deduplicated, and stripped of keys not seen for
+    `DELTA_RETENTION_DAYS`.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries: dict[int, tuple[float, int]] = {}
+        self.base_count = 0
+        self.tail_count = 0
+        self.new_keys: set[int] = set()
+        self.rescored_keys: set[int] = set()
+        self.suppressed_keys: set[int] = set()
+        self.emitted_keys: set[int] = set()
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = self.path.read_bytes()
+        except OSError:
+            return
+        if len(data) < DELTA_HEADER.size:
+            return
+        magic, base_count = DELTA_HEADER.unpack_from(data)
+        if magic != DELTA_STATE_MAGIC:
+            return
+        body = memoryview(data)[DELTA_HEADER.size :]
+        body = body[: len(body) - len(body) % DELTA_RECORD.size]
+        for key, score, day in DELTA_RECORD.iter_unpack(body):
+            self.entries[key] = (score, day)
+        total = len(body) // DELTA_RECORD.size
+        self.base_count = min(base_count, total)
+        self.tail_count = total - self.base_count
+
+    @staticmethod
+    def key_hash(item: RadarItem) -> int:
+        digest = hashlib.blake2b(canonical_key(item).encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "little")
+
+    def accepts(self, item: RadarItem) -> bool:
+        """True for items never delivered, or whose score rose by at least `DELTA_SCORE_GAIN`."""
+        key = self.key_hash(item)
+        previous = self.entries.get(key)
+        if previous is None:
+            self.new_keys.add(key)
+            return True
+        if item.score >= previous[0] + DELTA_SCORE_GAIN:
+            self.rescored_keys.add(key)
+            return True
+        self.suppressed_keys.add(key)
+        return False
+
+    def note_emitted(self, items: Iterable[RadarItem]) -> None:
+        """Record which accepted items were rendered, so `new`/`rescored` count only those."""
+        self.emitted_keys.update(self.key_hash(item) for item in items)
+
+    def save(self, items: Iterable[RadarItem], *, today: int | None = None) -> None:
+        today = int(time.time() // 86400) if today is None else today
+        records: dict[int, tuple[float, int]] = {}
+        for item in items:
+            records[self.key_hash(item)] = (item.score, today)
+        if not records:
+            return
+        self.entries.update(records)
+        if self.tail_count + len(records) > max(DELTA_COMPACT_MIN_RECORDS, self.base_count // 4) or not self.path.exists():
+            self.compact(today=today)
+            return
+        with self.path.open("ab") as handle:
+            handle.write(b"".join(DELTA_RECORD.pack(key, score, day) for key, (score, day) in records.items()))
+        self.tail_count += len(records)
+
+    def compact(self, *, today: int | None = None) -> None:
+        today = int(time.time() // 86400) if today is None else today
+        cutoff = today - DELTA_RETENTION_DAYS
+        self.entries = {key: entry for key, entry in sorted(self.entries.items()) if entry[1] >= cutoff}
+        data = DELTA_HEADER.pack(DELTA_STATE_MAGIC, len(self.entries)) + b"".join(
+            DELTA_RECORD.pack(key, score, day) for key, (score, day) in self.entries.items()
+        )
+        atomic_write_bytes(self.path, data)
+        self.base_count = len(self.entries)
+        self.tail_count = 0
+
+    def metadata(self) -> dict[str, Any]:
+        return {
+            "enabled": True,
+            "stateFile": str(self.path),
+            "known": len(self.entries),
+            "new": len(self.new_keys & self.emitted_keys),
+            "rescored": len(self.rescored_keys & self.emitted_keys),
+            "suppressed": len(self.suppressed_keys - self.new_keys - self.rescored_keys),
+        }
+
+
+def default_delta_state_path(args: argparse.Namespace) -> Path:
+    return default_state_dir() / f"delivered-{args.profile}-{args.preset}.bin"
+
+
+def delta_metadata(args: argparse.Namespace) -> dict[str, Any]:
+    if args.delta_state is None:
+        return {"enabled": False}
+    return args.delta_state.metadata()
+
+
+def history_scope(args: argparse.Namespace, source: str) -> str:
+    scope: dict[str, Any] = {"source": source, "topics": sorted(topic.lower() for topic in args.topics)}
+    if source == "news":
+        scope["newsProvider"] = args.news_provider
+    return hashlib.sha256(json.dumps(scope, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def window_days(start: datetime, end: datetime) -> list[date]:
+    last = (end - timedelta(seconds=1)).date()
+    return [start.date() + timedelta(days=offset) for offset in range((last - start.date()).days + 1)]
+
+
+def history_slice_args(args: argparse.Namespace, first: date, last: date) -> argparse.Namespace:
+    """Copy `args` narrowed to whole UTC days `first..last`, clipped to the current time."""
+    sliced = copy.copy(args)
+    sliced.window_mode = "fixed"
+    sliced.window_start_dt = utc_midnight(first)
+    sliced.window_end_dt = min(end_exclusive(last), now_utc().replace(microsecond=0))
+    sliced.days = max(1, math.ceil((sliced.window_end_dt - sliced.window_start_dt).total_seconds() / 86400))
+    sliced.cache_context = f"fixed:{first.isoformat()}:{window_inclusive_end(sliced).isoformat()}"
+    return sliced
+
+
+def fetch_with_history(
+    source: str,
+    fetcher: Callable[[argparse.Namespace, list[dict[str, Any]]], list[RadarItem]],
+    args: argparse.Namespace,
+    errors: list[dict[str, Any]],
+) -> list[RadarItem]:
+    """Answer a source from the item history store, fetching only days it has not covered yet."""
+    store: ItemHistoryStore = args.history_store
+    scope = history_scope(args, source)
+    today = now_utc().date()
+    days = window_days(args.window_start_dt, args.window_end_dt)
+    covered = store.covered_days(source, scope, days, args.limit)
+    report = {"windowDays": len(days), "coveredDays": len(covered), "fetchedDays": 0}
+    args.history_report[source] = report
+
+    if source in HISTORY_SNAPSHOT_SOURCES:
+        if args.window_mode == "fixed" and covered:
+            items = store.load(source, scope, start=args.window_start_dt, end=args.window_end_dt, by_observed=True)
+            report["fromHistory"] = len(items)
+            return items
+        error_count = len(errors)
+        current = fetcher(args, errors)
+        if args.window_mode == "fixed":
+            return current
+        if args.run_deadline is not None:
+            args.run_deadline.check_live()
+        store.record(source, scope, current)
+        if len(errors) == error_count:
+            store.mark_covered(source, scope, [today], args.limit)
+            report["fetchedDays"] = 1
+        items = store.load(source, scope, start=args.window_start_dt, end=args.window_end_dt, by_observed=True)
+        report["fromHistory"] = max(len(items) - len(current), 0)
+        return items
+
+    missing = [day for day in days if day not in covered]
+    fetched: list[RadarItem] = []
+    if missing:
+        sliced = history_slice_args(args, missing[0], missing[-1])
+        error_count = len(errors)
+        fetched = fetcher(sliced, errors)
+        if args.run_deadline is not None:
+            args.run_deadline.check_live()
+        store.record(source, scope, fetched)
+        fetched_days = window_days(sliced.window_start_dt, sliced.window_end_dt)
+        report["fetchedDays"] = len(fetched_days)
+        if len(errors) == error_count:
+            store.mark_covered(source, scope, [day for day in fetched_days if day < today], args.limit)
+    slack = timedelta(days=window_filter_slack_days(args))
+    fetched_keys = {canonical_key(item) for item in fetched}
+    history = [
+        item
+        for item in store.load(source, scope, start=args.window_start_dt - slack, end=args.window_end_dt + slack)
+        if canonical_key(item) not in fetched_keys
+    ]
+    report["fromHistory"] = len(history)
+    in_window = [
+        item
+        for item in fetched
+        if timestamp_in_window(item.published_ts, args, slack_days=slack.days, include_unknown=True)
+    ]
+    return in_window + history
+
+
+def history_metadata(args: argparse.Namespace) -> dict[str, Any]:
+    store = getattr(args, "history_store", None)
+    return {
+        "enabled": store is not None,
+        "path": str(store.location) if store is not None else None,
+        "sources": dict(sorted(getattr(args, "history_report", {}).items())),
+    }
+
+
+def record_cache_event(
+    events: list[dict[str, Any]] | None,
+    status: str,
+    url: str,
+    age_seconds: float | None = None,
+    *,
+    reason: str | None = None,
+) -> None:
+    if events is None:
+        return
+    parsed = urllib.parse.urlsplit(url)
+    event: dict[str, Any] = {
+        "status": status,
+        "host": parsed.netloc,
+        "path": parsed.path[:120],
     }
     if age_seconds is not None:
         event["ageSeconds"] = round(age_seconds, 1)
+    if reason:
+        event["reason"] = reason
     events.append(event)
 
 
@@ -883,15 +3752,18 @@ def fetch_polymarket_helper(args: argparse.Namespace, errors: list[dict[str, Any
         return []
     skill_dir = Path(__file__).resolve().parents[1]
     script = skill_dir.parent / "polymarket-readonly/scripts/polymarket-readonly.sh"
-    if not script.exists():
+    if not script.exists() and not isinstance(args.transport, ReplayTransport):
         errors.append({"source": "polymarket", "error": "helper_not_found", "path": str(script)})
         return []
-    proc = subprocess.run(
-        [str(script), "--report", args.report, "--scope", "both", "--format", "json", "--limit", str(args.limit)],
-        text=True,
-        capture_output=True,
-        timeout=args.timeout + 10,
-    )
+    try:
+        proc = args.transport.run_helper(
+            [str(script), "--report", args.report, "--scope", "both", "--format", "json", "--limit", str(args.limit)],
+            timeout=args.timeout + 10 if args.run_deadline is None else budget_timeout(args),
+        )
+    except (subprocess.TimeoutExpired, DeadlineExceeded) as exc:
+        expired = isinstance(exc, DeadlineExceeded) or args.run_deadline is not None
+        errors.append({"source": "polymarket", "error": "deadline_exceeded" if expired else "helper_timeout"})
+        return []
     if proc.returncode == 3:
         errors.append({"source": "polymarket", "error": "unsafe_trading_credential_environment", "unsafe": True})
         return []
@@ -945,7 +3817,7 @@ def fetch_hn(args: argparse.Namespace, errors: list[dict[str, Any]]) -> list[Rad
     until_ts = int(args.window_end_dt.timestamp())
     topics = limited_topics(args.topics)
     per_topic = max(1, math.ceil(args.limit / max(len(topics), 1)))
-    items: list[RadarItem] = []
+    urls = []
     for topic in topics:
         params = {
             "query": topic,
@@ -953,8 +3825,9 @@ def fetch_hn(args: argparse.Namespace, errors: list[dict[str, Any]]) -> list[Rad
             "numericFilters": f"created_at_i>={since_ts},created_at_i<{until_ts}",
             "hitsPerPage": str(per_topic),
         }
-        url = f"https://hn.algolia.com/api/v1/search_by_date?{urllib.parse.urlencode(params)}"
-        payload = get_json(url, args.timeout, errors, "hn", args)
+        urls.append(f"https://hn.algolia.com/api/v1/search_by_date?{urllib.parse.urlencode(params)}")
+    items: list[RadarItem] = []
+    for topic, payload in zip(topics, get_json_many(urls, errors, "hn", args)):
         if not isinstance(payload, dict):
             continue
         for hit in payload.get("hits") or []:
@@ -975,7 +3848,7 @@ def fetch_hn(args: argparse.Namespace, errors: list[dict[str, Any]]) -> list[Rad
                 reason=f"{format_number(points)} points, {format_number(comments)} comments",
                 raw={"objectID": object_id, "query": topic},
             )
-            if interest_match_score(item, args.topics) > 0 and item_in_window(item.published_at, args):
+            if interest_match_score(item, args.topics) > 0 and timestamp_in_window(item.published_ts, args):
                 items.append(item)
     return items
 
@@ -985,12 +3858,13 @@ def fetch_github(args: argparse.Namespace, errors: list[dict[str, Any]]) -> list
     end_date = window_inclusive_end(args).isoformat()
     topics = limited_topics(args.topics)
     per_topic = max(1, math.ceil(args.limit / max(len(topics), 1)))
-    items: list[RadarItem] = []
+    urls = []
     for topic in topics:
         query = f"{topic} in:name,description,readme pushed:{start_date}..{end_date} stars:>10"
         params = {"q": query, "sort": "stars", "order": "desc", "per_page": str(per_topic)}
-        url = f"https://api.github.com/search/repositories?{urllib.parse.urlencode(params)}"
-        payload = get_json(url, args.timeout, errors, "github", args)
+        urls.append(f"https://api.github.com/search/repositories?{urllib.parse.urlencode(params)}")
+    items: list[RadarItem] = []
+    for topic, payload in zip(topics, get_json_many(urls, errors, "github", args)):
         if not isinstance(payload, dict):
             continue
         for repo in payload.get("items") or []:
@@ -1011,78 +3885,154 @@ def fetch_github(args: argparse.Namespace, errors: list[dict[str, Any]]) -> list
                 tags=repo.get("topics") or [],
                 raw={"language": repo.get("language"), "forks": forks, "query": topic},
             )
-            if item_in_window(item.published_at, args) and interest_match_score(item, args.topics) > 0:
+            if timestamp_in_window(item.published_ts, args) and interest_match_score(item, args.topics) > 0:
                 items.append(item)
     return items
 
 
 def fetch_arxiv(args: argparse.Namespace, errors: list[dict[str, Any]]) -> list[RadarItem]:
-    start = format_arxiv_datetime(args.window_start_dt)
-    end = format_arxiv_datetime(args.window_end_dt - timedelta(seconds=1))
-    query = f"(cat:cs.AI OR cat:cs.CL OR cat:cs.LG) AND submittedDate:[{start} TO {end}]"
+    if args.window_mode == "fixed":
+        return fetch_arxiv_backfill(args, errors)
+    url = arxiv_query_url(args.window_start_dt, args.window_end_dt, max_results=max(args.limit * 4, args.limit))
+    items: list[RadarItem] = []
+    try:
+        with open_body_stream(url, args, source="arxiv") as chunks:
+            for entry in iter_xml_elements(chunks, (f"{{{ATOM_NS}}}entry",)):
+                item = arxiv_entry_item(entry, args)
+                if item is None:
+                    continue
+                items.append(item)
+                if len(items) >= args.limit:
+                    break
+    except Exception as exc:  # noqa: BLE001 - report per-source degradation.
+        errors.append(arxiv_error_record(exc, url))
+    return items
+
+
+def arxiv_query_url(start_dt: datetime, end_dt: datetime, *, start: int = 0, max_results: int) -> str:
+    start_text = format_arxiv_datetime(start_dt)
+    end_text = format_arxiv_datetime(end_dt - timedelta(seconds=1))
+    query = f"(cat:cs.AI OR cat:cs.CL OR cat:cs.LG) AND submittedDate:[{start_text} TO {end_text}]"
     params = {
         "search_query": query,
-        "start": "0",
-        "max_results": str(max(args.limit * 4, args.limit)),
+        "start": str(start),
+        "max_results": str(max_results),
         "sortBy": "submittedDate",
         "sortOrder": "descending",
     }
-    url = f"https://export.arxiv.org/api/query?{urllib.parse.urlencode(params)}"
-    try:
-        xml_bytes = http_get(
-            url,
-            args.timeout,
-            cache_ttl_seconds=args.cache_ttl_seconds,
-            cache_dir=args.cache_dir,
-            cache_events=args.cache_events,
-            refresh=args.refresh,
-            cache_context=args.cache_context,
-        )
-    except urllib.error.HTTPError as exc:
-        errors.append(http_error_record("arxiv", exc, url))
-        return []
-    except Exception as exc:  # noqa: BLE001 - report per-source degradation.
-        errors.append({"source": "arxiv", "error": f"{type(exc).__name__}:{exc}", "url": url})
-        return []
-    try:
-        root = ET.fromstring(xml_bytes)
-    except ET.ParseError as exc:
-        errors.append({"source": "arxiv", "error": f"xml_parse_error:{exc}", "url": url})
-        return []
-    ns = {"atom": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
+    return f"https://export.arxiv.org/api/query?{urllib.parse.urlencode(params)}"
+
+
+def arxiv_entry_item(entry: ET.Element, args: argparse.Namespace) -> RadarItem | None:
+    ns = {"atom": ATOM_NS, "arxiv": "http://arxiv.org/schemas/atom"}
+    title = normalize_space(child_text(entry, "atom:title", ns))
+    if not title:
+        return None
+    published = child_text(entry, "atom:published", ns) or child_text(entry, "atom:updated", ns)
+    if not item_in_window(published, args, slack_days=window_filter_slack_days(args)):
+        return None
+    summary = normalize_space(child_text(entry, "atom:summary", ns))
+    categories = [node.attrib.get("term", "") for node in entry.findall("atom:category", ns)]
+    authors = [normalize_space(child_text(node, "atom:name", ns)) for node in entry.findall("atom:author", ns)]
+    return RadarItem(
+        source="arxiv",
+        source_detail="export.arxiv.org/api/query",
+        title=title,
+        url=atom_link(entry, ns),
+        published_at=published,
+        summary=summary[:320] if summary else None,
+        engagement=0,
+        reason=f"new paper in {', '.join(filter(None, categories[:3]))}",
+        tags=[tag for tag in categories if tag],
+        raw={"authors": [author for author in authors if author][:5]},
+    )
+
+
+def arxiv_error_record(exc: Exception, url: str) -> dict[str, Any]:
+    if isinstance(exc, urllib.error.HTTPError):
+        return http_error_record("arxiv", exc, url)
+    if isinstance(exc, ET.ParseError):
+        return {"source": "arxiv", "error": f"xml_parse_error:{exc}", "url": url}
+    return {"source": "arxiv", "error": f"{type(exc).__name__}:{exc}", "url": url}
+
+
+def fetch_arxiv_day(day: date, args: argparse.Namespace) -> tuple[list[RadarItem], list[dict[str, Any]], int]:
+    """Walk `start` offsets for one UTC day of the window; returns items, errors, and pages read.
+
+    Day pages pin their own date range, so they are cached without the window context and
+    shared by any overlapping window; settled days keep them for a week.
+    """
+    start_dt = max(utc_midnight(day), args.window_start_dt)
+    end_dt = min(end_exclusive(day), args.window_end_dt)
+    settled = day < now_utc().date() - timedelta(days=ARXIV_SETTLED_DAYS)
+    ttl = max(args.cache_ttl_seconds, ARXIV_SETTLED_TTL_SECONDS) if settled and args.cache_ttl_seconds > 0 else None
     items: list[RadarItem] = []
-    for entry in root.findall("atom:entry", ns):
-        title = normalize_space(child_text(entry, "atom:title", ns))
-        if not title:
-            continue
-        published = child_text(entry, "atom:published", ns) or child_text(entry, "atom:updated", ns)
-        if not item_in_window(published, args, slack_days=window_filter_slack_days(args)):
-            continue
-        summary = normalize_space(child_text(entry, "atom:summary", ns))
-        link = ""
-        for link_node in entry.findall("atom:link", ns):
-            if link_node.attrib.get("rel") in (None, "alternate"):
-                link = link_node.attrib.get("href", "")
-                break
-        categories = [node.attrib.get("term", "") for node in entry.findall("atom:category", ns)]
-        authors = [normalize_space(child_text(node, "atom:name", ns)) for node in entry.findall("atom:author", ns)]
-        items.append(
-            RadarItem(
-                source="arxiv",
-                source_detail="export.arxiv.org/api/query",
-                title=title,
-                url=link,
-                published_at=published,
-                summary=summary[:320] if summary else None,
-                engagement=0,
-                reason=f"new paper in {', '.join(filter(None, categories[:3]))}",
-                tags=[tag for tag in categories if tag],
-                raw={"authors": [author for author in authors if author][:5]},
-            )
-        )
-        if len(items) >= args.limit:
+    errors: list[dict[str, Any]] = []
+    pages = 0
+    for page in range(ARXIV_MAX_PAGES_PER_DAY):
+        url = arxiv_query_url(start_dt, end_dt, start=page * ARXIV_PAGE_SIZE, max_results=ARXIV_PAGE_SIZE)
+        entries = 0
+        try:
+            with open_body_stream(url, args, source="arxiv", window_scoped=False, cache_ttl_seconds=ttl) as chunks:
+                for entry in iter_xml_elements(chunks, (f"{{{ATOM_NS}}}entry",)):
+                    entries += 1
+                    item = arxiv_entry_item(entry, args)
+                    if item is not None:
+                        items.append(item)
+        except Exception as exc:  # noqa: BLE001 - keep pages already read.
+            errors.append(arxiv_error_record(exc, url))
             break
-    return items
+        pages += 1
+        if entries < ARXIV_PAGE_SIZE:
+            break
+    return items, errors, pages
+
+
+def arxiv_score_bound(day: date, args: argparse.Namespace, best_base: float) -> float:
+    """Estimated best score of an arXiv item published on `day`.
+
+    `best_base` is the highest score seen so far minus its recency term (source weight plus topic
+    match); older days can only add less recency, so their items are expected to stay below it.
+    """
+    newest = min(end_exclusive(day), args.window_end_dt).timestamp()
+    return best_base + recency_from_timestamp(newest, args.days, args.window_reference_dt)
+
+
+def fetch_arxiv_backfill(args: argparse.Namespace, errors: list[dict[str, Any]]) -> list[RadarItem]:
+    """Page through a fixed window day by day, newest first, keeping the best `--limit` items.
+
+    Days are fetched in waves of `--jobs` under arXiv's host pacing. After each wave the walk
+    stops once every kept item outscores the best topic match seen so far would score on the
+    next older day. Items are scored here once; `RadarRanking` reuses those scores.
+    """
+    days = sorted(window_days(args.window_start_dt, args.window_end_dt), reverse=True)
+    wave_size = max(1, args.jobs)
+    best: list[tuple[float, int, RadarItem]] = []
+    best_base = SOURCE_WEIGHTS["arxiv"]
+    sequence = 0
+    report = {"days": len(days), "fetchedDays": 0, "pages": 0, "stoppedEarly": False}
+    for offset in range(0, len(days), wave_size):
+        wave = days[offset : offset + wave_size]
+        for day_items, day_errors, pages in args.scheduler.map(lambda day: fetch_arxiv_day(day, args), wave):
+            errors.extend(day_errors)
+            report["fetchedDays"] += 1
+            report["pages"] += pages
+            for item in day_items:
+                score_once(item, args.topics, args.days, args.window_reference_dt)
+                recency = recency_from_timestamp(item.published_ts, args.days, args.window_reference_dt)
+                best_base = max(best_base, item.score - recency)
+                sequence += 1
+                entry = (item.score, -sequence, item)
+                if len(best) < args.limit:
+                    heapq.heappush(best, entry)
+                elif entry > best[0]:
+                    heapq.heapreplace(best, entry)
+        remaining = days[offset + wave_size :]
+        if remaining and len(best) >= args.limit and best[0][0] >= arxiv_score_bound(remaining[0], args, best_base):
+            report["stoppedEarly"] = True
+            break
+    args.arxiv_backfill = report
+    return [item for _, _, item in sorted(best, reverse=True)]
 
 
 def fetch_hf(args: argparse.Namespace, errors: list[dict[str, Any]]) -> list[RadarItem]:
@@ -1119,7 +4069,7 @@ def fetch_hf(args: argparse.Namespace, errors: list[dict[str, Any]]) -> list[Rad
             tags=tags[:12],
             raw={"pipelineTag": model.get("pipeline_tag"), "libraryName": model.get("library_name")},
         )
-        if item_in_window(item.published_at, args) and interest_match_score(item, args.topics) > 0:
+        if timestamp_in_window(item.published_ts, args) and interest_match_score(item, args.topics) > 0:
             items.append(item)
         if len(items) >= args.limit:
             break
@@ -1129,64 +4079,48 @@ def fetch_hf(args: argparse.Namespace, errors: list[dict[str, Any]]) -> list[Rad
 def fetch_official(args: argparse.Namespace, errors: list[dict[str, Any]]) -> list[RadarItem]:
     items: list[RadarItem] = []
     per_feed_limit = max(2, math.ceil(args.limit / 4))
+    # Feeds and pages are fetched in turn, so each one only gets its share of any run deadline.
+    steps_left = len(OFFICIAL_FEEDS) + len(OFFICIAL_HTML_PAGES)
     for feed_name, feed_url in OFFICIAL_FEEDS:
+        steps_left -= 1
         try:
-            xml_bytes = http_get(
-                feed_url,
-                args.timeout,
-                cache_ttl_seconds=args.cache_ttl_seconds,
-                cache_dir=args.cache_dir,
-                cache_events=args.cache_events,
-                refresh=args.refresh,
-                cache_context=args.cache_context,
-            )
+            timeout = budget_timeout(args, 1 / (steps_left + 1))
+            with open_body_stream(feed_url, args, source="official", timeout=timeout) as chunks:
+                feed_item_count = 0
+                for element in iter_xml_elements(chunks, FEED_ENTRY_TAGS):
+                    entry = feed_entry(element)
+                    published = entry.get("publishedAt")
+                    if not item_in_window(published, args, slack_days=window_filter_slack_days(args)):
+                        continue
+                    title = normalize_space(entry.get("title"))
+                    if not title:
+                        continue
+                    item = RadarItem(
+                        source="official",
+                        source_detail=feed_name,
+                        title=title,
+                        url=entry.get("url") or feed_url,
+                        published_at=published,
+                        summary=normalize_space(entry.get("summary"))[:320] or None,
+                        engagement=0,
+                        reason=f"official source: {feed_name}",
+                        raw={"feed": feed_url},
+                    )
+                    if interest_match_score(item, args.topics) > 0 or feed_name in ("OpenAI News", "Anthropic News"):
+                        items.append(item)
+                        feed_item_count += 1
+                    if feed_item_count >= per_feed_limit:
+                        break
         except urllib.error.HTTPError as exc:
             errors.append(http_error_record("official", exc, feed_url, source_detail=feed_name))
-            continue
-        except Exception as exc:  # noqa: BLE001 - report per-source degradation.
-            errors.append({"source": "official", "sourceDetail": feed_name, "error": f"{type(exc).__name__}:{exc}"})
-            continue
-        try:
-            root = ET.fromstring(xml_bytes)
         except ET.ParseError as exc:
             errors.append({"source": "official", "sourceDetail": feed_name, "error": f"xml_parse_error:{exc}"})
-            continue
-        entries = parse_feed_entries(root)
-        feed_item_count = 0
-        for entry in entries:
-            published = entry.get("publishedAt")
-            if not item_in_window(published, args, slack_days=window_filter_slack_days(args)):
-                continue
-            title = normalize_space(entry.get("title"))
-            if not title:
-                continue
-            item = RadarItem(
-                source="official",
-                source_detail=feed_name,
-                title=title,
-                url=entry.get("url") or feed_url,
-                published_at=published,
-                summary=normalize_space(entry.get("summary"))[:320] or None,
-                engagement=0,
-                reason=f"official source: {feed_name}",
-                raw={"feed": feed_url},
-            )
-            if interest_match_score(item, args.topics) > 0 or feed_name in ("OpenAI News", "Anthropic News"):
-                items.append(item)
-                feed_item_count += 1
-            if feed_item_count >= per_feed_limit:
-                break
+        except Exception as exc:  # noqa: BLE001 - report per-source degradation.
+            errors.append({"source": "official", "sourceDetail": feed_name, "error": f"{type(exc).__name__}:{exc}"})
     for page_name, page_url, base_url in OFFICIAL_HTML_PAGES:
+        steps_left -= 1
         try:
-            html_bytes = http_get(
-                page_url,
-                args.timeout,
-                cache_ttl_seconds=args.cache_ttl_seconds,
-                cache_dir=args.cache_dir,
-                cache_events=args.cache_events,
-                refresh=args.refresh,
-                cache_context=args.cache_context,
-            )
+            html_bytes = fetch_body(page_url, args, budget_timeout(args, 1 / (steps_left + 1)), source="official")
         except urllib.error.HTTPError as exc:
             errors.append(http_error_record("official", exc, page_url, source_detail=page_name))
             continue
@@ -1221,27 +4155,137 @@ def fetch_official(args: argparse.Namespace, errors: list[dict[str, Any]]) -> li
 def fetch_news(args: argparse.Namespace, errors: list[dict[str, Any]]) -> list[RadarItem]:
     if args.news_provider == "google":
         return fetch_google_news_rss(args, errors, "Google News RSS selected")
-    query = build_topic_query(args.topics)
-    if " OR " in query:
-        query = f"({query})"
-    params = {
-        "query": query,
-        "mode": "artlist",
-        "format": "json",
-        "sort": "datedesc",
-        "maxrecords": str(args.limit),
-    }
-    if args.window_mode == "fixed":
-        params["startdatetime"] = format_gdelt_datetime(args.window_start_dt)
-        params["enddatetime"] = format_gdelt_datetime(args.window_end_dt - timedelta(seconds=1))
-    else:
-        params["timespan"] = f"{max(args.days, 1)}d"
-    url = f"https://api.gdeltproject.org/api/v2/doc/doc?{urllib.parse.urlencode(params)}"
+    if args.news_provider == "gdelt":
+        return fetch_gdelt(args, errors)
+    return fetch_news_race(args, errors)
+
+
+@dataclass(slots=True)
+class NewsLane:
+    """One provider in the `auto` news race, with its own errors and cancel scope."""
+
+    provider: str
+    scope: CancelScope = field(default_factory=CancelScope)
+    errors: list[dict[str, Any]] = field(default_factory=list)
+    future: Future[list[RadarItem]] | None = None
+    started: float | None = None
+    finished: float | None = None
+    cancelled: bool = False
+
+    def run(self, fetch: Callable[[list[dict[str, Any]]], list[RadarItem]]) -> list[RadarItem]:
+        token = CANCEL_SCOPE.set(self.scope)
+        try:
+            return fetch(self.errors)
+        except Exception as exc:  # noqa: BLE001 - a failed lane just loses the race.
+            self.errors.append({"source": "news", "error": f"unexpected_error:{type(exc).__name__}:{exc}"})
+            return []
+        finally:
+            if not self.cancelled:
+                self.finished = time.perf_counter()
+            CANCEL_SCOPE.reset(token)
+
+    def items(self) -> list[RadarItem]:
+        if self.cancelled or self.future is None or not self.future.done():
+            return []
+        return self.future.result()
+
+    def report(self, winner: str | None) -> dict[str, Any]:
+        if self.future is None or self.started is None:
+            return {"outcome": "not-started"}
+        done = self.future.done() and not self.cancelled
+        if self.provider == winner:
+            outcome = "won"
+        elif not done:
+            outcome = "cancelled"
+        elif self.items():
+            outcome = "lost"
+        else:
+            outcome = "failed" if self.errors else "empty"
+        elapsed = (self.finished if done and self.finished is not None else time.perf_counter()) - self.started
+        return {"outcome": outcome, "ms": round(elapsed * 1000, 3), "items": len(self.items())}
+
+
+def fetch_news_race(args: argparse.Namespace, errors: list[dict[str, Any]]) -> list[RadarItem]:
+    """`auto` news: start GDELT, hedge Google News after `--news-hedge-ms`, and keep GDELT when it lands in time.
+
+    GDELT wins if it returns items before Google News does, or within one hedge delay after
+    Google finishes; otherwise Google wins. The losing request is cancelled.
+    """
+    hedge = args.news_hedge_ms / 1000
+    gdelt, google = NewsLane("gdelt"), NewsLane("google")
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="radar-news")
+
+    def start(lane: NewsLane, fetch: Callable[[list[dict[str, Any]]], list[RadarItem]]) -> Future[list[RadarItem]]:
+        lane.started = time.perf_counter()
+        lane.future = executor.submit(contextvars.copy_context().run, lane.run, fetch)
+        return lane.future
+
+    winner: NewsLane | None = None
+    try:
+        gdelt_future = start(gdelt, lambda lane_errors: fetch_gdelt(args, lane_errors))
+        wait([gdelt_future], timeout=hedge)
+        if gdelt.items():
+            winner = gdelt
+        else:
+            google_future = start(google, lambda lane_errors: fetch_google_news_rss(args, lane_errors, "raced with GDELT"))
+            while winner is None:
+                if gdelt.items():
+                    winner = gdelt
+                elif google_future.done() and google.items():
+                    if not gdelt_future.done():
+                        wait([gdelt_future], timeout=hedge)
+                    winner = gdelt if gdelt.items() else google
+                elif gdelt_future.done() and google_future.done():
+                    break
+                else:
+                    wait([future for future in (gdelt_future, google_future) if not future.done()], return_when=FIRST_COMPLETED)
+        for lane in (gdelt, google):
+            if lane is not winner and lane.future is not None and not lane.future.done():
+                lane.cancelled = True
+                lane.finished = time.perf_counter()
+                lane.scope.cancel()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    args.news_race = {
+        "hedgeMs": args.news_hedge_ms,
+        "winner": winner.provider if winner is not None else None,
+        "providers": {lane.provider: lane.report(winner.provider if winner else None) for lane in (gdelt, google)},
+    }
+    if winner is gdelt:
+        return gdelt.items()
+    # GDELT failures stay visible, as they did when Google News was a serial fallback.
+    if not gdelt.cancelled:
+        errors.extend(gdelt.errors)
+    if winner is None:
+        errors.extend(google.errors)
+        return []
+    why = "GDELT slower" if gdelt.cancelled else "GDELT unavailable" if gdelt.errors else "GDELT returned no articles"
+    for item in google.items():
+        item.reason = f"{why}; matched Google News RSS"
+    return google.items()
+
+
+def fetch_gdelt(args: argparse.Namespace, errors: list[dict[str, Any]]) -> list[RadarItem]:
+    query = build_topic_query(args.topics)
+    if " OR " in query:
+        query = f"({query})"
+    params = {
+        "query": query,
+        "mode": "artlist",
+        "format": "json",
+        "sort": "datedesc",
+        "maxrecords": str(args.limit),
+    }
+    if args.window_mode == "fixed":
+        params["startdatetime"] = format_gdelt_datetime(args.window_start_dt)
+        params["enddatetime"] = format_gdelt_datetime(args.window_end_dt - timedelta(seconds=1))
+    else:
+        params["timespan"] = f"{max(args.days, 1)}d"
+    url = f"https://api.gdeltproject.org/api/v2/doc/doc?{urllib.parse.urlencode(params)}"
     payload = get_json(url, args.timeout, errors, "news", args)
     if not isinstance(payload, dict):
-        if args.news_provider == "gdelt":
-            return []
-        return fetch_google_news_rss(args, errors, "GDELT unavailable")
+        return []
     items: list[RadarItem] = []
     for article in payload.get("articles") or []:
         title = normalize_space(article.get("title"))
@@ -1265,12 +4309,8 @@ def fetch_news(args: argparse.Namespace, errors: list[dict[str, Any]]) -> list[R
                 "query": query,
             },
         )
-        if interest_match_score(item, args.topics) > 0 and item_in_window(item.published_at, args):
+        if interest_match_score(item, args.topics) > 0 and timestamp_in_window(item.published_ts, args):
             items.append(item)
-    if not items:
-        if args.news_provider == "gdelt":
-            return []
-        return fetch_google_news_rss(args, errors, "GDELT returned no articles")
     return items
 
 
@@ -1291,51 +4331,39 @@ def fetch_google_news_rss(
         "ceid": "US:en",
     }
     url = f"https://news.google.com/rss/search?{urllib.parse.urlencode(params)}"
+    items: list[RadarItem] = []
     try:
-        xml_bytes = http_get(
-            url,
-            args.timeout,
-            cache_ttl_seconds=args.cache_ttl_seconds,
-            cache_dir=args.cache_dir,
-            cache_events=args.cache_events,
-            refresh=args.refresh,
-            cache_context=args.cache_context,
-        )
+        with open_body_stream(url, args, source="news") as chunks:
+            for element in iter_xml_elements(chunks, FEED_ENTRY_TAGS):
+                entry = feed_entry(element)
+                title = normalize_space(entry.get("title"))
+                if not title:
+                    continue
+                published = entry.get("publishedAt")
+                if not item_in_window(published, args, slack_days=window_filter_slack_days(args)):
+                    continue
+                item = RadarItem(
+                    source="news",
+                    source_detail="Google News RSS",
+                    title=title,
+                    url=entry.get("url") or "",
+                    published_at=published,
+                    summary=normalize_space(entry.get("summary")) or None,
+                    engagement=0,
+                    reason=f"{fallback_reason}; matched Google News RSS",
+                    raw={"query": query},
+                )
+                if interest_match_score(item, args.topics) == 0:
+                    continue
+                items.append(item)
+                if len(items) >= args.limit:
+                    break
     except urllib.error.HTTPError as exc:
         errors.append(http_error_record("news", exc, url, source_detail="Google News RSS"))
-        return []
-    except Exception as exc:  # noqa: BLE001 - report per-source degradation.
-        errors.append({"source": "news", "sourceDetail": "Google News RSS", "error": f"{type(exc).__name__}:{exc}"})
-        return []
-    try:
-        root = ET.fromstring(xml_bytes)
     except ET.ParseError as exc:
         errors.append({"source": "news", "sourceDetail": "Google News RSS", "error": f"xml_parse_error:{exc}"})
-        return []
-    items: list[RadarItem] = []
-    for entry in parse_feed_entries(root):
-        title = normalize_space(entry.get("title"))
-        if not title:
-            continue
-        published = entry.get("publishedAt")
-        if not item_in_window(published, args, slack_days=window_filter_slack_days(args)):
-            continue
-        item = RadarItem(
-            source="news",
-            source_detail="Google News RSS",
-            title=title,
-            url=entry.get("url") or "",
-            published_at=published,
-            summary=normalize_space(entry.get("summary")) or None,
-            engagement=0,
-            reason=f"{fallback_reason}; matched Google News RSS",
-            raw={"query": query},
-        )
-        if interest_match_score(item, args.topics) == 0:
-            continue
-        items.append(item)
-        if len(items) >= args.limit:
-            break
+    except Exception as exc:  # noqa: BLE001 - report per-source degradation.
+        errors.append({"source": "news", "sourceDetail": "Google News RSS", "error": f"{type(exc).__name__}:{exc}"})
     return items
 
 
@@ -1344,39 +4372,35 @@ def child_text(node: ET.Element, path: str, ns: dict[str, str]) -> str:
     return child.text if child is not None and child.text else ""
 
 
-def parse_feed_entries(root: ET.Element) -> list[dict[str, str]]:
-    ns = {"atom": "http://www.w3.org/2005/Atom"}
-    entries: list[dict[str, str]] = []
-    for item in root.findall(".//item"):
-        link = child_text_no_ns(item, "link")
-        entries.append(
-            {
-                "title": child_text_no_ns(item, "title"),
-                "url": link,
-                "publishedAt": child_text_no_ns(item, "pubDate") or child_text_no_ns(item, "date"),
-                "summary": strip_html_text(child_text_no_ns(item, "description")),
-            }
-        )
-    for entry in root.findall("atom:entry", ns):
-        link = ""
-        for link_node in entry.findall("atom:link", ns):
-            if link_node.attrib.get("rel") in (None, "alternate"):
-                link = link_node.attrib.get("href", "")
-                break
-        entries.append(
-            {
-                "title": child_text(entry, "atom:title", ns),
-                "url": link,
-                "publishedAt": child_text(entry, "atom:published", ns) or child_text(entry, "atom:updated", ns),
-                "summary": strip_html_text(child_text(entry, "atom:summary", ns)),
-            }
-        )
-    return entries
+def feed_entry(element: ET.Element) -> dict[str, str]:
+    """Normalize one RSS `<item>` or Atom `<entry>` element."""
+    if element.tag == "item":
+        return {
+            "title": child_text_no_ns(element, "title"),
+            "url": child_text_no_ns(element, "link"),
+            "publishedAt": child_text_no_ns(element, "pubDate") or child_text_no_ns(element, "date"),
+            "summary": strip_html_text(child_text_no_ns(element, "description")),
+        }
+    ns = {"atom": ATOM_NS}
+    return {
+        "title": child_text(element, "atom:title", ns),
+        "url": atom_link(element, ns),
+        "publishedAt": child_text(element, "atom:published", ns) or child_text(element, "atom:updated", ns),
+        "summary": strip_html_text(child_text(element, "atom:summary", ns)),
+    }
+
+
+def atom_link(entry: ET.Element, ns: dict[str, str]) -> str:
+    for link_node in entry.findall("atom:link", ns):
+        if link_node.attrib.get("rel") in (None, "alternate"):
+            return link_node.attrib.get("href", "")
+    return ""
 
 
 def parse_official_page_links(html_text: str, href_prefix: str, base_url: str) -> list[dict[str, str]]:
     parser = LinkTextParser(href_prefix)
-    parser.feed(html_text)
+    with timed_parse("html"):
+        parser.feed(html_text)
     entries: list[dict[str, str]] = []
     seen: set[str] = set()
     for href, text in parser.links:
@@ -1463,6 +4487,14 @@ def format_number(value: float) -> str:
     return f"{value:.2f}"
 
 
+def format_age(seconds: float) -> str:
+    if seconds < 90:
+        return f"{seconds:.0f}s"
+    if seconds < 5400:
+        return f"{seconds / 60:.0f}m"
+    return f"{seconds / 3600:.1f}h"
+
+
 def parse_sources(value: str) -> list[str]:
     requested = [part.strip().lower() for part in value.split(",") if part.strip()]
     if not requested:
@@ -1555,10 +4587,146 @@ def gather(args: argparse.Namespace) -> tuple[list[RadarItem], dict[str, list[Ra
     errors: list[dict[str, Any]] = []
     if args.sample:
         items = [item for item in sample_items() if item.source in args.sources]
-        sections = group_by_source(items)
-        ranked = dedupe_and_rank(items, args.topics, args.days, args.window_reference_dt)
+        drop_raw_payloads(items, args)
+        with args.timings.span("rank", phase="rank"):
+            ranking = RadarRanking(
+                items,
+                args.topics,
+                args.days,
+                args.window_reference_dt,
+                near_dup=args.near_dup,
+                timings=args.timings,
+            )
+            ranked, sections = select_ranked(args, ranking, list(group_by_source(items)))
         return ranked, sections, errors
 
+    all_items: list[RadarItem] = []
+
+    def fetch_source(source: str) -> tuple[list[RadarItem], list[dict[str, Any]]]:
+        with timing_scope(args.timings, source):
+            return fetch_source_items(source, args)
+
+    unfinished: list[str] = []
+    args.run_deadline = RunDeadline(args.deadline_seconds) if args.deadline_seconds else None
+    with args.timings.span("fetch", phase="fetch"):
+        if args.run_deadline is not None:
+            results, unfinished = fetch_until_deadline(args, fetch_source)
+        elif args.jobs <= 1 or len(args.sources) <= 1:
+            results = [fetch_source(source) for source in args.sources]
+        else:
+            with ThreadPoolExecutor(max_workers=min(args.jobs, len(args.sources))) as executor:
+                results = list(executor.map(fetch_source, args.sources))
+
+    for source_items, source_errors in results:
+        drop_raw_payloads(source_items, args)
+        all_items.extend(source_items)
+        errors.extend(source_errors)
+    if args.run_deadline is not None:
+        errors = collapse_deadline_errors(args, errors, unfinished)
+    with args.timings.span("rank", phase="rank"):
+        ranking = RadarRanking(
+            all_items,
+            args.topics,
+            args.days,
+            args.window_reference_dt,
+            near_dup=args.near_dup,
+            timings=args.timings,
+        )
+        ranked, sections = select_ranked(args, ranking, args.sources)
+    return ranked, sections, errors
+
+
+def fetch_until_deadline(
+    args: argparse.Namespace,
+    fetch_source: Callable[[str], tuple[list[RadarItem], list[dict[str, Any]]]],
+) -> tuple[list[tuple[list[RadarItem], list[dict[str, Any]]]], list[str]]:
+    """Fetch sources in parallel, abandoning any still running once the run deadline passes.
+
+    Requests are already capped to the remaining budget; this is the hard stop for work that
+    is not (helpers, slow streamed reads). Open sockets are shut down so stragglers exit, and
+    the deadline is marked abandoned so they raise before writing the cache or history that
+    `close_run_state` is about to close. Sources run on daemon threads (at most `--jobs` at a
+    time), so a straggler cannot keep the process alive past the deadline.
+    """
+    deadline = args.run_deadline
+    gate = threading.BoundedSemaphore(max(1, min(args.jobs, len(args.sources))))
+    futures: dict[str, Future[tuple[list[RadarItem], list[dict[str, Any]]]]] = {
+        source: Future() for source in args.sources
+    }
+
+    def run(source: str) -> None:
+        future = futures[source]
+        with gate:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(fetch_source(source))
+            except BaseException as exc:  # noqa: BLE001 - handed to the waiting caller.
+                future.set_exception(exc)
+
+    for source in args.sources:
+        threading.Thread(target=run, args=(source,), name=f"radar-{source}", daemon=True).start()
+    done, _ = wait(futures.values(), timeout=max(0.0, deadline.remaining()) + DEADLINE_GRACE_SECONDS)
+    unfinished = [source for source, future in futures.items() if future not in done]
+    if unfinished:
+        deadline.abandon()
+        args.transport.abort()
+        for source in unfinished:
+            futures[source].cancel()
+    results = [futures[source].result() if source not in unfinished else ([], []) for source in args.sources]
+    return results, unfinished
+
+
+def collapse_deadline_errors(
+    args: argparse.Namespace,
+    errors: list[dict[str, Any]],
+    unfinished: list[str],
+) -> list[dict[str, Any]]:
+    """Replace per-request deadline failures with one `deadline_exceeded` record per affected source."""
+    skipped: dict[str, int] = {}
+    kept: list[dict[str, Any]] = []
+    for error in errors:
+        if "deadline_exceeded" in str(error.get("error", "")):
+            skipped[error["source"]] = skipped.get(error["source"], 0) + 1
+        else:
+            kept.append(error)
+    affected = [source for source in args.sources if source in skipped or source in unfinished]
+    for source in affected:
+        kept.append(
+            {
+                "source": source,
+                "error": "deadline_exceeded",
+                "deadlineSeconds": args.deadline_seconds,
+                "requests": skipped.get(source, 0),
+                "incomplete": source in unfinished,
+            }
+        )
+    args.deadline_report = {
+        "seconds": args.deadline_seconds,
+        "exceeded": bool(affected),
+        "sources": affected,
+        "unfinished": unfinished,
+    }
+    return kept
+
+
+def select_ranked(
+    args: argparse.Namespace,
+    ranking: RadarRanking,
+    sources: list[str],
+) -> tuple[list[RadarItem], dict[str, list[RadarItem]]]:
+    """Top items and per-source sections; with a delta state, only new or re-ranked items qualify."""
+    args.near_duplicate_merges = ranking.near_duplicate_merges
+    where = args.delta_state.accepts if args.delta_state is not None else None
+    sections = {source: ranking.section(source, args.limit, where) for source in sources}
+    ranked = ranking.top(args.limit, where)
+    if args.delta_state is not None:
+        args.delta_state.note_emitted([*ranked, *(item for items in sections.values() for item in items)])
+    return ranked, sections
+
+
+def fetch_source_items(source: str, args: argparse.Namespace) -> tuple[list[RadarItem], list[dict[str, Any]]]:
+    """Fetch one source for `args`, isolating unexpected failures into its error list."""
     fetchers = {
         "polymarket": fetch_polymarket,
         "hn": fetch_hn,
@@ -1568,32 +4736,23 @@ def gather(args: argparse.Namespace) -> tuple[list[RadarItem], dict[str, list[Ra
         "official": fetch_official,
         "news": fetch_news,
     }
-    all_items: list[RadarItem] = []
-    sections: dict[str, list[RadarItem]] = {source: [] for source in args.sources}
+    source_errors: list[dict[str, Any]] = []
+    if args.sample:
+        return [item for item in sample_items() if item.source == source], source_errors
+    try:
+        if args.history_store is not None:
+            return fetch_with_history(source, fetchers[source], args, source_errors), source_errors
+        return fetchers[source](args, source_errors), source_errors
+    except Exception as exc:  # noqa: BLE001 - isolate per-source failures.
+        source_errors.append({"source": source, "error": f"unexpected_error:{type(exc).__name__}:{exc}"})
+        return [], source_errors
 
-    def fetch_source(source: str) -> tuple[str, list[RadarItem], list[dict[str, Any]]]:
-        source_errors: list[dict[str, Any]] = []
-        try:
-            return source, fetchers[source](args, source_errors), source_errors
-        except Exception as exc:  # noqa: BLE001 - isolate per-source failures.
-            source_errors.append({"source": source, "error": f"unexpected_error:{type(exc).__name__}:{exc}"})
-            return source, [], source_errors
 
-    if args.jobs <= 1 or len(args.sources) <= 1:
-        results = [fetch_source(source) for source in args.sources]
-    else:
-        results = []
-        with ThreadPoolExecutor(max_workers=min(args.jobs, len(args.sources))) as executor:
-            future_to_source = {executor.submit(fetch_source, source): source for source in args.sources}
-            for future in as_completed(future_to_source):
-                results.append(future.result())
-
-    for source, source_items, source_errors in results:
-        sections[source] = dedupe_and_rank(source_items, args.topics, args.days, args.window_reference_dt)
-        all_items.extend(source_items)
-        errors.extend(source_errors)
-    ranked = dedupe_and_rank(all_items, args.topics, args.days, args.window_reference_dt)
-    return ranked, sections, errors
+def drop_raw_payloads(items: list[RadarItem], args: argparse.Namespace) -> None:
+    if args.raw:
+        return
+    for item in items:
+        item.raw = {}
 
 
 def group_by_source(items: list[RadarItem]) -> dict[str, list[RadarItem]]:
@@ -1617,11 +4776,7 @@ def item_search_text(item: RadarItem) -> str:
 
 
 def classify_brief_cluster(item: RadarItem) -> str:
-    haystack = item_search_text(item)
-    for cluster_name, keywords in BRIEF_CLUSTERS:
-        if any(keyword in haystack for keyword in keywords):
-            return cluster_name
-    return OTHER_BRIEF_CLUSTER
+    return compile_matcher(()).brief_cluster(item)
 
 
 def build_brief_clusters(args: argparse.Namespace, ranked: list[RadarItem]) -> list[dict[str, Any]]:
@@ -1643,16 +4798,31 @@ def cache_metadata(args: argparse.Namespace) -> dict[str, Any]:
     for event in events:
         status = str(event.get("status") or "unknown")
         counts[status] = counts.get(status, 0) + 1
+    stale_served = [
+        {key: event[key] for key in ("host", "path", "ageSeconds", "reason") if key in event}
+        for event in events
+        if event.get("status") == "stale-served"
+    ]
     return {
         "enabled": bool(args.cache_ttl_seconds and not args.sample),
         "ttlMinutes": args.cache_ttl_minutes,
         "refresh": args.refresh,
+        "policy": args.cache_policy,
+        "staleGraceMinutes": args.cache_stale_grace_minutes,
+        "stale": bool(stale_served),
+        "staleServed": stale_served,
         "events": counts,
+        "transfer": transfer_metadata(getattr(args, "transport", None)),
     }
 
 
+def transfer_metadata(transport: HttpTransport | None) -> dict[str, int]:
+    stats = transport.stats if transport is not None else {}
+    return {"wireBytes": stats.get("wireBytes", 0), "bodyBytes": stats.get("bodyBytes", 0)}
+
+
 def window_metadata(args: argparse.Namespace) -> dict[str, Any]:
-    return {
+    metadata = {
         "mode": args.window_mode,
         "label": args.window_label,
         "start": args.window_start_dt.date().isoformat(),
@@ -1660,6 +4830,19 @@ def window_metadata(args: argparse.Namespace) -> dict[str, Any]:
         "days": args.days,
         "complete": args.window_complete,
     }
+    backfill = getattr(args, "arxiv_backfill", None)
+    if backfill is not None:
+        metadata["arxivBackfill"] = backfill
+    return metadata
+
+
+def ranking_metadata(args: argparse.Namespace) -> dict[str, Any]:
+    return {
+        "mode": "heuristic",
+        "note": "Score combines source weight, engagement, recency, topic match, and cross-source duplication.",
+        "nearDuplicates": args.near_dup,
+        "nearDuplicateMerges": getattr(args, "near_duplicate_merges", 0),
+    }
 
 
 def render_json(
@@ -1680,34 +4863,116 @@ def render_json(
         "topics": args.topics,
         "sources": args.sources,
         "newsProvider": args.news_provider,
-        "ranking": {
-            "mode": "heuristic",
-            "note": "Score combines source weight, engagement, recency, topic match, and cross-source duplication.",
-        },
+        "ranking": ranking_metadata(args),
         "brief": {
             "enabled": args.brief,
             "clusters": [
-                {"name": cluster["name"], "items": [item.to_json() for item in cluster["items"]]}
+                {"name": cluster["name"], "items": [item.to_json(include_raw=args.raw) for item in cluster["items"]]}
                 for cluster in build_brief_clusters(args, ranked)
             ]
             if args.brief
             else [],
         },
         "cache": cache_metadata(args),
-        "items": [item.to_json() for item in ranked[: args.limit]],
+        "history": history_metadata(args),
+        "delta": delta_metadata(args),
+        "timings": args.timings.metadata(),
+        "items": [item.to_json(include_raw=args.raw) for item in ranked[: args.limit]],
         "sections": {
-            source: [
-                item.to_json()
-                for item in dedupe_and_rank(items, args.topics, args.days, args.window_reference_dt)[: args.limit]
-            ]
+            source: [item.to_json(include_raw=args.raw) for item in items[: args.limit]]
             for source, items in sections.items()
         },
         "errors": errors,
         "sample": args.sample,
     }
+    data_age = getattr(args, "data_age", None)
+    if data_age is not None:
+        payload["dataAge"] = data_age
+    if args.rate_limiter is not None and args.rate_limiter.report:
+        payload["rateLimits"] = args.rate_limiter.metadata()
+    if args.news_race is not None:
+        payload["newsRace"] = args.news_race
+    if args.deadline_report is not None:
+        payload["deadline"] = args.deadline_report
+    if isinstance(args.transport, ArchiveTransport):
+        payload["recording"] = args.transport.metadata()
     return json.dumps(payload, indent=2, sort_keys=True)
 
 
+def iter_ndjson_records(
+    args: argparse.Namespace,
+    ranked: list[RadarItem],
+    sections: dict[str, list[RadarItem]],
+    errors: list[dict[str, Any]],
+) -> Iterator[dict[str, Any]]:
+    """Yield the report as flat records: items first, then trailers ending with `summary`.
+
+    Item records are built one at a time so a consumer can start on rank 1 while later
+    records are still being serialized; the closing `summary` record marks a complete report.
+    """
+    top = ranked[: args.limit]
+    for rank, item in enumerate(top, start=1):
+        yield {"type": "item", "rank": rank, "item": item.to_json(include_raw=args.raw)}
+    for source, items in sections.items():
+        for rank, item in enumerate(items[: args.limit], start=1):
+            yield {"type": "section", "source": source, "rank": rank, "item": item.to_json(include_raw=args.raw)}
+    if args.brief:
+        ranks = {id(item): rank for rank, item in enumerate(top, start=1)}
+        for cluster in build_brief_clusters(args, ranked):
+            yield {"type": "brief", "cluster": cluster["name"], "ranks": [ranks[id(item)] for item in cluster["items"]]}
+    for error in errors:
+        yield {"type": "error", **error}
+    yield {"type": "cache", **cache_metadata(args)}
+    yield {"type": "history", **history_metadata(args)}
+    yield {"type": "delta", **delta_metadata(args)}
+    yield {"type": "timings", **args.timings.metadata()}
+    yield {"type": "window", **window_metadata(args)}
+    data_age = getattr(args, "data_age", None)
+    if data_age is not None:
+        yield {"type": "dataAge", "sources": data_age}
+    if args.rate_limiter is not None and args.rate_limiter.report:
+        yield {"type": "rateLimits", "hosts": args.rate_limiter.metadata()}
+    if args.news_race is not None:
+        yield {"type": "newsRace", **args.news_race}
+    if args.deadline_report is not None:
+        yield {"type": "deadline", **args.deadline_report}
+    if isinstance(args.transport, ArchiveTransport):
+        yield {"type": "recording", **args.transport.metadata()}
+    yield {
+        "type": "summary",
+        "ok": not any(error.get("unsafe") for error in errors),
+        "version": VERSION,
+        "preset": args.preset,
+        "profile": args.profile,
+        "report": args.report,
+        "windowDays": args.days,
+        "generatedAt": iso_now(),
+        "topics": args.topics,
+        "sources": args.sources,
+        "newsProvider": args.news_provider,
+        "ranking": ranking_metadata(args),
+        "items": len(top),
+        "sections": {source: len(items[: args.limit]) for source, items in sections.items()},
+        "errors": len(errors),
+        "sample": args.sample,
+    }
+
+
+def write_ndjson(
+    args: argparse.Namespace,
+    ranked: list[RadarItem],
+    sections: dict[str, list[RadarItem]],
+    errors: list[dict[str, Any]],
+    stream: IO[str],
+) -> None:
+    for record in iter_ndjson_records(args, ranked, sections, errors):
+        stream.write(json.dumps(record, separators=(",", ":"), ensure_ascii=False))
+        stream.write("\n")
+        if record["type"] == "item":
+            stream.flush()
+    stream.flush()
+
+
 def render_markdown(
     args: argparse.Namespace,
     ranked: list[RadarItem],
@@ -1729,6 +4994,29 @@ def render_markdown(
         "- Ranking: heuristic source weight + engagement + recency + topic match + cross-source bonus",
         "",
     ]
+    if args.history_store is not None:
+        lines.insert(-2, f"- History: {render_history_line(args)}")
+    if args.delta_state is not None:
+        lines.insert(-2, f"- Delta: {render_delta_line(args)}")
+    data_age = getattr(args, "data_age", None)
+    if data_age is not None:
+        ages = ", ".join(f"{source} {format_age(entry['ageSeconds'])}" for source, entry in data_age.items())
+        lines.insert(-2, f"- Data age: {ages}")
+    if args.rate_limiter is not None and args.rate_limiter.report:
+        lines.insert(-2, f"- Rate limits: {render_rate_limit_line(args.rate_limiter.metadata())}")
+    if args.news_race is not None:
+        lines.insert(-2, f"- News race: {render_news_race_line(args.news_race)}")
+    if args.deadline_report is not None:
+        report = args.deadline_report
+        exceeded = f"exceeded for {', '.join(report['sources'])}" if report["exceeded"] else "met"
+        lines.insert(-2, f"- Deadline: {report['seconds']:g}s, {exceeded}")
+    if isinstance(args.transport, ArchiveTransport):
+        recording = args.transport.metadata()
+        lines.insert(
+            -2,
+            f"- Recording: {recording['mode']} `{recording['dir']}` at {recording['recordedAt']}, "
+            f"{recording['exchanges']} exchange(s), {recording['misses']} miss(es)",
+        )
     if args.brief:
         lines.extend(render_brief_markdown(args, ranked))
     lines.extend(["## Top Signals", ""])
@@ -1745,7 +5033,7 @@ def render_markdown(
         if not section_items:
             lines.append("- No matching signals.")
         else:
-            for item in dedupe_and_rank(section_items, args.topics, args.days, args.window_reference_dt)[: args.limit]:
+            for item in section_items[: args.limit]:
                 lines.append(render_item_bullet(item))
         lines.append("")
 
@@ -1769,9 +5057,38 @@ def render_markdown(
             "- Follow source links before treating an item as confirmed-current.",
         ]
     )
+    if args.timings_footer:
+        lines.extend(["", *render_timings_markdown(args)])
     return "\n".join(lines)
 
 
+def render_timings_markdown(args: argparse.Namespace, slowest: int = 5) -> list[str]:
+    report = args.timings.metadata()
+    phases = ", ".join(f"{phase} {format_ms(value)}" for phase, value in report["phases"].items())
+    lines = ["## Timings", "", f"- Total: {format_ms(report['totalMs'])}" + (f" ({phases})" if phases else "")]
+    for source, entry in report["sources"].items():
+        parts = [f"{format_ms(entry[key])} {label}" for key, label in TIMING_LABELS if key in entry]
+        if entry.get("requests"):
+            parts.append(f"{entry['requests']} request(s)")
+        if entry.get("wireBytes"):
+            parts.append(f"{format_number(float(entry['wireBytes']))}B on the wire")
+        cache = ", ".join(f"{status} {count}" for status, count in sorted(entry.get("cache", {}).items()))
+        if cache:
+            parts.append(f"cache {cache}")
+        lines.append(f"- `{source}`: {', '.join(parts)}")
+    for record in report["requests"][:slowest]:
+        phases = ", ".join(
+            f"{phase} {format_ms(record[f'{phase}Ms'])}" for phase in ("dns", "connect", "tls", "ttfb") if f"{phase}Ms" in record
+        )
+        detail = f" ({phases})" if phases else ""
+        lines.append(f"  - slow: `{record['host']}{record['path']}` {record['cache']} {format_ms(record['totalMs'])}{detail}")
+    return lines
+
+
+def format_ms(value: float) -> str:
+    return f"{value / 1000:.2f}s" if value >= 1000 else f"{value:.0f}ms"
+
+
 def render_cache_line(args: argparse.Namespace) -> str:
     metadata = cache_metadata(args)
     if not metadata["enabled"]:
@@ -1783,6 +5100,42 @@ def render_cache_line(args: argparse.Namespace) -> str:
     return f"enabled, ttl {metadata['ttlMinutes']} minute(s), {counts}"
 
 
+def render_history_line(args: argparse.Namespace) -> str:
+    report = history_metadata(args)["sources"]
+    covered = sum(entry["coveredDays"] for entry in report.values())
+    fetched = sum(entry["fetchedDays"] for entry in report.values())
+    stored = sum(entry.get("fromHistory", 0) for entry in report.values())
+    return f"{covered} source-day(s) answered locally, {fetched} fetched, {stored} item(s) from history"
+
+
+def render_rate_limit_line(hosts: dict[str, dict[str, Any]]) -> str:
+    parts = []
+    for host, entry in hosts.items():
+        counts = [f"{int(entry[name])} {name}" for name in ("throttled", "retries", "waits", "rejected") if entry.get(name)]
+        if entry.get("waitedMs"):
+            counts.append(f"waited {format_ms(entry['waitedMs'])}")
+        if "remaining" in entry:
+            counts.append(f"{entry['remaining']} remaining")
+        parts.append(f"{host} ({', '.join(counts)})")
+    return "; ".join(parts)
+
+
+def render_news_race_line(race: dict[str, Any]) -> str:
+    lanes = []
+    for provider, lane in race["providers"].items():
+        timing = f" {format_ms(lane['ms'])}" if "ms" in lane else ""
+        lanes.append(f"{provider} {lane['outcome']}{timing}")
+    return f"{race['winner'] or 'no provider'} won ({', '.join(lanes)}; hedge {race['hedgeMs']}ms)"
+
+
+def render_delta_line(args: argparse.Namespace) -> str:
+    report = delta_metadata(args)
+    return (
+        f"{report['new']} new, {report['rescored']} re-ranked, "
+        f"{report['suppressed']} already delivered (`{report['stateFile']}`)"
+    )
+
+
 def render_brief_markdown(args: argparse.Namespace, ranked: list[RadarItem]) -> list[str]:
     lines = ["## Brief", ""]
     clusters = build_brief_clusters(args, ranked)
@@ -1826,16 +5179,20 @@ def truncate(value: str | None, limit: int) -> str:
 
 
 def short_date(value: str | None) -> str:
-    parsed = parse_iso_datetime(value)
-    if parsed is None:
+    published_ts = published_epoch(value)
+    if published_ts is None:
         return "unknown-date"
-    return parsed.date().isoformat()
+    return datetime.fromtimestamp(published_ts, UTC).date().isoformat()
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="topic-radar.sh",
         description="Read-only AI/technology trend radar from multiple public sources.",
+        epilog=(
+            "Subcommands: `cache stats|prune|clear` inspects and maintains the public-response cache; "
+            "`bench items|pipeline` runs offline benchmarks; `serve` answers reports from memory over local HTTP."
+        ),
     )
     parser.add_argument(
         "--preset",
@@ -1868,15 +5225,46 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--to", dest="date_to", help="Fixed window end date in YYYY-MM-DD, inclusive.")
     parser.add_argument("--month", help="Fixed calendar month window in YYYY-MM.")
     parser.add_argument("--limit", type=int, help="Maximum items per source and top section. Defaults to the preset.")
-    parser.add_argument("--format", choices=["markdown", "json"], default="markdown", help="Output format.")
+    parser.add_argument(
+        "--format",
+        choices=["markdown", "json", "ndjson"],
+        default="markdown",
+        help="Output format. ndjson writes one compact record per item, then error/cache/history/window/summary trailers.",
+    )
+    parser.add_argument(
+        "--near-dup",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Merge near-duplicate stories across sources by title similarity (MinHash/LSH). Defaults to on.",
+    )
+    parser.add_argument(
+        "--raw",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Keep per-item upstream `raw` payloads. Defaults to on for JSON output and off for Markdown.",
+    )
     parser.add_argument("--timeout", type=int, help="Per-request timeout in seconds. Defaults to the preset.")
+    parser.add_argument(
+        "--deadline",
+        dest="deadline_seconds",
+        type=float,
+        metavar="SECONDS",
+        help=(
+            "Cap the whole fetch phase at SECONDS. Request timeouts shrink to the remaining budget, sources still "
+            "running are cancelled, and partial results are returned with `deadline_exceeded` errors."
+        ),
+    )
     parser.add_argument(
         "--brief",
         action=argparse.BooleanOptionalAction,
         default=None,
         help="Include clustered brief output. Defaults to the preset.",
     )
-    parser.add_argument("--jobs", type=int, help="Maximum parallel source fetches. Defaults to the source count.")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Maximum parallel source fetches and in-flight upstream requests. Defaults to the source count.",
+    )
     parser.add_argument(
         "--cache-ttl-minutes",
         type=int,
@@ -1887,6 +5275,90 @@ def build_parser() -> argparse.ArgumentParser:
         choices=["auto", "gdelt", "google"],
         help="News provider strategy. Defaults to the preset.",
     )
+    parser.add_argument(
+        "--news-hedge-ms",
+        type=int,
+        default=NEWS_HEDGE_MS,
+        help="With --news-provider auto, start Google News this long after GDELT if GDELT has not answered. 0 races both.",
+    )
+    parser.add_argument(
+        "--cache-policy",
+        choices=list(CACHE_POLICIES),
+        default="strict",
+        help=(
+            "Expired-entry handling: strict refetches, stale-if-error serves the stale body when the upstream fails, "
+            "stale-while-revalidate serves it immediately and refreshes in the background."
+        ),
+    )
+    parser.add_argument(
+        "--cache-stale-grace-minutes",
+        type=int,
+        default=DEFAULT_STALE_GRACE_MINUTES,
+        help="How long past the TTL a stale entry may still be served by the stale cache policies.",
+    )
+    parser.add_argument(
+        "--cache-backend",
+        choices=list(CACHE_BACKENDS),
+        help="Cache storage: per-URL files or a single WAL-mode SQLite file. Defaults to $TOPIC_RADAR_CACHE_BACKEND or file.",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=DEFAULT_CACHE_MAX_MB,
+        help="Cache size budget enforced with LRU eviction after each run. 0 disables the size bound.",
+    )
+    parser.add_argument(
+        "--cache-max-age-days",
+        type=int,
+        default=DEFAULT_CACHE_MAX_AGE_DAYS,
+        help="Evict cache entries fetched more than this many days ago after each run. 0 disables the age bound.",
+    )
+    parser.add_argument(
+        "--history",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=(
+            "Record every item in a local SQLite history store and answer longer windows from covered days, "
+            "fetching only missing slices. Defaults to $TOPIC_RADAR_HISTORY."
+        ),
+    )
+    parser.add_argument("--history-db", help="Item history database path. Defaults to the XDG state dir.")
+    parser.add_argument(
+        "--timings",
+        dest="timings_footer",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Append a per-source and slowest-request timing footer to Markdown output (JSON always has `timings`).",
+    )
+    parser.add_argument(
+        "--profile-run",
+        metavar="PATH",
+        help="Write a Chrome trace (also loadable in Perfetto and speedscope) of the whole gather to PATH.",
+    )
+    parser.add_argument(
+        "--since-last-run",
+        action="store_true",
+        help="Only emit items not delivered by a previous run of this profile and preset, or re-ranked since.",
+    )
+    parser.add_argument(
+        "--state-file",
+        help="Delivered-items state file for --since-last-run (implies it). Defaults to the XDG state dir.",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="DIR",
+        help="Record every upstream request and response into DIR for --replay. Disables the cache and history.",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="Serve upstream responses from a --record archive with no network, at the recorded clock.",
+    )
+    parser.add_argument(
+        "--replay-timing",
+        action="store_true",
+        help="With --replay, wait for each response's recorded wall time instead of answering immediately.",
+    )
     parser.add_argument("--refresh", action="store_true", help="Bypass existing cache entries and rewrite them.")
     parser.add_argument("--no-cache", action="store_true", help="Disable public response caching for this run.")
     parser.add_argument("--sample", action="store_true", help="Emit deterministic sample data without network calls.")
@@ -1894,12 +5366,26 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def normalize_args(argv: list[str]) -> argparse.Namespace:
+def normalize_args(argv: list[str], runtime: argparse.Namespace | None = None) -> argparse.Namespace:
+    """Parse and validate radar options; `runtime` shares another run's transport, scheduler, and stores."""
     parser = build_parser()
     args = parser.parse_args(argv)
     if args.version:
         print(VERSION)
         raise SystemExit(0)
+    args.argv = list(argv)
+    if args.record and args.replay:
+        raise UsageError("--record and --replay cannot be combined")
+    if args.replay_timing and not args.replay:
+        raise UsageError("--replay-timing requires --replay")
+    if (args.record or args.replay) and args.sample:
+        raise UsageError("--record and --replay cannot be combined with --sample")
+    args.archived = bool(args.record or args.replay)
+    if args.archived:
+        args.history = False
+        if runtime is None:
+            replay_manifest = read_recording_manifest(Path(args.replay).expanduser()) if args.replay else None
+            freeze_clock(replay_manifest["recordedAtDt"] if replay_manifest else now_utc().replace(microsecond=0))
     requested_preset = normalize_space(args.preset).lower()
     args.preset = PRESET_ALIASES.get(requested_preset, requested_preset)
     if args.preset not in PRESETS:
@@ -1924,32 +5410,842 @@ def normalize_args(argv: list[str]) -> argparse.Namespace:
         args.timeout = int(preset["timeout"])
     if args.brief is None:
         args.brief = bool(preset["brief"])
+    if args.raw is None:
+        args.raw = args.format in {"json", "ndjson"}
+    if args.news_provider is None:
+        args.news_provider = str(preset["news_provider"])
     if args.jobs is None:
-        args.jobs = min(max(len(args.sources), 1), 6)
+        # The auto news race keeps GDELT and a hedged Google News request in flight together.
+        hedged = 1 if "news" in args.sources and args.news_provider == "auto" else 0
+        args.jobs = min(max(len(args.sources) + hedged, 1), 6)
     cache_ttl_minutes = args.cache_ttl_minutes
     if cache_ttl_minutes is None:
         cache_ttl_minutes = int(preset["cache_ttl_minutes"])
-    if args.no_cache or args.sample:
+    if args.no_cache or args.sample or args.archived:
         cache_ttl_minutes = 0
     args.cache_ttl_minutes = cache_ttl_minutes
     args.cache_ttl_seconds = cache_ttl_minutes * 60
-    args.cache_dir = default_cache_dir()
     args.cache_events = []
-    if args.news_provider is None:
-        args.news_provider = str(preset["news_provider"])
+    args.cache_stale_grace_seconds = args.cache_stale_grace_minutes * 60
+    if args.history is None:
+        args.history = default_history_enabled()
+    args.history_report = {}
+    args.timings = RunTimings(trace=bool(args.profile_run))
+    args.run_deadline = None
+    args.deadline_report = None
+    args.news_race = None
+    args.since_last_run = args.since_last_run or bool(args.state_file)
+    state_path = Path(args.state_file).expanduser() if args.state_file else default_delta_state_path(args)
+    # Sample items are synthetic; recording them would suppress or pollute the next real run.
+    args.delta_state = DeltaState(state_path) if args.since_last_run and runtime is None and not args.sample else None
+    if runtime is None:
+        open_run_state(args)
+    else:
+        for name in RUN_STATE_FIELDS:
+            setattr(args, name, getattr(runtime, name))
     if args.days < 1 or args.days > 31:
         raise UsageError("--days must be between 1 and 31")
     if args.limit < 1 or args.limit > 50:
         raise UsageError("--limit must be between 1 and 50")
     if args.timeout < 1 or args.timeout > 120:
         raise UsageError("--timeout must be between 1 and 120")
+    if args.news_hedge_ms < 0 or args.news_hedge_ms > 60000:
+        raise UsageError("--news-hedge-ms must be between 0 and 60000")
+    if args.deadline_seconds is not None and not 1 <= args.deadline_seconds <= 600:
+        raise UsageError("--deadline must be between 1 and 600 seconds")
     if args.jobs < 1 or args.jobs > 16:
         raise UsageError("--jobs must be between 1 and 16")
     if args.cache_ttl_minutes < 0 or args.cache_ttl_minutes > 1440:
         raise UsageError("--cache-ttl-minutes must be between 0 and 1440")
+    if args.cache_stale_grace_minutes < 0 or args.cache_stale_grace_minutes > 10080:
+        raise UsageError("--cache-stale-grace-minutes must be between 0 and 10080")
+    validate_cache_bounds(args)
+    return args
+
+
+RUN_STATE_FIELDS = (
+    "cache_dir",
+    "cache_backend",
+    "cache_store",
+    "transport",
+    "scheduler",
+    "background",
+    "history_store",
+    "rate_limiter",
+    "response_memo",
+)
+
+
+def open_run_state(args: argparse.Namespace) -> None:
+    args.cache_dir = default_cache_dir()
+    args.cache_backend = args.cache_backend or default_cache_backend()
+    args.cache_store = open_cache_store(args.cache_backend, args.cache_dir)
+    args.transport = open_transport(args)
+    args.rate_limiter = None if args.replay else RateLimiter(args.cache_dir / RATE_LIMIT_FILE)
+    args.transport.rate_limiter = args.rate_limiter
+    args.response_memo = None
+    args.scheduler = RequestScheduler(args.jobs)
+    args.background = BackgroundRefresher()
+    history_path = Path(args.history_db).expanduser() if args.history_db else default_state_dir() / HISTORY_FILE
+    args.history_store = ItemHistoryStore(history_path) if args.history and not args.sample else None
+
+
+def open_transport(args: argparse.Namespace) -> HttpTransport:
+    if args.replay:
+        return ReplayTransport(Path(args.replay).expanduser(), pace=args.replay_timing)
+    if args.record:
+        return RecordingTransport(Path(args.record).expanduser(), args.argv)
+    return HttpTransport()
+
+
+def close_run_state(args: argparse.Namespace) -> None:
+    args.background.drain()
+    args.transport.close()
+    if args.archived:
+        freeze_clock(None)
+    maintain_cache(args)
+    args.cache_store.close()
+    if args.history_store is not None:
+        args.history_store.close()
+
+
+def validate_cache_bounds(args: argparse.Namespace) -> None:
+    if args.cache_max_mb < 0 or args.cache_max_mb > 102400:
+        raise UsageError("--cache-max-mb must be between 0 and 102400")
+    if args.cache_max_age_days < 0 or args.cache_max_age_days > 3650:
+        raise UsageError("--cache-max-age-days must be between 0 and 3650")
+
+
+def build_cache_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="topic-radar.sh cache",
+        description="Inspect and maintain the topic-radar public-response cache.",
+    )
+    parser.add_argument("action", choices=["stats", "prune", "clear"], help="Cache maintenance action.")
+    parser.add_argument("--cache-dir", help="Cache directory. Defaults to $XDG_CACHE_HOME/agent-kit/topic-radar.")
+    parser.add_argument(
+        "--cache-backend",
+        choices=list(CACHE_BACKENDS),
+        help="Cache storage to inspect. Defaults to $TOPIC_RADAR_CACHE_BACKEND or file.",
+    )
+    parser.add_argument("--host", help="Limit stats to entries for this host, or prune every entry for it.")
+    parser.add_argument("--cache-max-mb", type=int, default=DEFAULT_CACHE_MAX_MB, help="Size budget used by prune.")
+    parser.add_argument(
+        "--cache-max-age-days",
+        type=int,
+        default=DEFAULT_CACHE_MAX_AGE_DAYS,
+        help="Age bound used by prune.",
+    )
+    parser.add_argument("--format", choices=["markdown", "json"], default="markdown", help="Output format.")
+    return parser
+
+
+def cache_main(argv: list[str]) -> int:
+    try:
+        args = build_cache_parser().parse_args(argv)
+        validate_cache_bounds(args)
+    except UsageError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+    except SystemExit as exc:
+        return int(exc.code or 0)
+    cache_dir = Path(args.cache_dir) if args.cache_dir else default_cache_dir()
+    store = open_cache_store(args.cache_backend or default_cache_backend(), cache_dir)
+    try:
+        if args.action == "clear":
+            result: dict[str, Any] = {"action": "clear", **clear_cache(store)}
+        elif args.action == "prune":
+            pruned = prune_cache(
+                store,
+                max_bytes=args.cache_max_mb * 1024 * 1024,
+                max_age_seconds=args.cache_max_age_days * 86400,
+                host=args.host,
+            )
+            result = {"action": "prune", **pruned}
+        else:
+            result = {"action": "stats", **cache_stats(store, host=args.host)}
+    finally:
+        store.close()
+    if args.format == "json":
+        print(json.dumps(result, indent=2, sort_keys=True))
+    else:
+        print(render_cache_report(store, result))
+    return 0
+
+
+def render_cache_report(store: CacheStore, result: dict[str, Any]) -> str:
+    lines = [
+        f"# Topic Radar Cache {result['action'].title()}",
+        "",
+        f"- Cache: `{store.location}` ({store.backend})",
+    ]
+    if result["action"] != "stats":
+        lines.append(f"- Removed entries: {result['removed']}")
+        lines.append(f"- Freed: {format_number(float(result['freedBytes']))}B")
+        lines.append(f"- Remaining: {format_number(float(result['remainingBytes']))}B")
+        return "\n".join(lines)
+    hit_rate = result["hitRate"]
+    lines.extend(
+        [
+            f"- Entries: {result['entries']}",
+            f"- Size: {format_number(float(result['bytes']))}B",
+            f"- Runs recorded: {result['runs']}",
+            f"- Hit rate: {'n/a' if hit_rate is None else f'{hit_rate * 100:.1f}%'}",
+            "",
+            "## Hosts",
+            "",
+        ]
+    )
+    if not result["hosts"]:
+        lines.append("- No cached entries.")
+    for host, bucket in result["hosts"].items():
+        lines.append(f"- `{host}`: {bucket['entries']} entries, {format_number(float(bucket['bytes']))}B")
+    for entry in result.get("hostEntries") or []:
+        source = f" `{entry['source']}`" if entry.get("source") else ""
+        lines.append(f"  - {entry['url'] or entry['key']}{source} | {format_number(float(entry['bytes']))}B")
+    return "\n".join(lines)
+
+
+def build_bench_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="topic-radar.sh bench",
+        description="Offline micro-benchmarks for topic-radar hot paths. No network access.",
+    )
+    parser.add_argument(
+        "suite",
+        choices=["items", "pipeline"],
+        help="items measures per-item CPU and memory; pipeline replays upstream fixtures through fetch, parse, rank, render.",
+    )
+    parser.add_argument("--count", type=int, default=10000, help="Synthetic items per measurement (items suite).")
+    parser.add_argument(
+        "--counts",
+        default="100,1000",
+        help="Comma-separated records per upstream response (pipeline suite).",
+    )
+    parser.add_argument("--latency-ms", type=int, default=20, help="Replay server delay per response (pipeline suite).")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per count; the fastest is reported (pipeline suite).")
+    parser.add_argument("--format", choices=["markdown", "json"], default="markdown", help="Output format.")
+    return parser
+
+
+def bench_main(argv: list[str]) -> int:
+    try:
+        args = build_bench_parser().parse_args(argv)
+        if args.count < 1 or args.count > 1_000_000:
+            raise UsageError("--count must be between 1 and 1000000")
+        counts = parse_bench_counts(args.counts)
+        if args.latency_ms < 0 or args.latency_ms > 10_000:
+            raise UsageError("--latency-ms must be between 0 and 10000")
+        if args.repeat < 1 or args.repeat > 50:
+            raise UsageError("--repeat must be between 1 and 50")
+    except UsageError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+    except SystemExit as exc:
+        return int(exc.code or 0)
+    if args.suite == "pipeline":
+        result = bench_pipeline(counts, latency_ms=args.latency_ms, repeat=args.repeat)
+        render = render_pipeline_report
+    else:
+        result = bench_items(args.count)
+        render = render_bench_report
+    if args.format == "json":
+        print(json.dumps(result, indent=2, sort_keys=True))
+    else:
+        print(render(result))
+    return 0
+
+
+def parse_bench_counts(value: str) -> list[int]:
+    try:
+        counts = [int(part) for part in value.split(",") if part.strip()]
+    except ValueError as exc:
+        raise UsageError(f"--counts must be comma-separated integers: {value}") from exc
+    if not counts or any(count < 1 or count > 20_000 for count in counts):
+        raise UsageError("--counts values must be between 1 and 20000")
+    return counts
+
+
+def synthetic_item_fields(count: int, reference: datetime) -> list[dict[str, Any]]:
+    """Backfill-shaped item kwargs: distinct minute-spaced timestamps and HN/arXiv-sized raw payloads."""
+    return [
+        {
+            "source": "hn",
+            "title": f"Agent runtime update {index}",
+            "url": f"https://example.com/items/{index}",
+            "published_at": synthetic_timestamp(reference - timedelta(minutes=index * 3), index),
+            "summary": "Open-source coding agent adds MCP workflow support.",
+            "engagement": float(index % 500),
+            "tags": ["agent", "mcp"],
+            "raw": {"objectID": str(index), "query": "coding agents", "authors": ["a", "b", "c"]},
+        }
+        for index in range(count)
+    ]
+
+
+def synthetic_timestamp(value: datetime, index: int) -> str:
+    """Mix the timestamp shapes upstreams send: ISO `Z` (HN, GitHub, arXiv), offsets, and RSS RFC 822."""
+    if index % 3 == 0:
+        return value.isoformat().replace("+00:00", "Z")
+    if index % 3 == 1:
+        return value.isoformat()
+    return value.strftime("%a, %d %b %Y %H:%M:%S GMT")
+
+
+def legacy_item_class() -> type:
+    """The pre-slots RadarItem layout, rebuilt from the current fields for comparison."""
+    fields = [
+        (item_field.name, item_field.type, field(default=item_field.default, default_factory=item_field.default_factory))
+        for item_field in dataclasses.fields(RadarItem)
+        if item_field.init
+    ]
+    return dataclasses.make_dataclass("LegacyRadarItem", fields)
+
+
+def measure_item_memory(factory: Callable[..., Any], rows: list[dict[str, Any]], *, keep_raw: bool) -> int:
+    """Retained bytes for `rows` built with `factory`; each item gets its own raw payload copy."""
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        items = [factory(**{**row, "raw": dict(row["raw"]) if keep_raw else {}}) for row in rows]
+        used = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+    del items
+    return used
+
+
+RANKING_PASSES = 3
+
+
+def bench_items(count: int) -> dict[str, Any]:
+    reference = datetime(2026, 1, 31, tzinfo=UTC)
+    args = argparse.Namespace(window_start_dt=reference - timedelta(days=31), window_end_dt=reference)
+    rows = synthetic_item_fields(count, reference)
+    legacy = legacy_item_class()
+    for row in rows:
+        published_epoch(row["published_at"])  # Memo entries are shared state, not per-item cost.
+    memory = {
+        "legacy": measure_item_memory(legacy, rows, keep_raw=True),
+        "slotted": measure_item_memory(RadarItem, rows, keep_raw=True),
+        "slottedNoRaw": measure_item_memory(RadarItem, rows, keep_raw=False),
+    }
+
+    # Per item a run does two window checks (fetch filter with slack, final filter), scores
+    # recency once per ranking pass (sections and overall in gather, sections again when
+    # rendering), and renders one date.
+    def reparse(item: Any) -> None:
+        for slack in (1, 0):
+            published = parse_iso_datetime(item.published_at)
+            if published is not None:
+                _ = args.window_start_dt - timedelta(days=slack) <= published < args.window_end_dt + timedelta(days=slack)
+        for _ in range(RANKING_PASSES):
+            published = parse_iso_datetime(item.published_at)
+            if published is not None:
+                _ = (reference - published).total_seconds()
+        parsed = parse_iso_datetime(item.published_at)
+        _ = parsed.date().isoformat() if parsed is not None else "unknown-date"
+
+    def preparsed(item: RadarItem) -> None:
+        for slack in (1, 0):
+            timestamp_in_window(item.published_ts, args, slack_days=slack)
+        for _ in range(RANKING_PASSES):
+            recency_from_timestamp(item.published_ts, 31, reference)
+        short_date(item.published_at)
+
+    started = time.perf_counter()
+    legacy_items = [legacy(**row) for row in rows]
+    for item in legacy_items:
+        reparse(item)
+    legacy_seconds = time.perf_counter() - started
+
+    published_epoch.cache_clear()
+    started = time.perf_counter()
+    items = [RadarItem(**row) for row in rows]
+    for item in items:
+        preparsed(item)
+    preparsed_seconds = time.perf_counter() - started
+
+    return {
+        "suite": "items",
+        "count": count,
+        "bytesPerItem": {name: round(value / count, 1) for name, value in memory.items()},
+        "cpu": {
+            "legacyMicrosPerItem": round(legacy_seconds / count * 1e6, 3),
+            "preparsedMicrosPerItem": round(preparsed_seconds / count * 1e6, 3),
+        },
+        "reduction": {
+            "memory": round(1 - memory["slottedNoRaw"] / memory["legacy"], 3) if memory["legacy"] else 0.0,
+            "cpu": round(1 - preparsed_seconds / legacy_seconds, 3) if legacy_seconds else 0.0,
+        },
+    }
+
+
+def render_bench_report(result: dict[str, Any]) -> str:
+    memory = result["bytesPerItem"]
+    cpu = result["cpu"]
+    reduction = result["reduction"]
+    return "\n".join(
+        [
+            f"# Topic Radar Bench: {result['suite']}",
+            "",
+            f"- Items: {result['count']}",
+            f"- Memory per item: legacy {memory['legacy']}B, slotted {memory['slotted']}B, "
+            f"slotted without raw {memory['slottedNoRaw']}B",
+            f"- Window/recency/date cost per item: legacy {cpu['legacyMicrosPerItem']}us, "
+            f"pre-parsed {cpu['preparsedMicrosPerItem']}us (parse included)",
+            f"- Reduction: memory {reduction['memory'] * 100:.1f}%, cpu {reduction['cpu'] * 100:.1f}%",
+        ]
+    )
+
+
+BENCH_STAGES = {
+    "hn": ("hn", "auto"),
+    "github": ("github", "auto"),
+    "arxiv": ("arxiv", "auto"),
+    "hf": ("hf", "auto"),
+    "official": ("official", "auto"),
+    "news-gdelt": ("news", "gdelt"),
+    "news-google": ("news", "google"),
+}
+BENCH_PUBLISHERS = ("Reuters", "The Verge", "TechCrunch", "Bloomberg", "Ars Technica", "VentureBeat")
+BENCH_FILLER = (
+    "benchmark",
+    "update",
+    "notes",
+    "weekly",
+    "roundup",
+    "deep dive",
+    "launch",
+    "preview",
+    "report",
+    "analysis",
+)
+
+
+class BenchFixtures:
+    """Deterministic, realistically shaped upstream payloads for every HTTP source.
+
+    Each response carries `count` records with the fields, nesting, and text lengths the real
+    APIs return, so parsing, window filtering, topic matching, and ranking see production-like
+    work. Timestamps fall inside the last six days of `reference`.
+    """
+
+    def __init__(self, count: int, reference: datetime, seed: int = 7) -> None:
+        self.count = count
+        self.reference = reference
+        self.seed = seed
+        self.topics = [topic.lower() for topic in DEFAULT_TOPICS]
+        self.records: dict[str, int] = {}
+
+    def _rng(self, name: str) -> random.Random:
+        return random.Random(f"{self.seed}:{name}:{self.count}")
+
+    def _title(self, rng: random.Random, index: int) -> str:
+        filler = " ".join(rng.sample(BENCH_FILLER, 2))
+        if rng.random() < 0.8:
+            return f"{rng.choice(DEFAULT_TOPICS)} {filler} {index}"
+        return f"Quarterly {filler} {index}"
+
+    def _moment(self, rng: random.Random) -> datetime:
+        return self.reference - timedelta(seconds=rng.uniform(0, 6 * 86400))
+
+    def _text(self, rng: random.Random, words: int) -> str:
+        vocabulary = [*BENCH_FILLER, *self.topics, "model", "inference", "dataset", "release", "open", "latency"]
+        return " ".join(rng.choice(vocabulary) for _ in range(words))
+
+    def routes(self) -> dict[tuple[str, str], tuple[str, bytes]]:
+        """Map `(host, path)` to `(content type, body)` for every upstream endpoint."""
+        json_type, xml_type = "application/json", "application/xml"
+        routes = {
+            ("hn.algolia.com", "/api/v1/search_by_date"): (json_type, self.hn()),
+            ("api.github.com", "/search/repositories"): (json_type, self.github()),
+            ("export.arxiv.org", "/api/query"): ("application/atom+xml", self.arxiv()),
+            ("huggingface.co", "/api/models"): (json_type, self.hf()),
+            ("api.gdeltproject.org", "/api/v2/doc/doc"): (json_type, self.gdelt()),
+            ("news.google.com", "/rss/search"): (xml_type, self.google_news()),
+        }
+        for name, url in OFFICIAL_FEEDS:
+            parsed = urllib.parse.urlsplit(url)
+            routes[(parsed.netloc, parsed.path)] = (xml_type, self.official_feed(name))
+        for name, url, _ in OFFICIAL_HTML_PAGES:
+            parsed = urllib.parse.urlsplit(url)
+            routes[(parsed.netloc, parsed.path)] = ("text/html", self.official_page(name))
+        return routes
+
+    def hn(self) -> bytes:
+        rng = self._rng("hn")
+        hits = []
+        for index in range(self.count):
+            moment = self._moment(rng)
+            title = self._title(rng, index)
+            hits.append(
+                {
+                    "title": title,
+                    "url": f"https://example.com/hn/{index}",
+                    "author": f"user{rng.randrange(10_000)}",
+                    "points": rng.randrange(1, 900),
+                    "num_comments": rng.randrange(0, 400),
+                    "story_text": None,
+                    "created_at": moment.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                    "created_at_i": int(moment.timestamp()),
+                    "objectID": str(40_000_000 + index),
+                    "_tags": ["story", f"author_user{index}", f"story_{40_000_000 + index}"],
+                    "_highlightResult": {
+                        "title": {"value": title, "matchLevel": "full", "matchedWords": title.lower().split()[:2]},
+                        "url": {"value": f"https://example.com/hn/{index}", "matchLevel": "none", "matchedWords": []},
+                    },
+                }
+            )
+        self.records["hn"] = len(hits)
+        return json.dumps({"hits": hits, "nbHits": len(hits), "page": 0, "hitsPerPage": len(hits)}).encode()
+
+    def github(self) -> bytes:
+        rng = self._rng("github")
+        repos = []
+        for index in range(self.count):
+            name = f"{self._title(rng, index).lower().replace(' ', '-')}"
+            pushed = self._moment(rng).strftime("%Y-%m-%dT%H:%M:%SZ")
+            owner = f"org{rng.randrange(2_000)}"
+            repos.append(
+                {
+                    "id": 900_000 + index,
+                    "name": name,
+                    "full_name": f"{owner}/{name}",
+                    "html_url": f"https://github.com/{owner}/{name}",
+                    "description": self._text(rng, 18),
+                    "pushed_at": pushed,
+                    "updated_at": pushed,
+                    "created_at": "2024-03-01T00:00:00Z",
+                    "stargazers_count": rng.randrange(10, 60_000),
+                    "watchers_count": rng.randrange(10, 60_000),
+                    "forks_count": rng.randrange(0, 8_000),
+                    "open_issues_count": rng.randrange(0, 500),
+                    "language": rng.choice(["Python", "TypeScript", "Rust", "Go", "C++"]),
+                    "topics": rng.sample(["llm", "agents", "inference", "rag", "robotics", "cuda", "mlops"], 4),
+                    "license": {"key": "apache-2.0", "name": "Apache License 2.0", "spdx_id": "Apache-2.0"},
+                    "owner": {
+                        "login": owner,
+                        "id": 10_000 + index,
+                        "avatar_url": f"https://avatars.githubusercontent.com/u/{10_000 + index}?v=4",
+                        "html_url": f"https://github.com/{owner}",
+                        "type": "Organization",
+                    },
+                    "default_branch": "main",
+                    "score": 1.0,
+                }
+            )
+        self.records["github"] = len(repos)
+        return json.dumps({"total_count": len(repos), "incomplete_results": False, "items": repos}).encode()
+
+    def arxiv(self) -> bytes:
+        rng = self._rng("arxiv")
+        parts = ['<?xml version="1.0" encoding="UTF-8"?>', f'<feed xmlns="{ATOM_NS}" xmlns:arxiv="http://arxiv.org/schemas/atom">']
+        parts.append("<title>ArXiv Query</title><id>http://arxiv.org/api/query</id>")
+        for index in range(self.count):
+            stamp = self._moment(rng).strftime("%Y-%m-%dT%H:%M:%SZ")
+            authors = "".join(f"<author><name>Author {rng.randrange(5_000)}</name></author>" for _ in range(4))
+            categories = "".join(f'<category term="{term}"/>' for term in rng.sample(["cs.AI", "cs.CL", "cs.LG", "cs.RO"], 2))
+            parts.append(
+                f"<entry><id>http://arxiv.org/abs/2610.{index:05d}v1</id><updated>{stamp}</updated>"
+                f"<published>{stamp}</published><title>{escape_xml(self._title(rng, index))}</title>"
+                f"<summary>{escape_xml(self._text(rng, 150))}</summary>{authors}"
+                f'<link href="http://arxiv.org/abs/2610.{index:05d}v1" rel="alternate" type="text/html"/>'
+                f'<link title="pdf" href="http://arxiv.org/pdf/2610.{index:05d}v1" rel="related"/>'
+                f"{categories}</entry>"
+            )
+        parts.append("</feed>")
+        self.records["arxiv"] = self.count
+        return "".join(parts).encode()
+
+    def hf(self) -> bytes:
+        rng = self._rng("hf")
+        models = []
+        for index in range(self.count):
+            model_id = f"org{rng.randrange(500)}/{self._title(rng, index).lower().replace(' ', '-')}"
+            stamp = self._moment(rng).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+            models.append(
+                {
+                    "_id": f"{index:024x}",
+                    "id": model_id,
+                    "modelId": model_id,
+                    "likes": rng.randrange(0, 5_000),
+                    "downloads": rng.randrange(0, 5_000_000),
+                    "trendingScore": rng.randrange(0, 300),
+                    "private": False,
+                    "pipeline_tag": rng.choice(["text-generation", "image-text-to-text", "robotics"]),
+                    "library_name": rng.choice(["transformers", "diffusers", "lerobot"]),
+                    "tags": ["transformers", "safetensors", "llama", "text-generation", "conversational", "license:apache-2.0"],
+                    "createdAt": stamp,
+                    "lastModified": stamp,
+                }
+            )
+        self.records["hf"] = len(models)
+        return json.dumps(models).encode()
+
+    def official_feed(self, name: str) -> bytes:
+        rng = self._rng(name)
+        parts = ['<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>', f"<title>{escape_xml(name)}</title>"]
+        for index in range(self.count):
+            description = escape_xml(f"<p>{self._text(rng, 90)}</p><p>{self._text(rng, 40)}</p>")
+            parts.append(
+                f"<item><title>{escape_xml(self._title(rng, index))}</title>"
+                f"<link>https://example.com/{name.lower().replace(' ', '-')}/{index}</link>"
+                f"<guid>https://example.com/{name.lower().replace(' ', '-')}/{index}</guid>"
+                f"<pubDate>{self._moment(rng).strftime('%a, %d %b %Y %H:%M:%S GMT')}</pubDate>"
+                f"<description>{description}</description></item>"
+            )
+        parts.append("</channel></rss>")
+        self.records["official"] = self.records.get("official", 0) + self.count
+        return "".join(parts).encode()
+
+    def official_page(self, name: str) -> bytes:
+        rng = self._rng(name)
+        cards = []
+        for index in range(self.count):
+            category = rng.choice(OFFICIAL_PAGE_CATEGORIES)
+            title = escape_xml(self._title(rng, index))
+            cards.append(
+                f'<a href="/news/post-{index}"><span>{category}</span><h3>{title}</h3>'
+                f"<time>{self._moment(rng).strftime('%b %d, %Y')}</time><p>{self._text(rng, 24)}</p></a>"
+            )
+        self.records["official"] = self.records.get("official", 0) + self.count
+        return f"<html><body><nav>{escape_xml(name)}</nav><main>{''.join(cards)}</main></body></html>".encode()
+
+    def gdelt(self) -> bytes:
+        rng = self._rng("gdelt")
+        articles = []
+        for index in range(self.count):
+            publisher = rng.choice(BENCH_PUBLISHERS)
+            domain = f"{publisher.lower().replace(' ', '')}.com"
+            articles.append(
+                {
+                    "url": f"https://{domain}/story/{index}",
+                    "url_mobile": "",
+                    "title": self._title(rng, index),
+                    "seendate": self._moment(rng).strftime("%Y%m%dT%H%M%SZ"),
+                    "socialimage": f"https://{domain}/img/{index}.jpg",
+                    "domain": domain,
+                    "language": "English",
+                    "sourcecountry": "United States",
+                }
+            )
+        self.records["news-gdelt"] = len(articles)
+        return json.dumps({"articles": articles}).encode()
+
+    def google_news(self) -> bytes:
+        rng = self._rng("google")
+        parts = ['<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Google News</title>']
+        for index in range(self.count):
+            publisher = rng.choice(BENCH_PUBLISHERS)
+            title = escape_xml(f"{self._title(rng, index)} - {publisher}")
+            link = f"https://news.google.com/rss/articles/CBMi{index:08d}?oc=5"
+            anchor = escape_xml(f'<a href="{link}">{title}</a>')
+            parts.append(
+                f"<item><title>{title}</title><link>{link}</link><guid isPermaLink=\"false\">CBMi{index:08d}</guid>"
+                f"<pubDate>{self._moment(rng).strftime('%a, %d %b %Y %H:%M:%S GMT')}</pubDate>"
+                f"<description>{anchor}</description>"
+                f"<source url=\"https://{publisher.lower().replace(' ', '')}.com\">{publisher}</source></item>"
+            )
+        parts.append("</channel></rss>")
+        self.records["news-google"] = self.count
+        return "".join(parts).encode()
+
+
+def escape_xml(value: str) -> str:
+    return value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+
+
+def build_replay_handler(
+    routes: dict[tuple[str, str], tuple[str, bytes]],
+    latency_seconds: float,
+) -> type[BaseHTTPRequestHandler]:
+    """Serve `/<host><path>` from `routes` after `latency_seconds`, as `HttpTransport.route` rewrites URLs."""
+
+    class ReplayHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server hook name.
+            path = urllib.parse.urlsplit(self.path).path
+            host, _, rest = path.lstrip("/").partition("/")
+            route = routes.get((host, f"/{rest}"))
+            if latency_seconds:
+                time.sleep(latency_seconds)
+            content_type, body = route if route else ("text/plain", b"not found")
+            self.send_response(200 if route else 404)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - http.server signature.
+            return
+
+    return ReplayHandler
+
+
+class ReplayServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Streamed XML parsers close the connection at early stop; that is expected here.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+@contextmanager
+def replay_server(
+    routes: dict[tuple[str, str], tuple[str, bytes]],
+    latency_seconds: float,
+) -> Iterator[dict[str, str]]:
+    """Run a local replay server; yields transport host overrides for every routed host."""
+    httpd = ReplayServer(("127.0.0.1", 0), build_replay_handler(routes, latency_seconds))
+    thread = threading.Thread(target=httpd.serve_forever, name="radar-replay", daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    try:
+        yield {host: base for host, _ in routes}
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def bench_run_args(argv: list[str], overrides: dict[str, str]) -> argparse.Namespace:
+    args = normalize_args(["--no-cache", "--no-history", "--limit", "50", "--format", "json", *argv])
+    args.transport.close()
+    args.transport = HttpTransport(host_overrides=overrides)
+    args.scheduler = RequestScheduler(args.jobs, host_intervals={})
     return args
 
 
+def bench_pipeline(counts: list[int], *, latency_ms: int = 20, repeat: int = 3) -> dict[str, Any]:
+    """Replay fixtures through every fetcher, then the full gather, rank, and render path.
+
+    Stage numbers come from one source fetched alone (network wait, parse, window and topic
+    filtering); `endToEnd` runs every HTTP source together the way a radar run does. Each
+    measurement keeps the fastest of `repeat` runs.
+    """
+    reference = now_utc()
+    runs: list[dict[str, Any]] = []
+    for count in counts:
+        fixtures = BenchFixtures(count, reference)
+        routes = fixtures.routes()
+        with replay_server(routes, latency_ms / 1000) as overrides:
+            stages = {
+                stage: min(
+                    (bench_stage(source, provider, overrides) for _ in range(repeat)),
+                    key=lambda result: result["wallMs"],
+                )
+                for stage, (source, provider) in BENCH_STAGES.items()
+            }
+            end_to_end = min((bench_end_to_end(overrides) for _ in range(repeat)), key=lambda result: result["wallMs"])
+        for stage, result in stages.items():
+            # Official feeds are one request each; other sources repeat the same payload per topic query.
+            records = fixtures.records[stage] if stage == "official" else count * result["requests"]
+            result["records"] = records
+            result["recordsPerSecond"] = round(records / (result["wallMs"] / 1000), 1) if result["wallMs"] else None
+        runs.append(
+            {
+                "count": count,
+                "payloadBytes": sum(len(body) for _, body in routes.values()),
+                "stages": stages,
+                "endToEnd": end_to_end,
+            }
+        )
+    return {
+        "suite": "pipeline",
+        "version": VERSION,
+        "python": sys.version.split()[0],
+        "latencyMs": latency_ms,
+        "repeat": repeat,
+        "counts": counts,
+        "runs": runs,
+    }
+
+
+def bench_stage(source: str, provider: str, overrides: dict[str, str]) -> dict[str, Any]:
+    args = bench_run_args(["--sources", source, "--news-provider", provider], overrides)
+    try:
+        started = time.perf_counter()
+        with timing_scope(args.timings, source):
+            items, errors = fetch_source_items(source, args)
+        wall = time.perf_counter() - started
+    finally:
+        close_run_state(args)
+    timings = args.timings.metadata()["sources"].get(source, {})
+    return {
+        "wallMs": round(wall * 1000, 2),
+        "items": len(items),
+        "errors": len(errors),
+        "requests": timings.get("requests", 0),
+        "bytes": timings.get("bodyBytes", 0),
+        "parseMs": timings.get("parseMs", 0.0),
+    }
+
+
+def bench_end_to_end(overrides: dict[str, str]) -> dict[str, Any]:
+    args = bench_run_args(["--sources", "hn,github,arxiv,hf,official,news", "--news-provider", "auto"], overrides)
+    try:
+        started = time.perf_counter()
+        ranked, sections, errors = gather(args)
+        gathered = time.perf_counter()
+        rendered = render_json(args, ranked, sections, errors), render_markdown(args, ranked, sections, errors)
+        finished = time.perf_counter()
+        items = [item for items in sections.values() for item in items]
+        rank_started = time.perf_counter()
+        ranking = dedupe_and_rank(items, args.topics, args.days, args.window_reference_dt)
+        rank_seconds = time.perf_counter() - rank_started
+    finally:
+        close_run_state(args)
+    phases = args.timings.metadata()["phases"]
+    return {
+        "wallMs": round((finished - started) * 1000, 2),
+        "gatherMs": round((gathered - started) * 1000, 2),
+        "fetchMs": phases.get("fetch", 0.0),
+        "rankMs": phases.get("rank", 0.0),
+        "renderMs": round((finished - gathered) * 1000, 2),
+        "renderedBytes": sum(len(text) for text in rendered),
+        "ranked": len(ranked),
+        "errors": len(errors),
+        "dedupeAndRank": {
+            "items": len(ranking),
+            "ms": round(rank_seconds * 1000, 3),
+        },
+    }
+
+
+def render_pipeline_report(result: dict[str, Any]) -> str:
+    lines = [
+        f"# Topic Radar Bench: {result['suite']}",
+        "",
+        f"- Replay latency: {result['latencyMs']}ms per response, best of {result['repeat']}",
+    ]
+    for run in result["runs"]:
+        end_to_end = run["endToEnd"]
+        lines.extend(
+            [
+                "",
+                f"## {run['count']} records per response ({format_number(float(run['payloadBytes']))}B of fixtures)",
+                "",
+                f"- End to end: {format_ms(end_to_end['wallMs'])} (fetch {format_ms(end_to_end['fetchMs'])}, "
+                f"rank {format_ms(end_to_end['rankMs'])}, render {format_ms(end_to_end['renderMs'])}), "
+                f"{end_to_end['ranked']} ranked, {end_to_end['errors']} error(s)",
+                f"- dedupe_and_rank: {end_to_end['dedupeAndRank']['items']} items in "
+                f"{end_to_end['dedupeAndRank']['ms']}ms",
+                "",
+                "| Stage | Wall | Parse | Records | Records/s | Items | Bytes |",
+                "| --- | ---: | ---: | ---: | ---: | ---: | ---: |",
+            ]
+        )
+        for stage, entry in run["stages"].items():
+            rate = format_number(float(entry["recordsPerSecond"] or 0))
+            lines.append(
+                f"| {stage} | {format_ms(entry['wallMs'])} | {format_ms(entry['parseMs'])} | {entry['records']} | "
+                f"{rate} | {entry['items']} | {format_number(float(entry['bytes']))}B |"
+            )
+    return "\n".join(lines)
+
+
 def normalize_window_args(args: argparse.Namespace, preset: dict[str, Any]) -> None:
     if args.month and (args.date_from or args.date_to):
         raise UsageError("--month cannot be combined with --from/--to")
@@ -1991,7 +6287,431 @@ def normalize_window_args(args: argparse.Namespace, preset: dict[str, Any]) -> N
     )
 
 
+@dataclass(slots=True)
+class SourceSnapshot:
+    """One source's fetched items for one fetch signature, held in memory by `serve`."""
+
+    source: str
+    argv: list[str]
+    limit: int
+    items: list[RadarItem] = field(default_factory=list)
+    errors: list[dict[str, Any]] = field(default_factory=list)
+    fetched_at: float = 0.0
+    fetch_seconds: float = 0.0
+    last_used: float = 0.0
+    ready: threading.Event = field(default_factory=threading.Event)
+
+
+def snapshot_key(args: argparse.Namespace, source: str) -> tuple[Any, ...]:
+    """Fetch signature: what changes a source fetch, apart from the limit a larger snapshot also covers."""
+    window = args.days if args.window_mode == "rolling" else args.cache_context
+    return (source, tuple(args.topics), args.news_provider, args.window_mode, window)
+
+
+class RadarServer:
+    """Radar reports answered from in-memory per-source snapshots.
+
+    The first query for a fetch signature fetches its sources; later queries rank and render
+    the held items without touching upstream. A scheduler thread refetches each snapshot once
+    it is older than its source's refresh interval (bypassing the response cache so the fresh
+    bodies are also rewritten for CLI runs), and drops snapshots nobody has asked for lately.
+    """
+
+    def __init__(
+        self,
+        base: argparse.Namespace,
+        base_argv: list[str],
+        *,
+        refresh_seconds: dict[str, float],
+        idle_seconds: float = SERVE_IDLE_SECONDS,
+    ) -> None:
+        self.base = base
+        self.base_argv = base_argv
+        self.refresh_seconds = refresh_seconds
+        self.idle_seconds = idle_seconds
+        self.snapshots: dict[tuple[Any, ...], SourceSnapshot] = {}
+        self._lock = threading.Lock()
+        self._refresher = BackgroundRefresher(max_workers=base.jobs)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="radar-scheduler", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._refresher.drain()
+
+    def _run(self) -> None:
+        while not self._stop.wait(SERVE_TICK_SECONDS):
+            self.refresh_due()
+
+    def request_argv(self, params: dict[str, list[str]]) -> list[str]:
+        argv = list(self.base_argv)
+        for key, values in params.items():
+            if key in SERVE_QUERY_FLAGS:
+                for value in values if key == "topic" else values[-1:]:
+                    argv.extend([SERVE_QUERY_FLAGS[key], value])
+            elif key in SERVE_QUERY_TOGGLES:
+                flag = SERVE_QUERY_TOGGLES[key]
+                enabled = values[-1].strip().lower() in {"1", "true", "yes", "on"}
+                argv.append(flag if enabled else f"--no-{flag[2:]}")
+            else:
+                raise UsageError(f"unknown query parameter: {key}")
+        return argv
+
+    def query(self, params: dict[str, list[str]]) -> tuple[int, str, str]:
+        try:
+            argv = self.request_argv(params)
+            args = normalize_args(argv, runtime=self.base)
+        except UsageError as exc:
+            return 400, "text/plain; charset=utf-8", f"error: {exc}\n"
+        except SystemExit:
+            return 400, "text/plain; charset=utf-8", "error: invalid query\n"
+        if len(args.sources) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.base.jobs, len(args.sources))) as executor:
+                snapshots = list(executor.map(lambda source: self.snapshot(source, args, argv), args.sources))
+        else:
+            snapshots = [self.snapshot(source, args, argv) for source in args.sources]
+
+        items = [copy.copy(item) for snapshot in snapshots for item in snapshot.items]
+        errors = [error for snapshot in snapshots for error in snapshot.errors]
+        ranking = RadarRanking(items, args.topics, args.days, args.window_reference_dt, near_dup=args.near_dup)
+        args.near_duplicate_merges = ranking.near_duplicate_merges
+        sections = {source: ranking.section(source, args.limit) for source in args.sources}
+        ranked = ranking.top(args.limit)
+        args.data_age = self.data_age(snapshots)
+        if args.format == "json":
+            return 200, "application/json", render_json(args, ranked, sections, errors) + "\n"
+        if args.format == "ndjson":
+            buffer = io.StringIO()
+            write_ndjson(args, ranked, sections, errors, buffer)
+            return 200, "application/x-ndjson", buffer.getvalue()
+        return 200, "text/markdown; charset=utf-8", render_markdown(args, ranked, sections, errors) + "\n"
+
+    def snapshot(self, source: str, args: argparse.Namespace, argv: list[str]) -> SourceSnapshot:
+        key = snapshot_key(args, source)
+        with self._lock:
+            snapshot = self.snapshots.get(key)
+            created = False
+            if snapshot is None or snapshot.limit < args.limit:
+                limit = max(args.limit, self.base.limit)
+                snapshot = SourceSnapshot(source=source, argv=[*argv, "--limit", str(limit)], limit=limit)
+                self.snapshots[key] = snapshot
+                created = True
+            snapshot.last_used = time.time()
+        if created:
+            self._fetch(snapshot, refresh=False)
+        else:
+            snapshot.ready.wait()
+        return snapshot
+
+    def prefetch(self, queries: list[dict[str, list[str]]]) -> int:
+        """Fetch every snapshot the queries need once, sized for the largest limit asking for it.
+
+        Returns how many snapshots were fetched; invalid queries raise before anything is fetched.
+        """
+        pending: dict[tuple[Any, ...], SourceSnapshot] = {}
+        for params in queries:
+            argv = self.request_argv(params)
+            args = normalize_args(argv, runtime=self.base)
+            for source in args.sources:
+                key = snapshot_key(args, source)
+                if key not in pending or pending[key].limit < args.limit:
+                    limit = max(args.limit, self.base.limit)
+                    pending[key] = SourceSnapshot(source=source, argv=[*argv, "--limit", str(limit)], limit=limit)
+        now = time.time()
+        with self._lock:
+            for key, snapshot in pending.items():
+                snapshot.last_used = now
+                self.snapshots[key] = snapshot
+        with ThreadPoolExecutor(max_workers=max(1, min(self.base.jobs, len(pending)))) as executor:
+            list(executor.map(functools.partial(self._fetch, refresh=False), pending.values()))
+        return len(pending)
+
+    def _fetch(self, snapshot: SourceSnapshot, *, refresh: bool = True) -> None:
+        """Fetch a snapshot; items, errors, and `fetched_at` are in place before `ready` is set.
+
+        A failure becomes a source error so waiters never see a half-built snapshot. A failed
+        refresh keeps the previous items and `fetched_at`, so it is retried on the next tick.
+        """
+        started = time.monotonic()
+        try:
+            args = normalize_args(snapshot.argv, runtime=self.base)
+            args.refresh = args.refresh or refresh
+            items, errors = fetch_source_items(snapshot.source, args)
+            drop_raw_payloads(items, self.base)
+            fetched_at = time.time()
+        except Exception as exc:  # noqa: BLE001 - a failed fetch must still release waiters.
+            items = snapshot.items
+            errors = [{"source": snapshot.source, "error": f"unexpected_error:{type(exc).__name__}:{exc}"}]
+            fetched_at = snapshot.fetched_at or time.time()
+        with self._lock:
+            snapshot.items, snapshot.errors = items, errors
+            snapshot.fetched_at = fetched_at
+            snapshot.fetch_seconds = time.monotonic() - started
+        snapshot.ready.set()
+
+    def refresh_due(self, now: float | None = None) -> int:
+        """Queue background refetches for snapshots past their interval; returns how many were queued."""
+        now = time.time() if now is None else now
+        due: list[tuple[tuple[Any, ...], SourceSnapshot]] = []
+        with self._lock:
+            for key, snapshot in list(self.snapshots.items()):
+                if now - snapshot.last_used > self.idle_seconds:
+                    del self.snapshots[key]
+                elif snapshot.ready.is_set() and now - snapshot.fetched_at >= self.refresh_seconds[snapshot.source]:
+                    due.append((key, snapshot))
+        for key, snapshot in due:
+            self._refresher.submit(repr(key), functools.partial(self._fetch, snapshot))
+        return len(due)
+
+    def snapshot_age(self, snapshot: SourceSnapshot, now: float) -> dict[str, Any]:
+        return {
+            "fetchedAt": iso_from_epoch(snapshot.fetched_at),
+            "ageSeconds": round(max(0.0, now - snapshot.fetched_at), 1),
+            "refreshSeconds": int(self.refresh_seconds[snapshot.source]),
+            "fetchSeconds": round(snapshot.fetch_seconds, 3),
+            "items": len(snapshot.items),
+        }
+
+    def data_age(self, snapshots: list[SourceSnapshot], now: float | None = None) -> dict[str, Any]:
+        """Per-source ages for one response, whose snapshots share a fetch signature."""
+        now = time.time() if now is None else now
+        return {snapshot.source: self.snapshot_age(snapshot, now) for snapshot in snapshots}
+
+    def health(self) -> dict[str, Any]:
+        """Every held snapshot's age; several snapshots of one source differ by fetch signature."""
+        now = time.time()
+        with self._lock:
+            held = [(key, snapshot) for key, snapshot in self.snapshots.items() if snapshot.ready.is_set()]
+        data_age = []
+        for (source, topics, news_provider, window_mode, window), snapshot in held:
+            entry = {"source": source, "topics": list(topics), "newsProvider": news_provider}
+            entry.update({"windowMode": window_mode, "window": window, "limit": snapshot.limit})
+            data_age.append({**entry, **self.snapshot_age(snapshot, now)})
+        return {"ok": True, "version": VERSION, "snapshots": len(held), "dataAge": data_age}
+
+
+def reject_run_deadline(base: argparse.Namespace, mode: str) -> None:
+    """`--deadline` bounds one gather; snapshot fetches in `serve` and `batch` are not gathers."""
+    if base.deadline_seconds is not None:
+        close_run_state(base)
+        raise UsageError(f"--deadline is not supported by {mode}")
+
+
+def build_serve_handler(radar: RadarServer) -> type[BaseHTTPRequestHandler]:
+    class RadarRequestHandler(BaseHTTPRequestHandler):
+        server_version = f"topic-radar/{VERSION}"
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server hook name.
+            parsed = urllib.parse.urlsplit(self.path)
+            if parsed.path == "/radar":
+                status, content_type, body = radar.query(urllib.parse.parse_qs(parsed.query))
+            elif parsed.path == "/healthz":
+                status, content_type, body = 200, "application/json", json.dumps(radar.health(), sort_keys=True) + "\n"
+            else:
+                status, content_type, body = 404, "text/plain; charset=utf-8", "not found\n"
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - http.server signature.
+            return
+
+    return RadarRequestHandler
+
+
+def build_serve_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="topic-radar.sh serve",
+        description="Serve radar reports from memory over local HTTP and refresh sources in the background.",
+        epilog=(
+            "Other radar options (for example --sources, --jobs, --cache-backend, --sample) set server-wide "
+            "defaults. GET /radar accepts the query parameters "
+            + ", ".join([*SERVE_QUERY_FLAGS, *SERVE_QUERY_TOGGLES])
+            + "; GET /healthz reports snapshot ages."
+        ),
+    )
+    parser.add_argument("--bind", default="127.0.0.1", help="Address to listen on.")
+    parser.add_argument("--port", type=int, default=DEFAULT_SERVE_PORT, help="Port to listen on; 0 picks a free port.")
+    parser.add_argument(
+        "--refresh-minutes",
+        type=int,
+        help="Refresh interval for every source. Defaults to a per-source schedule.",
+    )
+    return parser
+
+
+def serve_main(argv: list[str]) -> int:
+    try:
+        options, radar_argv = build_serve_parser().parse_known_args(argv)
+        if options.port < 0 or options.port > 65535:
+            raise UsageError("--port must be between 0 and 65535")
+        if options.refresh_minutes is not None and not 1 <= options.refresh_minutes <= 1440:
+            raise UsageError("--refresh-minutes must be between 1 and 1440")
+        base_argv = ["--format", "json", *radar_argv]
+        base = normalize_args(base_argv)
+        reject_run_deadline(base, "serve")
+    except UsageError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+    except SystemExit as exc:
+        return int(exc.code or 0)
+    refresh_seconds = {
+        source: float((options.refresh_minutes or minutes) * 60) for source, minutes in SERVE_REFRESH_MINUTES.items()
+    }
+    radar = RadarServer(base, base_argv, refresh_seconds=refresh_seconds)
+    try:
+        httpd = ThreadingHTTPServer((options.bind, options.port), build_serve_handler(radar))
+    except OSError as exc:
+        close_run_state(base)
+        print(f"error: cannot listen on {options.bind}:{options.port}: {exc}", file=sys.stderr)
+        return 1
+    httpd.daemon_threads = True
+    radar.start()
+    print(f"topic-radar serving http://{options.bind}:{httpd.server_port}/radar", file=sys.stderr, flush=True)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        radar.close()
+        close_run_state(base)
+    return 0
+
+
+def load_batch_spec(path: Path) -> list[tuple[Path, dict[str, list[str]]]]:
+    """Read a batch spec: a JSON list (or `{"reports": [...]}`) of report objects.
+
+    Each object needs an `output` path; its other keys are the `serve` query parameters, with
+    `topic` optionally a list and toggles as booleans.
+    """
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except OSError as exc:
+        raise UsageError(f"cannot read --spec {path}: {exc.strerror or exc}") from exc
+    except ValueError as exc:
+        raise UsageError(f"--spec is not valid JSON: {exc}") from exc
+    entries = payload.get("reports") if isinstance(payload, dict) else payload
+    if not isinstance(entries, list) or not entries:
+        raise UsageError("--spec must hold a non-empty list of reports")
+    reports: list[tuple[Path, dict[str, list[str]]]] = []
+    for index, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict) or not isinstance(entry.get("output"), str) or not entry["output"].strip():
+            raise UsageError(f"report {index}: expected an object with an output path")
+        output = Path(entry["output"]).expanduser()
+        if output in {path for path, _ in reports}:
+            raise UsageError(f"report {index}: duplicate output path: {output}")
+        params: dict[str, list[str]] = {}
+        for key, value in entry.items():
+            if key == "output":
+                continue
+            if key not in SERVE_QUERY_FLAGS and key not in SERVE_QUERY_TOGGLES:
+                raise UsageError(f"report {index}: unknown key: {key}")
+            values = value if isinstance(value, list) else [value]
+            params[key] = [str(value).lower() if isinstance(value, bool) else str(value) for value in values]
+        reports.append((output, params))
+    return reports
+
+
+def run_batch(
+    base: argparse.Namespace,
+    base_argv: list[str],
+    reports: list[tuple[Path, dict[str, list[str]]]],
+) -> dict[str, Any]:
+    """Fetch what every report needs in one pass, then rank, render, and write each report.
+
+    Reports with the same fetch signature share source snapshots (as `serve` queries do), and a
+    retained response memo fetches each upstream URL once even across windows and profiles.
+    """
+    base.response_memo = SingleFlight(retain=True)
+    radar = RadarServer(
+        base,
+        base_argv,
+        refresh_seconds={source: float(minutes * 60) for source, minutes in SERVE_REFRESH_MINUTES.items()},
+    )
+    written: list[dict[str, Any]] = []
+    try:
+        fetched = radar.prefetch([params for _, params in reports])
+        for output, params in reports:
+            _, content_type, body = radar.query(params)
+            data = body.encode("utf-8")
+            # Reports are read by other users and jobs, unlike private cache bodies.
+            atomic_write_bytes(output, data, mode=0o666)
+            written.append({"output": str(output), "contentType": content_type, "bytes": len(data)})
+    finally:
+        radar.close()
+    errors = [error for snapshot in radar.snapshots.values() for error in snapshot.errors]
+    return {
+        "reports": written,
+        "sourceFetches": fetched,
+        "sharedRequests": base.response_memo.shared,
+        "errors": len(errors),
+        "unsafe": any(error.get("unsafe") for error in errors),
+    }
+
+
+def build_batch_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="topic-radar.sh batch",
+        description="Render several radar reports from one shared fetch pass, each to its own file.",
+        epilog=(
+            "Other radar options (for example --jobs, --no-cache, --cache-backend) set batch-wide defaults. "
+            "Each report in --spec has an output path plus any of "
+            + ", ".join([*SERVE_QUERY_FLAGS, *SERVE_QUERY_TOGGLES])
+            + "."
+        ),
+    )
+    parser.add_argument("--spec", required=True, help="JSON file listing the reports to render.")
+    return parser
+
+
+def batch_main(argv: list[str]) -> int:
+    try:
+        options, radar_argv = build_batch_parser().parse_known_args(argv)
+        reports = load_batch_spec(Path(options.spec).expanduser())
+        base = normalize_args(radar_argv)
+        reject_run_deadline(base, "batch")
+    except UsageError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+    except SystemExit as exc:
+        return int(exc.code or 0)
+    try:
+        summary = run_batch(base, radar_argv, reports)
+    except UsageError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+    except SystemExit as exc:
+        return int(exc.code or 0)
+    except OSError as exc:
+        print(f"error: cannot write batch report: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        close_run_state(base)
+    print(json.dumps(summary, indent=2, sort_keys=True), flush=True)
+    return 3 if summary["unsafe"] else 0
+
+
+SUBCOMMANDS: dict[str, Callable[[list[str]], int]] = {
+    "cache": cache_main,
+    "bench": bench_main,
+    "serve": serve_main,
+    "batch": batch_main,
+}
+
+
 def main(argv: list[str]) -> int:
+    if argv and argv[0] in SUBCOMMANDS:
+        return SUBCOMMANDS[argv[0]](argv[1:])
     try:
         args = normalize_args(argv)
     except UsageError as exc:
@@ -2000,11 +6720,23 @@ def main(argv: list[str]) -> int:
     except SystemExit as exc:
         return int(exc.code or 0)
 
-    ranked, sections, errors = gather(args)
-    if args.format == "json":
-        print(render_json(args, ranked, sections, errors))
-    else:
-        print(render_markdown(args, ranked, sections, errors))
+    try:
+        ranked, sections, errors = gather(args)
+        if args.format == "json":
+            print(render_json(args, ranked, sections, errors), flush=True)
+        elif args.format == "ndjson":
+            write_ndjson(args, ranked, sections, errors, sys.stdout)
+        else:
+            print(render_markdown(args, ranked, sections, errors), flush=True)
+        if args.delta_state is not None:
+            args.delta_state.save([*(item for items in sections.values() for item in items), *ranked])
+    finally:
+        if args.profile_run:
+            try:
+                args.timings.write_trace(Path(args.profile_run).expanduser())
+            except OSError as exc:
+                print(f"warning: cannot write --profile-run trace: {exc}", file=sys.stderr)
+        close_run_state(args)
     if any(error.get("unsafe") for error in errors):
         return 3
     return 0
@@ -1,11 +1,28 @@
 from __future__ import annotations
 
+import gzip
 import importlib.util
 import json
+import os
+import random
+import re
+import sqlite3
 import subprocess
 import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from types import ModuleType
+from typing import Any
+
+import pytest
 
 from skills._shared.python.skill_testing import assert_entrypoints_exist, assert_skill_contract
 
@@ -22,6 +39,42 @@ def load_topic_radar_module() -> ModuleType:
     return module
 
 
+Route = Callable[[BaseHTTPRequestHandler], tuple[int, dict[str, str], bytes]]
+
+
+@contextmanager
+def local_http_server(routes: dict[str, Route]) -> Iterator[dict[str, Any]]:
+    state: dict[str, Any] = {"requests": [], "peers": set()}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server hook name.
+            state["requests"].append({"path": self.path, "headers": dict(self.headers)})
+            state["peers"].add(self.client_address)
+            route = routes.get(self.path.split("?", 1)[0])
+            status, headers, body = route(self) if route else (404, {}, b"not found")
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - http.server signature.
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state["base"] = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        yield state
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
 def test_tools_market_research_topic_radar_contract() -> None:
     skill_root = Path(__file__).resolve().parents[1]
     assert_skill_contract(skill_root)
@@ -59,6 +112,49 @@ def test_tools_market_research_topic_radar_ai_topic_uses_word_boundary() -> None
     assert module.interest_match_score(dotted_match, ["AI"]) > 0
 
 
+def test_tools_market_research_topic_radar_compiled_matcher_matches_reference() -> None:
+    module = load_topic_radar_module()
+
+    def reference_score(item: Any, topics: list[str]) -> float:
+        haystack = " ".join([item.title, item.summary or "", " ".join(item.tags)]).lower()
+        score = 0.0
+        for term in module.topic_terms(topics):
+            if " " in term or (len(term) > 3 and term != "ai"):
+                matched = term in haystack
+            elif term == "ai":
+                matched = re.search(r"(?<![a-z0-9])a\.?i\.?(?![a-z0-9])", haystack) is not None
+            else:
+                matched = re.search(rf"(?<![a-z0-9]){re.escape(term)}(?![a-z0-9])", haystack) is not None
+            if matched:
+                score += 1.0 if " " in term else 0.4
+        return min(score, 6.0)
+
+    def reference_cluster(item: Any) -> str:
+        haystack = module.item_search_text(item)
+        for cluster_name, keywords in module.BRIEF_CLUSTERS:
+            if any(keyword in haystack for keyword in keywords):
+                return cluster_name
+        return module.OTHER_BRIEF_CLUSTER
+
+    rng = random.Random(7)
+    vocabulary = [word for _, keywords in module.BRIEF_CLUSTERS for word in keywords]
+    vocabulary += ["AI", "A.I.", "air", "agents", "llm", "LLMs", "open-source", "rag", "gpt-5", "x", "-", "."]
+    topic_sets = [module.PROFILE_TOPICS[profile] for profile in sorted(module.PROFILE_TOPICS)] + [["AI", "rag", "agent"]]
+    for _ in range(400):
+        words = rng.choices(vocabulary, k=rng.randint(0, 12))
+        separator = rng.choice([" ", "", "-"])
+        item = module.RadarItem(
+            source=rng.choice(["hn", "github", "hf"]),
+            title=separator.join(words),
+            url="",
+            summary=" ".join(rng.choices(vocabulary, k=3)) if rng.random() < 0.5 else None,
+            tags=rng.choices(vocabulary, k=rng.randint(0, 3)),
+        )
+        topics = rng.choice(topic_sets)
+        assert module.interest_match_score(item, topics) == reference_score(item, topics)
+        assert module.classify_brief_cluster(item) == reference_cluster(item)
+
+
 def test_tools_market_research_topic_radar_help_mentions_report_options() -> None:
     skill_root = Path(__file__).resolve().parents[1]
     script = skill_root / "scripts" / "topic-radar.sh"
@@ -76,6 +172,7 @@ def test_tools_market_research_topic_radar_help_mentions_report_options() -> Non
     assert "--month" in proc.stdout
     assert "--brief" in proc.stdout
     assert "--cache-ttl-minutes" in proc.stdout
+    assert "--cache-policy" in proc.stdout
     assert "--news-provider" in proc.stdout
     assert "--refresh" in proc.stdout
     assert "--sample" in proc.stdout
@@ -106,6 +203,33 @@ def test_tools_market_research_topic_radar_sample_json_is_structured() -> None:
     assert {"polymarket", "hn", "github", "arxiv", "hf", "official", "news"} <= set(payload["sections"])
 
 
+def test_tools_market_research_topic_radar_sample_ndjson_streams_items_then_trailers() -> None:
+    skill_root = Path(__file__).resolve().parents[1]
+    script = skill_root / "scripts" / "topic-radar.sh"
+
+    proc = subprocess.run(
+        [str(script), "--sample", "--preset", "ai-news", "--format", "ndjson", "--limit", "3"],
+        text=True,
+        capture_output=True,
+    )
+
+    assert proc.returncode == 0
+    lines = proc.stdout.splitlines()
+    assert all(line.startswith("{") and "\n" not in line for line in lines)
+    records = [json.loads(line) for line in lines]
+    types = [record["type"] for record in records]
+    assert types[:3] == ["item", "item", "item"]
+    assert [record["rank"] for record in records[:3]] == [1, 2, 3]
+    assert "raw" in records[0]["item"]
+    assert types[-6:] == ["cache", "history", "delta", "timings", "window", "summary"]
+    assert types.index("brief") > types.index("section")
+    summary = records[-1]
+    assert summary["ok"] is True
+    assert summary["items"] == 3
+    assert summary["errors"] == types.count("error")
+    assert sum(summary["sections"].values()) == types.count("section")
+
+
 def test_tools_market_research_topic_radar_sample_markdown_has_sections() -> None:
     skill_root = Path(__file__).resolve().parents[1]
     script = skill_root / "scripts" / "topic-radar.sh"
@@ -309,3 +433,1063 @@ def test_tools_market_research_topic_radar_reads_polymarket_mcp_json(tmp_path: P
     assert payload["items"][0]["source"] == "polymarket"
     assert payload["items"][0]["sourceDetail"].startswith("polymarket-mcp")
     assert "MCP" in payload["items"][0]["reason"]
+
+
+def test_tools_market_research_topic_radar_transport_reuses_keep_alive_connections() -> None:
+    module = load_topic_radar_module()
+    routes: dict[str, Route] = {
+        "/feed": lambda handler: (200, {"Content-Type": "application/json"}, b'{"ok": true}'),
+        "/moved": lambda handler: (302, {"Location": "/feed"}, b""),
+        "/limited": lambda handler: (429, {"Content-Type": "text/plain"}, b"slow down"),
+    }
+    transport = module.HttpTransport()
+    with local_http_server(routes) as server:
+        for _ in range(3):
+            assert module.http_get(f"{server['base']}/feed", 5, transport=transport) == b'{"ok": true}'
+        assert module.http_get(f"{server['base']}/moved", 5, transport=transport) == b'{"ok": true}'
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            module.http_get(f"{server['base']}/limited", 5, transport=transport)
+        transport.close()
+
+    assert len(server["peers"]) == 1
+    assert transport.stats["connections"] == 1
+    assert transport.stats["reused"] == 5
+    record = module.http_error_record("hn", excinfo.value, f"{server['base']}/limited")
+    assert record["error"] == "http_error:429"
+    assert record["bodySnippet"] == "slow down"
+
+
+def test_tools_market_research_topic_radar_transport_keeps_cache_semantics(tmp_path: Path) -> None:
+    module = load_topic_radar_module()
+    routes: dict[str, Route] = {"/feed": lambda handler: (200, {}, b"payload")}
+    events: list[dict[str, Any]] = []
+    transport = module.HttpTransport()
+    with local_http_server(routes) as server:
+        for _ in range(2):
+            body = module.http_get(
+                f"{server['base']}/feed",
+                5,
+                cache_ttl_seconds=60,
+                cache_dir=tmp_path,
+                cache_events=events,
+                transport=transport,
+            )
+            assert body == b"payload"
+        transport.close()
+
+    assert [event["status"] for event in events] == ["miss", "write", "hit"]
+    assert len(server["requests"]) == 1
+
+
+def test_tools_market_research_topic_radar_decodes_gzip_and_compresses_cache(tmp_path: Path) -> None:
+    module = load_topic_radar_module()
+    payload = json.dumps({"hits": [{"title": "agent"}] * 200}).encode()
+
+    def feed(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+        assert "gzip" in handler.headers.get("Accept-Encoding", "")
+        return 200, {"Content-Encoding": "gzip"}, gzip.compress(payload)
+
+    transport = module.HttpTransport()
+    options: dict[str, Any] = {"cache_ttl_seconds": 60, "cache_dir": tmp_path, "transport": transport}
+    with local_http_server({"/feed": feed}) as server:
+        assert module.http_get(f"{server['base']}/feed", 5, **options) == payload
+        assert module.http_get(f"{server['base']}/feed", 5, **options) == payload
+        transport.close()
+
+    assert len(server["requests"]) == 1
+    assert transport.stats["wireBytes"] * 4 < transport.stats["bodyBytes"] == len(payload)
+    (body_path,) = tmp_path.glob("*.body")
+    stored = body_path.read_bytes()
+    assert stored.startswith(module.CACHE_BODY_MAGIC)
+    assert len(stored) * 4 < len(payload)
+
+    body_path.write_bytes(b"legacy raw body")
+    assert module.FileCacheStore(tmp_path).load(body_path.name.removesuffix(".body")).body == b"legacy raw body"
+
+
+def test_tools_market_research_topic_radar_scheduler_caps_hosts_and_keeps_order() -> None:
+    module = load_topic_radar_module()
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def slow(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        threading.Event().wait(0.05)
+        with lock:
+            active["now"] -= 1
+        return 200, {}, handler.path.encode("utf-8")
+
+    scheduler = module.RequestScheduler(4, host_limits={"127.0.0.1": 2})
+    transport = module.HttpTransport()
+    with local_http_server({"/slow": slow}) as server:
+        urls = [f"{server['base']}/slow?n={index}" for index in range(6)]
+        bodies = scheduler.map(
+            lambda url: module.http_get(url, 5, transport=transport, scheduler=scheduler),
+            urls,
+        )
+        transport.close()
+
+    assert bodies == [f"/slow?n={index}".encode("utf-8") for index in range(6)]
+    assert active["peak"] == 2
+
+
+def test_tools_market_research_topic_radar_revalidates_stale_cache_entries(tmp_path: Path) -> None:
+    module = load_topic_radar_module()
+
+    def feed(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+        if handler.headers.get("If-None-Match") == '"v1"':
+            return 304, {"ETag": '"v1"'}, b""
+        return 200, {"ETag": '"v1"', "Last-Modified": "Mon, 18 May 2026 00:00:00 GMT"}, b"<rss/>"
+
+    events: list[dict[str, Any]] = []
+    transport = module.HttpTransport()
+    with local_http_server({"/feed": feed}) as server:
+        url = f"{server['base']}/feed"
+        assert module.http_get(url, 5, cache_ttl_seconds=60, cache_dir=tmp_path, cache_events=events, transport=transport)
+        body_path = next(tmp_path.glob("*.body"))
+        stale_time = body_path.stat().st_mtime - 3600
+        os.utime(body_path, (stale_time, stale_time))
+        body = module.http_get(url, 5, cache_ttl_seconds=60, cache_dir=tmp_path, cache_events=events, transport=transport)
+        transport.close()
+
+    assert body == b"<rss/>"
+    assert [event["status"] for event in events] == ["miss", "write", "stale", "revalidated"]
+    assert server["requests"][1]["headers"]["If-None-Match"] == '"v1"'
+    assert server["requests"][1]["headers"]["If-Modified-Since"] == "Mon, 18 May 2026 00:00:00 GMT"
+    assert body_path.stat().st_mtime > stale_time + 1800
+    meta = json.loads(body_path.with_suffix(".meta.json").read_text(encoding="utf-8"))
+    assert meta["etag"] == '"v1"'
+
+
+def make_stale(cache_dir: Path, seconds: float = 3600) -> None:
+    for body_path in cache_dir.glob("*.body"):
+        stale_time = body_path.stat().st_mtime - seconds
+        os.utime(body_path, (stale_time, stale_time))
+
+
+def test_tools_market_research_topic_radar_serves_stale_on_upstream_error(tmp_path: Path) -> None:
+    module = load_topic_radar_module()
+    responses = iter([(200, {}, b"first"), (503, {}, b"unavailable")])
+    events: list[dict[str, Any]] = []
+    options: dict[str, Any] = {
+        "cache_ttl_seconds": 60,
+        "cache_dir": tmp_path,
+        "cache_events": events,
+        "cache_policy": "stale-if-error",
+        "stale_grace_seconds": 7200,
+    }
+    with local_http_server({"/feed": lambda handler: next(responses)}) as server:
+        url = f"{server['base']}/feed"
+        assert module.http_get(url, 5, **options) == b"first"
+        make_stale(tmp_path)
+        assert module.http_get(url, 5, **options) == b"first"
+
+    stale_event = events[-1]
+    assert stale_event["status"] == "stale-served"
+    assert stale_event["reason"] == "http_error:503"
+
+
+def test_tools_market_research_topic_radar_stale_while_revalidate_refreshes_in_background(tmp_path: Path) -> None:
+    module = load_topic_radar_module()
+    responses = iter([(200, {}, b"old"), (200, {}, b"new")])
+    background = module.BackgroundRefresher()
+    events: list[dict[str, Any]] = []
+    options: dict[str, Any] = {
+        "cache_ttl_seconds": 60,
+        "cache_dir": tmp_path,
+        "cache_events": events,
+        "cache_policy": "stale-while-revalidate",
+        "stale_grace_seconds": 7200,
+        "background": background,
+    }
+    with local_http_server({"/feed": lambda handler: next(responses)}) as server:
+        url = f"{server['base']}/feed"
+        assert module.http_get(url, 5, **options) == b"old"
+        make_stale(tmp_path)
+        assert module.http_get(url, 5, **options) == b"old"
+        background.drain()
+        assert module.http_get(url, 5, **options) == b"new"
+
+    assert [event["status"] for event in events] == ["miss", "write", "stale", "stale-served", "hit"]
+    assert events[3]["reason"] == "revalidating"
+
+
+def test_tools_market_research_topic_radar_prune_evicts_expired_then_least_recent(tmp_path: Path) -> None:
+    module = load_topic_radar_module()
+    now = 1_800_000_000.0
+    for name, fetched, accessed in (("old", now - 40 * 86400, now), ("cold", now - 3600, now - 3000), ("warm", now - 3600, now)):
+        body_path = tmp_path / f"{name}.body"
+        body_path.write_bytes(b"x" * 1000)
+        os.utime(body_path, (accessed, fetched))
+
+    result = module.prune_cache(module.FileCacheStore(tmp_path), max_bytes=1500, max_age_seconds=30 * 86400, now=now)
+
+    assert result == {"removed": 2, "freedBytes": 2000, "remainingBytes": 1000}
+    assert [path.name for path in tmp_path.glob("*.body")] == ["warm.body"]
+
+
+def test_tools_market_research_topic_radar_cache_subcommand_reports_stats(tmp_path: Path) -> None:
+    skill_root = Path(__file__).resolve().parents[1]
+    script = skill_root / "scripts" / "topic-radar.sh"
+    (tmp_path / "abc.body").write_bytes(b"payload")
+    (tmp_path / "abc.meta.json").write_text(json.dumps({"url": "https://hn.algolia.com/api/v1/search"}), encoding="utf-8")
+    (tmp_path / "stats.json").write_text(json.dumps({"events": {"hit": 3, "miss": 1}, "runs": 2}), encoding="utf-8")
+
+    proc = subprocess.run(
+        [str(script), "cache", "stats", "--cache-dir", str(tmp_path), "--format", "json"],
+        text=True,
+        capture_output=True,
+    )
+
+    assert proc.returncode == 0
+    payload = json.loads(proc.stdout)
+    assert payload["entries"] == 1
+    assert payload["hosts"]["hn.algolia.com"]["entries"] == 1
+    assert payload["hitRate"] == 0.75
+
+    proc = subprocess.run(
+        [str(script), "cache", "clear", "--cache-dir", str(tmp_path), "--format", "json"],
+        text=True,
+        capture_output=True,
+    )
+
+    assert proc.returncode == 0
+    assert json.loads(proc.stdout)["removed"] == 1
+    assert not list(tmp_path.iterdir())
+
+
+def test_tools_market_research_topic_radar_sqlite_cache_backend(tmp_path: Path) -> None:
+    module = load_topic_radar_module()
+
+    def feed(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+        if handler.headers.get("If-None-Match") == '"v2"':
+            return 304, {}, b""
+        return 200, {"ETag": '"v2"'}, b"atom"
+
+    store = module.SqliteCacheStore(tmp_path)
+    events: list[dict[str, Any]] = []
+    options: dict[str, Any] = {"cache_ttl_seconds": 60, "cache_store": store, "cache_events": events, "cache_source": "arxiv"}
+    with local_http_server({"/feed": feed, "/other": lambda handler: (200, {}, b"other")}) as server:
+        url = f"{server['base']}/feed"
+        results = module.RequestScheduler(4).map(lambda _: module.http_get(url, 5, **options), range(4))
+        store.update_stats(events)
+        assert module.http_get(url, 5, **options) == b"atom"
+        with store._connection() as conn:
+            conn.execute("UPDATE entries SET fetched_at = fetched_at - 3600")
+        assert module.http_get(url, 5, **options) == b"atom"
+        module.http_get(f"{server['base']}/other", 5, cache_ttl_seconds=60, cache_store=store)
+
+    assert results == [b"atom"] * 4
+    assert events[-1]["status"] == "revalidated"
+    assert store.location.name == "cache.sqlite3"
+    assert not list(tmp_path.glob("*.body"))
+    host_entries = store.entries(host="127.0.0.1")
+    assert len(host_entries) == 2
+    assert {entry.source for entry in host_entries} == {"arxiv", None}
+    stats = module.cache_stats(store, host="127.0.0.1")
+    assert stats["backend"] == "sqlite"
+    assert stats["runs"] == 1
+    assert {entry["url"].rsplit("/", 1)[-1] for entry in stats["hostEntries"]} == {"feed", "other"}
+    assert module.prune_cache(store, max_bytes=0, max_age_seconds=0, host="127.0.0.1")["removed"] == 2
+    assert store.entries() == []
+    store.close()
+
+
+def test_tools_market_research_topic_radar_history_fetches_only_missing_days(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    module = load_topic_radar_module()
+    calls: list[tuple[str, str]] = []
+
+    def fake_hn(args: Any, errors: list[dict[str, Any]]) -> list[Any]:
+        calls.append((args.window_start_dt.date().isoformat(), module.window_inclusive_end(args).isoformat()))
+        return [
+            module.RadarItem(
+                source="hn",
+                title=f"agent launch {day}",
+                url=f"https://example.com/{day}",
+                published_at=f"{day}T12:00:00Z",
+                engagement=5,
+            )
+            for day in module.window_days(args.window_start_dt, args.window_end_dt)
+        ]
+
+    def unexpected_hf(args: Any, errors: list[dict[str, Any]]) -> list[Any]:
+        raise AssertionError("hf should be answered from history")
+
+    monkeypatch.setattr(module, "fetch_hn", fake_hn)
+    monkeypatch.setattr(module, "fetch_hf", unexpected_hf)
+
+    def run(sources: str, date_to: str) -> tuple[Any, dict[str, list[Any]], list[dict[str, Any]]]:
+        argv = ["--sources", sources, "--from", "2026-01-01", "--to", date_to, "--no-cache", "--history"]
+        args = module.normalize_args([*argv, "--history-db", str(tmp_path / "history.sqlite3")])
+        try:
+            _, sections, errors = module.gather(args)
+        finally:
+            args.history_store.close()
+        return args, sections, errors
+
+    args, _, _ = run("hn", "2026-01-03")
+    store = module.ItemHistoryStore(tmp_path / "history.sqlite3")
+    hf_scope = module.history_scope(args, "hf")
+    hf_item = module.RadarItem(source="hf", title="org/agent-model", url="https://huggingface.co/org/agent-model", engagement=42)
+    store.record("hf", hf_scope, [hf_item], observed_at=datetime(2026, 1, 2, 9, tzinfo=UTC).timestamp())
+    store.mark_covered("hf", hf_scope, [date(2026, 1, 2)], args.limit)
+    store.close()
+
+    args, sections, errors = run("hn,hf", "2026-01-03")
+    assert len(sections["hn"]) == 3
+    assert args.history_report["hn"] == {"windowDays": 3, "coveredDays": 3, "fetchedDays": 0, "fromHistory": 3}
+    assert [item.engagement for item in sections["hf"]] == [42]
+    assert not errors
+
+    args, sections, _ = run("hn", "2026-01-05")
+    assert calls == [("2026-01-01", "2026-01-03"), ("2026-01-04", "2026-01-05")]
+    assert sorted(item.published_at[:10] for item in sections["hn"]) == [f"2026-01-0{day}" for day in range(1, 6)]
+    assert module.history_metadata(args)["sources"]["hn"]["coveredDays"] == 3
+
+
+def test_tools_market_research_topic_radar_history_migrates_published_ts(tmp_path: Path) -> None:
+    module = load_topic_radar_module()
+    path = tmp_path / "history.sqlite3"
+    legacy = sqlite3.connect(str(path))
+    with legacy:
+        for statement in module.ItemHistoryStore.SCHEMA[1:3]:
+            legacy.execute(statement)
+        legacy.execute(
+            "CREATE TABLE items (source TEXT NOT NULL, key TEXT NOT NULL, title TEXT NOT NULL, url TEXT NOT NULL, "
+            "published_at TEXT, summary TEXT, source_detail TEXT, reason TEXT NOT NULL, tags TEXT NOT NULL, "
+            "raw TEXT NOT NULL, first_seen REAL NOT NULL, last_seen REAL NOT NULL, PRIMARY KEY (source, key))"
+        )
+        for key, published_at in (("a", "Fri, 02 Jan 2026 10:00:00 GMT"), ("b", "2026-01-05T10:00:00Z")):
+            legacy.execute(
+                "INSERT INTO items VALUES ('news', ?, ?, '', ?, NULL, NULL, '', '[]', '{}', 1, 1)", (key, key, published_at)
+            )
+            legacy.execute("INSERT INTO snapshots VALUES ('news', ?, 'scope', '2026-01-06', 1, '', 1)", (key,))
+    legacy.close()
+
+    store = module.ItemHistoryStore(path)
+    try:
+        start, end = datetime(2026, 1, 1, tzinfo=UTC), datetime(2026, 1, 4, tzinfo=UTC)
+        assert [item.title for item in store.load("news", "scope", start=start, end=end)] == ["a"]
+        plan = store._connection().execute(
+            "EXPLAIN QUERY PLAN SELECT key FROM items WHERE source = 'news' AND published_ts >= 0 AND published_ts < 1"
+        ).fetchall()
+        assert any("items_published_ts" in row[-1] for row in plan)
+    finally:
+        store.close()
+
+
+def test_tools_market_research_topic_radar_items_carry_epoch_and_bench_reports(capsys: pytest.CaptureFixture[str]) -> None:
+    module = load_topic_radar_module()
+    item = module.RadarItem(source="news", title="t", url="", published_at="Mon, 12 Jan 2026 10:00:00 GMT")
+    assert item.published_ts == datetime(2026, 1, 12, 10, tzinfo=UTC).timestamp()
+    assert not hasattr(item, "__dict__")
+    item.set_published(None)
+    assert item.published_ts is None
+
+    assert module.main(["--sample", "--format", "json", "--no-raw", "--limit", "2"]) == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert all("raw" not in entry for entry in payload["items"])
+
+    assert module.main(["bench", "items", "--count", "300", "--format", "json"]) == 0
+    result = json.loads(capsys.readouterr().out)
+    assert result["count"] == 300
+    assert result["bytesPerItem"]["slottedNoRaw"] < result["bytesPerItem"]["legacy"]
+    assert set(result["cpu"]) == {"legacyMicrosPerItem", "preparsedMicrosPerItem"}
+
+
+def test_tools_market_research_topic_radar_ranking_scores_once_without_mutation() -> None:
+    module = load_topic_radar_module()
+    items = [
+        module.RadarItem(source="hn", title="Agent SDK", url="https://example.com/sdk", engagement=10, reason="hn"),
+        module.RadarItem(source="news", title="Agent SDK", url="https://www.example.com/sdk/", engagement=5, reason="news"),
+        module.RadarItem(source="hn", title="Agent SDK", url="https://example.com/sdk", engagement=1, reason="hn"),
+    ] + [
+        module.RadarItem(source="github", title=f"repo {index}", url=f"https://github.com/o/{index}", engagement=index)
+        for index in range(20)
+    ]
+    ranking = module.RadarRanking(items, ["agent"], 7)
+
+    for _ in range(2):
+        top = ranking.top(5)
+        assert top == ranking.ranked()[:5]
+        assert top[0].reason == "hn; seen across 2 sources"
+        assert top[0].engagement == 16
+    assert [item.engagement for item in ranking.section("hn", 5)] == [11]
+    assert ranking.section("news", 5)[0].cross_source_count == 1
+    assert [item.engagement for item in items[:3]] == [10, 5, 1]
+    assert [item.reason for item in items[:3]] == ["hn", "news", "hn"]
+    assert len(ranking.section("github", 3)) == 3
+
+
+def test_tools_market_research_topic_radar_near_duplicates_merge_across_sources() -> None:
+    module = load_topic_radar_module()
+    story = [
+        module.RadarItem(source="hn", title="Acme releases Falcon agent runtime for enterprise teams", url="https://news.ycombinator.com/item?id=1"),
+        module.RadarItem(source="news", title="Acme releases Falcon agent runtime for enterprise teams - The Verge", url="https://verge.example/a"),
+        module.RadarItem(source="official", title="Acme releases the Falcon agent runtime for enterprise", url="https://acme.example/blog/falcon"),
+        module.RadarItem(source="news", title="Acme reports quarterly enterprise revenue growth", url="https://other.example/b"),
+    ]
+    rng = random.Random(3)
+    words = [f"w{index}" for index in range(400)]
+    noise = [
+        module.RadarItem(source="github", title=" ".join(rng.sample(words, 6)), url=f"https://github.com/o/{index}")
+        for index in range(3000)
+    ]
+
+    started = time.perf_counter()
+    ranking = module.RadarRanking(story + noise, ["agent"], 7, near_dup=True)
+    merged = ranking.merged()
+    elapsed = time.perf_counter() - started
+
+    top = next(item for item in merged if item.source == "hn")
+    assert top.cross_source_count == 3
+    assert top.also_seen_in == ["news", "official"]
+    assert ranking.near_duplicate_merges == 2
+    assert any(item.url == "https://other.example/b" for item in merged)
+    assert len(module.RadarRanking(story, ["agent"], 7).merged()) == 4
+    assert elapsed < 2.0
+
+
+def test_tools_market_research_topic_radar_streams_feeds_and_stops_early() -> None:
+    module = load_topic_radar_module()
+    entry = "<entry><title>Paper {index}</title><published>2026-01-02T00:00:00Z</published><summary>{pad}</summary></entry>"
+    feed = (
+        '<feed xmlns="http://www.w3.org/2005/Atom">'
+        + "".join(entry.format(index=index, pad="x" * 400) for index in range(3000))
+        + "</feed>"
+    ).encode()
+    routes: dict[str, Route] = {
+        "/plain": lambda handler: (200, {}, feed),
+        "/gzip": lambda handler: (200, {"Content-Encoding": "gzip"}, gzip.compress(feed)),
+        "/broken": lambda handler: (200, {}, feed[:5000]),
+    }
+    atom_entry = "{http://www.w3.org/2005/Atom}entry"
+    transport = module.HttpTransport()
+    with local_http_server(routes) as server:
+        with transport.stream(f"{server['base']}/plain", {}, 5) as chunks:
+            titles = []
+            for element in module.iter_xml_elements(chunks, (atom_entry,)):
+                titles.append(module.feed_entry(element)["title"])
+                if len(titles) == 5:
+                    break
+        assert titles == [f"Paper {index}" for index in range(5)]
+        assert transport.stats["wireBytes"] < len(feed) // 4
+
+        with transport.stream(f"{server['base']}/gzip", {}, 5) as chunks:
+            assert sum(1 for _ in module.iter_xml_elements(chunks, module.FEED_ENTRY_TAGS)) == 3000
+
+        partial: list[str] = []
+        with pytest.raises(module.ET.ParseError), transport.stream(f"{server['base']}/broken", {}, 5) as chunks:
+            for element in module.iter_xml_elements(chunks, (atom_entry,)):
+                partial.append(module.feed_entry(element)["title"])
+        transport.close()
+
+    assert partial and partial[0] == "Paper 0"
+    assert transport.stats["connections"] == 2
+
+
+def test_tools_market_research_topic_radar_arxiv_backfill_pages_days_and_stops_early(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    module = load_topic_radar_module()
+    requests: list[dict[str, Any]] = []
+
+    @contextmanager
+    def fake_stream(url: str, args: Any, **options: Any) -> Iterator[Iterator[bytes]]:
+        params = dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(url).query))
+        day = re.search(r"submittedDate:\[(\d{8})", params["search_query"]).group(1)
+        start = int(params["start"])
+        requests.append({"day": day, "start": start, **options})
+        count = module.ARXIV_PAGE_SIZE if (day == "20260131" and start == 0) else 3
+        entries = "".join(
+            f"<entry><title>AI agent paper {day} {start + index}</title>"
+            f"<id>http://arxiv.org/abs/{day}.{start + index}</id>"
+            f"<published>{day[:4]}-{day[4:6]}-{day[6:]}T12:00:00Z</published></entry>"
+            for index in range(count)
+        )
+        yield iter([f'<feed xmlns="http://www.w3.org/2005/Atom">{entries}</feed>'.encode()])
+
+    monkeypatch.setattr(module, "open_body_stream", fake_stream)
+    # Topics the papers never match must not keep the walk going (the bound uses matches actually seen).
+    topics = ["--topic", "ai agent", "--topic", "humanoid robotics", "--topic", "semiconductor packaging"]
+    args = module.normalize_args(["--sources", "arxiv", "--month", "2026-01", *topics, "--limit", "20", "--jobs", "2"])
+    args.scheduler = module.RequestScheduler(args.jobs, host_intervals={})
+    errors: list[dict[str, Any]] = []
+    items = module.fetch_arxiv(args, errors)
+
+    assert not errors
+    assert len(items) == 20
+    assert sorted(((request["day"], request["start"]) for request in requests), reverse=True) == [
+        ("20260131", module.ARXIV_PAGE_SIZE),
+        ("20260131", 0),
+        ("20260130", 0),
+    ]
+    assert all(request["window_scoped"] is False for request in requests)
+    assert args.arxiv_backfill["stoppedEarly"] is True
+    assert args.arxiv_backfill["fetchedDays"] == 2
+    assert items == sorted(items, key=lambda item: item.score, reverse=True)
+    assert module.window_metadata(args)["arxivBackfill"]["pages"] == 3
+
+    scheduler = module.RequestScheduler(4, host_intervals={"example.com": 0.05})
+
+    def paced_start(_: int) -> float:
+        with scheduler.slot("https://example.com/query"):
+            return time.monotonic()
+
+    starts = sorted(scheduler.map(paced_start, range(3)))
+    assert all(later - earlier >= 0.04 for earlier, later in zip(starts, starts[1:], strict=False))
+
+    # A paced host waits outside the global `--jobs` budget, so other hosts keep going.
+    single = module.RequestScheduler(1, host_intervals={"example.com": 0.5})
+    with single.slot("https://example.com/first"):
+        pass
+
+    def paced_second() -> None:
+        with single.slot("https://example.com/second"):
+            pass
+
+    waiter = threading.Thread(target=paced_second)
+    waiter.start()
+    time.sleep(0.05)
+    started = time.monotonic()
+    with single.slot("https://other.example/query"):
+        assert time.monotonic() - started < 0.2
+    waiter.join()
+
+    rescored: list[Any] = []
+    monkeypatch.setattr(module, "compute_score", lambda item, *rest: rescored.append(item) or item)
+    module.RadarRanking(items, args.topics, args.days, args.window_reference_dt)
+    assert rescored == []
+
+
+def test_tools_market_research_topic_radar_serve_answers_from_memory_and_refreshes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    module = load_topic_radar_module()
+    fetches: list[str] = []
+    original_sample_items = module.sample_items
+
+    def counting_sample_items() -> list[Any]:
+        fetches.append("sample")
+        return original_sample_items()
+
+    monkeypatch.setattr(module, "sample_items", counting_sample_items)
+    base_argv = ["--format", "json", "--sample", "--jobs", "4"]
+    base = module.normalize_args(base_argv)
+    refresh = {source: 600.0 for source in module.SERVE_REFRESH_MINUTES}
+    radar = module.RadarServer(base, base_argv, refresh_seconds=refresh)
+    httpd = module.ThreadingHTTPServer(("127.0.0.1", 0), module.build_serve_handler(radar))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{httpd.server_address[1]}"
+
+    def get(path: str) -> tuple[int, str]:
+        try:
+            with urllib.request.urlopen(f"{base_url}{path}", timeout=5) as response:
+                return response.status, response.read().decode()
+        except urllib.error.HTTPError as exc:
+            return exc.code, exc.read().decode()
+
+    try:
+        status, body = get("/radar?preset=ai-news&format=json&limit=3")
+        assert status == 200
+        payload = json.loads(body)
+        assert len(payload["items"]) == 3
+        assert set(payload["dataAge"]) == {"official", "news", "hn"}
+        cold_fetches = len(fetches)
+        assert cold_fetches == 3
+
+        started = time.perf_counter()
+        status, body = get("/radar?preset=ai-news&format=markdown&limit=2&brief=0")
+        assert status == 200
+        assert time.perf_counter() - started < 0.5
+        assert "- Data age: official" in body
+        assert len(fetches) == cold_fetches
+
+        assert get("/radar?profile=missing")[0] == 400
+        assert get("/radar?bogus=1")[0] == 400
+        assert radar.refresh_due() == 0
+        assert radar.refresh_due(now=time.time() + 601) == 3
+        radar.close()
+        assert len(fetches) == cold_fetches + 3
+        health = json.loads(get("/healthz")[1])
+        assert health["snapshots"] == 3
+        assert sorted(entry["source"] for entry in health["dataAge"]) == ["hn", "news", "official"]
+
+        assert get("/radar?preset=ai-news&format=json&limit=3&topic=rust")[0] == 200
+        health = json.loads(get("/healthz")[1])
+        assert health["snapshots"] == len(health["dataAge"]) == 6
+        assert radar.refresh_due(now=time.time() + module.SERVE_IDLE_SECONDS + 1) == 0
+        assert not radar.snapshots
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        radar.close()
+        module.close_run_state(base)
+
+
+def test_tools_market_research_topic_radar_since_last_run_emits_only_new_items(tmp_path: Path) -> None:
+    module = load_topic_radar_module()
+    state_file = tmp_path / "delivered.bin"
+    fixtures = module.BenchFixtures(20, module.now_utc())
+
+    def run() -> tuple[Any, list[Any], dict[str, Any]]:
+        args = module.normalize_args(
+            ["--sources", "hn", "--no-cache", "--no-history", "--limit", "3", "--state-file", str(state_file)]
+        )
+        try:
+            with module.replay_server(fixtures.routes(), 0) as overrides:
+                args.transport.host_overrides = overrides
+                ranked, sections, _ = module.gather(args)
+        finally:
+            module.close_run_state(args)
+        report = module.delta_metadata(args)
+        args.delta_state.save([*(item for items in sections.values() for item in items), *ranked])
+        return args, ranked, report
+
+    sample = module.normalize_args(["--sample", "--since-last-run", "--state-file", str(state_file)])
+    module.close_run_state(sample)
+    assert sample.delta_state is None and not state_file.exists()
+
+    args, first, report = run()
+    assert args.since_last_run is True
+    assert len(first) == 3
+    assert report["known"] == 0
+    # Only rendered items count as new: the top 3, which here are also the hn section.
+    assert report["new"] == 3
+
+    _, second, report = run()
+    first_keys = {module.canonical_key(item) for item in first}
+    assert first_keys.isdisjoint(module.canonical_key(item) for item in second)
+    assert report["suppressed"] >= 3
+
+    state = module.DeltaState(state_file)
+    assert len(state.entries) == report["known"] + report["new"]
+    rescored = module.RadarItem(source="hn", title=first[0].title, url=first[0].url)
+    # Stored scores are float32, so clear the gain by a margin above its rounding.
+    rescored.score = first[0].score + module.DELTA_SCORE_GAIN + 0.01
+    assert state.accepts(rescored)
+    state.save([rescored])
+    assert (state.base_count, state.tail_count) == (len(state.entries), 1)
+    assert state_file.stat().st_size == module.DELTA_HEADER.size + module.DELTA_RECORD.size * (len(state.entries) + 1)
+    reloaded = module.DeltaState(state_file)
+    assert not reloaded.accepts(rescored)
+    assert reloaded.entries[reloaded.key_hash(rescored)][0] == pytest.approx(rescored.score)
+
+    today = int(time.time() // 86400)
+    state.compact(today=today + module.DELTA_RETENTION_DAYS + 1)
+    assert state.entries == {}
+    assert module.DeltaState(state_file).base_count == 0
+
+
+def test_tools_market_research_topic_radar_timings_cover_requests_parse_and_trace(tmp_path: Path) -> None:
+    module = load_topic_radar_module()
+    entries = "".join(
+        f"<entry><title>Agent paper {index}</title><published>2026-01-02T00:00:00Z</published></entry>"
+        for index in range(20)
+    )
+    feed = f'<feed xmlns="http://www.w3.org/2005/Atom">{entries}</feed>'.encode()
+    routes: dict[str, Route] = {
+        "/feed": lambda handler: (200, {}, feed),
+        "/search": lambda handler: (200, {"Content-Type": "application/json"}, b'{"hits": [1, 2]}'),
+    }
+    trace_path = tmp_path / "trace.json"
+    args = module.normalize_args(["--no-cache", "--timings", "--profile-run", str(trace_path)])
+    errors: list[dict[str, Any]] = []
+    try:
+        with local_http_server(routes) as server:
+            with module.timing_scope(args.timings, "hn"):
+                assert module.get_json(f"{server['base']}/search", 5, errors, "hn", args) == {"hits": [1, 2]}
+            with module.timing_scope(args.timings, "arxiv"):
+                with module.open_body_stream(f"{server['base']}/feed", args) as chunks:
+                    elements = module.iter_xml_elements(chunks, ("{http://www.w3.org/2005/Atom}entry",))
+                    titles = [module.feed_entry(element)["title"] for element in elements]
+        items = [module.RadarItem(source="arxiv", title=title, url=f"https://arxiv.org/abs/{title}") for title in titles]
+        module.RadarRanking(items, args.topics, args.days, timings=args.timings)
+    finally:
+        module.close_run_state(args)
+
+    assert not errors and len(titles) == 20
+    report = args.timings.metadata()
+    hn, arxiv = report["sources"]["hn"], report["sources"]["arxiv"]
+    assert hn["requests"] == 1 and hn["cache"] == {"off": 1}
+    assert arxiv["cache"] == {"stream": 1} and arxiv["bodyBytes"] == len(feed)
+    assert {"fetchMs", "parseMs"} <= set(hn) and {"parseMs", "scoreMs"} <= set(arxiv)
+    request = next(record for record in report["requests"] if record["source"] == "hn")
+    assert request["status"] == 200 and request["reused"] is False
+    assert {"dnsMs", "connectMs", "ttfbMs", "totalMs"} <= set(request)
+
+    args.timings_footer = True
+    footer = module.render_timings_markdown(args)
+    assert footer[0] == "## Timings" and any(line.startswith("- `arxiv`:") for line in footer)
+
+    args.timings.write_trace(trace_path)
+    trace = json.loads(trace_path.read_text(encoding="utf-8"))
+    names = {event["name"] for event in trace["traceEvents"]}
+    assert {"fetch hn", "fetch arxiv", "parse xml", "parse json", "dns", "connect", "ttfb", "thread_name"} <= names
+    assert all(event["ph"] in {"X", "M"} for event in trace["traceEvents"])
+
+
+def test_tools_market_research_topic_radar_pipeline_bench_replays_every_source(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    module = load_topic_radar_module()
+    transport = module.HttpTransport(host_overrides={"api.github.com": "http://127.0.0.1:9"})
+    assert transport.route("https://api.github.com/search/repositories?q=x") == (
+        "http://127.0.0.1:9/api.github.com/search/repositories?q=x"
+    )
+    assert transport.route("https://hn.algolia.com/api") == "https://hn.algolia.com/api"
+
+    argv = ["bench", "pipeline", "--counts", "40", "--latency-ms", "0", "--repeat", "1", "--format", "json"]
+    assert module.main(argv) == 0
+    result = json.loads(capsys.readouterr().out)
+    assert result["suite"] == "pipeline" and result["counts"] == [40]
+    run = result["runs"][0]
+    assert set(run["stages"]) == set(module.BENCH_STAGES)
+    for stage, entry in run["stages"].items():
+        assert entry["errors"] == 0, stage
+        assert entry["records"] >= 40 and entry["items"] > 0 and entry["requests"] > 0, stage
+    assert run["endToEnd"]["errors"] == 0 and run["endToEnd"]["ranked"] > 0
+    assert module.main(["bench", "pipeline", "--counts", "0"]) == 2
+
+
+def test_tools_market_research_topic_radar_record_then_replay_reproduces_ranking(tmp_path: Path) -> None:
+    module = load_topic_radar_module()
+    archive = tmp_path / "recording"
+    fixtures = module.BenchFixtures(30, module.now_utc())
+    argv = ["--sources", "hn,github,news", "--news-provider", "google", "--format", "json", "--limit", "10"]
+
+    recorder = module.normalize_args([*argv, "--record", str(archive)])
+    try:
+        assert recorder.cache_ttl_seconds == 0 and recorder.history_store is None
+        with module.replay_server(fixtures.routes(), 0) as overrides:
+            recorder.transport.host_overrides = overrides
+            recorded = json.loads(module.render_json(recorder, *module.gather(recorder)))
+    finally:
+        module.close_run_state(recorder)
+    manifest = json.loads((archive / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["exchanges"] == recorded["recording"]["exchanges"] > 0
+
+    time.sleep(1.1)
+    replayer = module.normalize_args([*argv, "--replay", str(archive)])
+    try:
+        assert module.now_utc() == module.parse_iso_datetime(manifest["recordedAt"])
+        replayed = json.loads(module.render_json(replayer, *module.gather(replayer)))
+        with pytest.raises(urllib.error.URLError, match="replay_miss"):
+            replayer.transport.request("https://example.com/unrecorded", {}, 5)
+    finally:
+        module.close_run_state(replayer)
+
+    assert not replayed["errors"] and replayed["generatedAt"] == recorded["generatedAt"]
+    assert replayed["window"] == recorded["window"]
+    assert [(item["url"], item["score"]) for item in replayed["items"]] == [
+        (item["url"], item["score"]) for item in recorded["items"]
+    ]
+    assert replayed["recording"]["mode"] == "replay" and replayed["recording"]["misses"] == 0
+    assert module.now_utc() != module.parse_iso_datetime(manifest["recordedAt"])
+    assert module.main(["--replay", str(tmp_path / "missing")]) == 2
+
+
+def test_tools_market_research_topic_radar_deadline_returns_partial_results(tmp_path: Path) -> None:
+    module = load_topic_radar_module()
+    fixtures = module.BenchFixtures(20, module.now_utc())
+    slow_hosts = {"api.github.com"}
+
+    def replay(host: str, content_type: str, body: bytes) -> Route:
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            if host in slow_hosts:
+                time.sleep(4)
+            return 200, {"Content-Type": content_type}, body
+
+        return respond
+
+    routes = {f"/{host}{path}": replay(host, *entry) for (host, path), entry in fixtures.routes().items()}
+    args = module.normalize_args(["--sources", "hn,github", "--no-cache", "--format", "json", "--deadline", "1.5"])
+    try:
+        with local_http_server(routes) as server:
+            args.transport.host_overrides = {host: server["base"] for host, _ in fixtures.routes()}
+            started = time.monotonic()
+            ranked, sections, errors = module.gather(args)
+            elapsed = time.monotonic() - started
+            payload = json.loads(module.render_json(args, ranked, sections, errors))
+    finally:
+        module.close_run_state(args)
+
+    assert elapsed < 3
+    assert sections["hn"] and not sections["github"]
+    assert [error for error in errors if error["source"] == "github"] == [
+        {"source": "github", "error": "deadline_exceeded", "deadlineSeconds": 1.5, "requests": 4, "incomplete": False}
+    ]
+    assert payload["deadline"] == {"seconds": 1.5, "exceeded": True, "sources": ["github"], "unfinished": []}
+    assert module.main(["--sample", "--deadline", "0"]) == 2
+
+    # Stragglers run on daemon threads and are barred from writing shared state once abandoned.
+    stuck = threading.Event()
+    daemon: dict[str, bool] = {}
+
+    def fetch_source(source: str) -> tuple[list[Any], list[dict[str, Any]]]:
+        daemon[source] = threading.current_thread().daemon
+        if source == "github":
+            stuck.wait(5)
+        return [], []
+
+    args = module.normalize_args(["--sample", "--sources", "hn,github", "--format", "json"])
+    try:
+        args.run_deadline = module.RunDeadline(0.2)
+        _, unfinished = module.fetch_until_deadline(args, fetch_source)
+        assert unfinished == ["github"] and daemon == {"hn": True, "github": True}
+        with pytest.raises(module.DeadlineExceeded):
+            args.run_deadline.check_live()
+    finally:
+        stuck.set()
+        module.close_run_state(args)
+
+    spec = tmp_path / "spec.json"
+    spec.write_text(json.dumps([{"output": str(tmp_path / "out.json")}]), encoding="utf-8")
+    assert module.main(["batch", "--spec", str(spec), "--sample", "--deadline", "5"]) == 2
+    assert module.main(["serve", "--sample", "--deadline", "5"]) == 2
+
+
+def test_tools_market_research_topic_radar_auto_news_races_gdelt_and_google() -> None:
+    module = load_topic_radar_module()
+    fixtures = module.BenchFixtures(20, module.now_utc())
+    gdelt = {"delay": 0.0, "status": 200}
+
+    def replay(host: str, content_type: str, body: bytes) -> Route:
+        def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+            if host == "api.gdeltproject.org":
+                time.sleep(gdelt["delay"])
+                return gdelt["status"], {"Content-Type": content_type}, body if gdelt["status"] == 200 else b"busy"
+            return 200, {"Content-Type": content_type}, body
+
+        return respond
+
+    routes = {f"/{host}{path}": replay(host, *entry) for (host, path), entry in fixtures.routes().items()}
+
+    def run_news(delay: float, status: int) -> tuple[list[Any], list[dict[str, Any]], dict[str, Any], float]:
+        gdelt.update(delay=delay, status=status)
+        args = module.normalize_args(["--sources", "news", "--news-provider", "auto", "--news-hedge-ms", "200", "--no-cache"])
+        errors: list[dict[str, Any]] = []
+        try:
+            with local_http_server(routes) as server:
+                args.transport.host_overrides = {host: server["base"] for host, _ in fixtures.routes()}
+                started = time.monotonic()
+                items = module.fetch_news(args, errors)
+                elapsed = time.monotonic() - started
+        finally:
+            module.close_run_state(args)
+        return items, errors, args.news_race, elapsed
+
+    items, errors, race, _ = run_news(0.0, 200)
+    assert race["winner"] == "gdelt" and race["providers"]["google"] == {"outcome": "not-started"}
+    assert items and all(item.source_detail == "GDELT DOC API" for item in items) and not errors
+
+    items, errors, race, elapsed = run_news(3.0, 200)
+    assert race["winner"] == "google" and race["providers"]["gdelt"]["outcome"] == "cancelled"
+    assert elapsed < 1.5 and not errors
+    assert items and all(item.reason.startswith("GDELT slower;") for item in items)
+
+    items, errors, race, _ = run_news(0.0, 503)
+    assert race["winner"] == "google" and race["providers"]["gdelt"]["outcome"] == "failed"
+    assert [error["error"] for error in errors] == ["http_error:503"]
+    assert items and items[0].reason.startswith("GDELT unavailable;")
+
+
+def test_tools_market_research_topic_radar_rate_limiter_retries_and_shares_quota(tmp_path: Path) -> None:
+    module = load_topic_radar_module()
+    state_path = tmp_path / "ratelimit.json"
+    calls = {"count": 0}
+
+    def throttled_once(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+        calls["count"] += 1
+        if calls["count"] == 1:
+            return 429, {"Retry-After": "1"}, b"slow down"
+        return 200, {"Content-Type": "application/json", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"}, b"{}"
+
+    args = module.normalize_args(["--no-cache"])
+    args.rate_limiter = module.RateLimiter(state_path)
+    args.transport.rate_limiter = args.rate_limiter
+    errors: list[dict[str, Any]] = []
+    try:
+        with local_http_server({"/search": throttled_once}) as server:
+            started = time.monotonic()
+            assert module.get_json(f"{server['base']}/search", 5, errors, "github", args) == {}
+            assert 1.0 <= time.monotonic() - started < 3
+    finally:
+        module.close_run_state(args)
+    assert not errors and calls["count"] == 2
+    report = args.rate_limiter.metadata()["127.0.0.1"]
+    assert report["throttled"] == 1 and report["retries"] == 1 and report["waits"] >= 1 and report["remaining"] == 0
+
+    # Another process sees the exhausted quota and refuses to wait past its deadline.
+    other = module.RateLimiter(state_path)
+    assert json.loads(state_path.read_text(encoding="utf-8"))["127.0.0.1"]["blockedUntil"] > time.time() + 20
+    with pytest.raises(module.RateLimited) as excinfo:
+        other.acquire("127.0.0.1", module.RunDeadline(2))
+    assert excinfo.value.retry_after > 20
+
+    bucket = module.RateLimiter(tmp_path / "bucket.json", buckets={"api.github.com": (2, 60.0)})
+    bucket.acquire("api.github.com")
+    bucket.acquire("api.github.com")
+    with pytest.raises(module.RateLimited):
+        bucket.acquire("api.github.com", module.RunDeadline(1))
+    assert bucket.metadata()["api.github.com"]["rejected"] == 1
+
+
+def test_tools_market_research_topic_radar_coalesces_identical_in_flight_requests(tmp_path: Path) -> None:
+    module = load_topic_radar_module()
+    fcntl = pytest.importorskip("fcntl")
+    hits: dict[str, int] = {"/feed": 0, "/shared": 0}
+
+    def slow(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+        hits[handler.path] += 1
+        time.sleep(0.3)
+        return 200, {"Content-Type": "application/rss+xml"}, b"<rss/>"
+
+    events: list[dict[str, Any]] = []
+    transport = module.HttpTransport()
+    with local_http_server({"/feed": slow, "/shared": slow}) as server:
+
+        def get(path: str) -> bytes:
+            url = f"{server['base']}{path}"
+            return module.http_get(url, 5, cache_ttl_seconds=60, cache_dir=tmp_path, cache_events=events, transport=transport)
+
+        threads = [threading.Thread(target=get, args=("/feed",)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Another process is filling `/shared`: it holds the entry's lock file and writes the cache.
+        url = f"{server['base']}/shared"
+        key = module.cache_key(url, {"User-Agent": module.USER_AGENT})
+        lock_path = tmp_path / module.CACHE_LOCK_DIR / f"{key}.lock"
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(lock_path, "a+b") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+
+            def leader_finishes() -> None:
+                time.sleep(0.3)
+                module.FileCacheStore(tmp_path).store(key, url, b"<rss>leader</rss>", {})
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+            leader = threading.Thread(target=leader_finishes)
+            leader.start()
+            body = get("/shared")
+            leader.join()
+        transport.close()
+
+    assert hits == {"/feed": 1, "/shared": 0}
+    assert body == b"<rss>leader</rss>"
+    statuses = [event["status"] for event in events]
+    assert statuses.count("coalesced") == 4
+    assert statuses.count("write") == 1
+    assert module.cache_hit_rate({"miss": 5, "coalesced": 4}) == 0.8
+
+    # Pruning old lock files skips the ones another process still holds.
+    held, idle = tmp_path / module.CACHE_LOCK_DIR / "held.lock", tmp_path / module.CACHE_LOCK_DIR / "idle.lock"
+    for path in (held, idle):
+        path.touch()
+        os.utime(path, (time.time() - 7200, time.time() - 7200))
+    with open(held, "a+b") as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        module.prune_cache_locks(tmp_path)
+    assert held.exists() and not idle.exists()
+
+
+def test_tools_market_research_topic_radar_batch_shares_one_fetch_pass(tmp_path: Path) -> None:
+    module = load_topic_radar_module()
+    fixtures = module.BenchFixtures(20, module.now_utc())
+
+    def replay(content_type: str, body: bytes) -> Route:
+        return lambda handler: (200, {"Content-Type": content_type}, body)
+
+    routes = {f"/{host}{path}": replay(*entry) for (host, path), entry in fixtures.routes().items()}
+    spec = tmp_path / "spec.json"
+    spec.write_text(
+        json.dumps(
+            [
+                {"output": str(tmp_path / "daily.json"), "report": "daily", "format": "json", "limit": 5},
+                {"output": str(tmp_path / "daily-brief.json"), "report": "daily", "format": "json", "brief": True},
+                {"output": str(tmp_path / "weekly.md"), "report": "weekly", "format": "markdown"},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    base_argv = ["--sources", "official,hf", "--no-cache", "--no-history"]
+    base = module.normalize_args(base_argv)
+    try:
+        with local_http_server(routes) as server:
+            base.transport.host_overrides = {host: server["base"] for host, _ in fixtures.routes()}
+            summary = module.run_batch(base, base_argv, module.load_batch_spec(spec))
+    finally:
+        module.close_run_state(base)
+
+    paths = [request["path"] for request in server["requests"]]
+    assert paths and len(paths) == len(set(paths))
+    assert summary["sourceFetches"] == 4 and summary["sharedRequests"] > 0
+    assert [report["output"] for report in summary["reports"]] == [
+        str(tmp_path / name) for name in ("daily.json", "daily-brief.json", "weekly.md")
+    ]
+    daily = json.loads((tmp_path / "daily.json").read_text(encoding="utf-8"))
+    assert daily["window"]["label"] == "last 1 day(s)" and len(daily["items"]) <= 5
+    assert "brief" in json.loads((tmp_path / "daily-brief.json").read_text(encoding="utf-8"))
+    assert (tmp_path / "weekly.md").read_text(encoding="utf-8").startswith("# ")
+    umask = os.umask(0o022)
+    os.umask(umask)
+    assert (tmp_path / "daily.json").stat().st_mode & 0o777 == 0o666 & ~umask
+
+    spec.write_text(json.dumps([{"output": "x.json", "color": "red"}]), encoding="utf-8")
+    assert module.main(["batch", "--spec", str(spec)]) == 2
+
+
+def test_tools_market_research_topic_radar_near_duplicates_keep_distinct_same_source_items() -> None:
+    module = load_topic_radar_module()
+    papers = [
+        module.RadarItem(source="arxiv", title="LLM agents for code review", url="https://arxiv.org/abs/2601.00001"),
+        module.RadarItem(source="arxiv", title="LLM agents for code generation", url="https://arxiv.org/abs/2601.00002"),
+        module.RadarItem(source="arxiv", title="LLM agents for code review", url="https://arxiv.org/abs/2601.00003"),
+    ]
+    ranking = module.RadarRanking(papers, ["agents"], 7, near_dup=True)
+
+    assert sorted(item.url for item in ranking.merged()) == sorted(paper.url for paper in papers)
+    assert ranking.near_duplicate_merges == 0
+
+    summary = "Acme shipped Falcon, an open agent runtime with sandboxed tools, tracing, and enterprise SSO support."
+    launch = module.RadarItem(source="news", title="Acme unveils Falcon runtime", url="https://news.example/falcon", summary=summary)
+    post = module.RadarItem(
+        source="official", title="Introducing Falcon by Acme", url="https://acme.example/blog/falcon", summary=summary
+    )
+    assert module.cluster_near_duplicates([launch, post]) == [0, 0]
+    assert module.cluster_near_duplicates([launch, module.RadarItem(source="news", title=post.title, url=post.url, summary=summary)]) == [0, 1]
+
+
+def test_tools_market_research_topic_radar_serve_snapshot_is_complete_before_ready(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    module = load_topic_radar_module()
+
+    def failing_fetch(source: str, args: Any) -> tuple[list[Any], list[dict[str, Any]]]:
+        time.sleep(0.2)
+        raise RuntimeError("upstream parser crashed")
+
+    monkeypatch.setattr(module, "fetch_source_items", failing_fetch)
+    base_argv = ["--format", "json", "--sample", "--sources", "hn"]
+    base = module.normalize_args(base_argv)
+    radar = module.RadarServer(base, base_argv, refresh_seconds={source: 600.0 for source in module.SERVE_REFRESH_MINUTES})
+    try:
+        with module.ThreadPoolExecutor(max_workers=2) as executor:
+            responses = list(executor.map(lambda _: radar.query({"limit": ["3"]}), range(2)))
+    finally:
+        radar.close()
+        module.close_run_state(base)
+
+    for status, _, body in responses:
+        payload = json.loads(body)
+        assert status == 200 and payload["items"] == []
+        assert payload["errors"] == [{"source": "hn", "error": "unexpected_error:RuntimeError:upstream parser crashed"}]
+        assert payload["dataAge"]["hn"]["ageSeconds"] < 60